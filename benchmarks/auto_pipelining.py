@@ -0,0 +1,50 @@
+"""Concurrent callers throughput with and without auto pipelining.
+
+Needs a redis server on localhost.
+
+Usage: python benchmarks/auto_pipelining.py [callers...] [rounds]
+"""
+import asyncio
+import sys
+import time
+from typing import Sequence
+
+from dbdaora import make_aioredis_data_source
+
+
+async def main(callers_sizes: Sequence[int], rounds: int) -> None:
+    for auto_pipelining in (False, True):
+        memory_data_source = await make_aioredis_data_source(
+            'redis://', auto_pipelining=auto_pipelining
+        )
+
+        for callers in callers_sizes:
+            keys = [f'benchmark:auto_pipelining:{i}' for i in range(callers)]
+            await asyncio.gather(
+                *(memory_data_source.set(k, 'x' * 64) for k in keys)
+            )
+            start = time.perf_counter()
+
+            for _ in range(rounds):
+                await asyncio.gather(
+                    *(memory_data_source.get(k) for k in keys)
+                )
+
+            elapsed = time.perf_counter() - start
+            print(
+                f'auto_pipelining={auto_pipelining} callers={callers}: '
+                f'{callers * rounds / elapsed:.0f} ops/s'
+            )
+            await asyncio.gather(*(memory_data_source.delete(k) for k in keys))
+
+        memory_data_source.close()
+        await memory_data_source.wait_closed()
+
+
+if __name__ == '__main__':
+    asyncio.run(
+        main(
+            [int(arg) for arg in sys.argv[1:-1]] or [1000, 10000],
+            int(sys.argv[-1]) if len(sys.argv) > 1 else 10,
+        )
+    )
@@ -0,0 +1,59 @@
+"""Memory payload sizes and codec cost of the compression algorithms.
+
+Usage: python benchmarks/compression.py [values] [value_size]
+"""
+import sys
+import time
+
+import orjson
+
+from dbdaora import Compression
+from dbdaora.compression import lz4_frame, zstandard
+
+
+def main(values_size: int, value_size: int) -> None:
+    values = [
+        orjson.dumps(
+            [
+                {'id': f'item{n}-{i}', 'text': f'description {i} of {n}'}
+                for i in range(value_size // 48)
+            ]
+        )
+        for n in range(values_size)
+    ]
+    raw_size = sum(map(len, values))
+    algorithms = ['zlib']
+
+    if lz4_frame is not None:
+        algorithms.append('lz4')
+
+    if zstandard is not None:
+        algorithms.append('zstd')
+
+    print(f'raw: {raw_size / values_size:.0f} bytes per value')
+
+    for algorithm in algorithms:
+        compression = Compression(algorithm=algorithm)
+        start = time.perf_counter()
+        encoded = [compression.encode(value) for value in values]
+        encode_elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+
+        for value in encoded:
+            compression.decode(value)
+
+        decode_elapsed = time.perf_counter() - start
+        size = sum(map(len, encoded))
+        print(
+            f'{algorithm}: {size / values_size:.0f} bytes per value '
+            f'({size / raw_size:.1%}), '
+            f'encode {encode_elapsed / values_size * 1_000_000:.1f}us, '
+            f'decode {decode_elapsed / values_size * 1_000_000:.1f}us'
+        )
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 64 * 1024,
+    )
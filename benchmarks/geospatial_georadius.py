@@ -0,0 +1,68 @@
+"""Benchmark of the in-process georadius engine with 1M points.
+
+Usage: python benchmarks/geospatial_georadius.py [points] [queries]
+"""
+import random
+import sys
+import time
+
+from dbdaora.data_sources.memory import geoindex
+from dbdaora.data_sources.memory.dict import DictGeoMember, DictGeoPoint
+
+
+def main(points_size: int, queries_size: int) -> None:
+    random_ = random.Random(0)
+    index = geoindex.GeoIndex()
+
+    start = time.perf_counter()
+    index.extend(
+        (
+            random_.uniform(-47.0, -46.0),
+            random_.uniform(-24.0, -23.0),
+            f'member{i}',
+        )
+        for i in range(points_size)
+    )
+    print(f'geoadd {points_size} points: {time.perf_counter() - start:.3f}s')
+
+    centers = [
+        (random_.uniform(-47.0, -46.0), random_.uniform(-24.0, -23.0))
+        for _ in range(queries_size)
+    ]
+
+    for engine, np in (('numpy', geoindex.np), ('python', None)):
+        if engine == 'numpy' and np is None:
+            print('numpy is not installed; skipping numpy engine')
+            continue
+
+        geoindex.np = np
+        found = 0
+        start = time.perf_counter()
+
+        for longitude, latitude in centers:
+            found += len(
+                index.radius(
+                    longitude,
+                    latitude,
+                    2,
+                    'km',
+                    DictGeoMember,
+                    DictGeoPoint,
+                    with_dist=True,
+                    with_coord=True,
+                    count=50,
+                )
+            )
+
+        elapsed = time.perf_counter() - start
+        print(
+            f'{engine} georadius: {elapsed / queries_size * 1000:.2f}ms '
+            f'per query ({found / queries_size:.1f} members per query)'
+        )
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+    )
@@ -0,0 +1,118 @@
+"""Hash entity reads/writes stored as a redis hash and as a single blob.
+
+Usage: python benchmarks/hash_blob.py [entities] [fields]
+"""
+import asyncio
+import dataclasses
+import sys
+import time
+import types
+from typing import Any, Optional, Type
+
+from dbdaora import (
+    DictFallbackDataSource,
+    DictMemoryDataSource,
+    HashBlobRepository,
+    HashRepository,
+)
+
+
+def make_entity_cls(fields_size: int) -> type:
+    fields = [('id', str), ('active', bool)]
+    fields.extend(
+        (f'field{i}', (int, float, str)[i % 3]) for i in range(fields_size)
+    )
+    fields.append(('description', Optional[str], None))  # type: ignore
+    return dataclasses.make_dataclass('WideEntity', fields)
+
+
+def make_repository(
+    base_cls: Type[Any], entity_cls: type, **attrs: Any
+) -> Any:
+    repository_cls = types.new_class(
+        f'Wide{base_cls.__name__}',
+        (base_cls[entity_cls, str],),
+        exec_body=lambda ns: ns.update(name='wide', **attrs),
+    )
+    return repository_cls(
+        memory_data_source=DictMemoryDataSource(),
+        fallback_data_source=DictFallbackDataSource(),
+        expire_time=60,
+    )
+
+
+async def main(entities_size: int, fields_size: int) -> None:
+    entity_cls = make_entity_cls(fields_size)
+    entities = [
+        entity_cls(  # type: ignore
+            id=f'entity{n}',
+            active=True,
+            **{
+                f'field{i}': (int, float, str)[i % 3](i * n)
+                for i in range(fields_size)
+            },
+        )
+        for n in range(entities_size)
+    ]
+
+    for name, repository in (
+        ('hash', make_repository(HashRepository, entity_cls)),
+        (
+            'hash compiled',
+            make_repository(
+                HashRepository,
+                entity_cls,
+                compiled_decoder=True,
+                compiled_encoder=True,
+            ),
+        ),
+        ('blob', make_repository(HashBlobRepository, entity_cls)),
+        (
+            'blob compiled',
+            make_repository(
+                HashBlobRepository, entity_cls, compiled_decoder=True
+            ),
+        ),
+        (
+            'blob zlib',
+            make_repository(
+                HashBlobRepository,
+                entity_cls,
+                compiled_decoder=True,
+                blob_compression_level=6,
+            ),
+        ),
+    ):
+        start = time.perf_counter()
+
+        for entity in entities:
+            await repository.add(entity, memory_always=True)
+
+        add_elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+
+        for entity in entities:
+            await repository.query(entity.id).entity
+
+        get_elapsed = time.perf_counter() - start
+        size = sum(
+            len(value)
+            if isinstance(value, bytes)
+            else sum(len(k) + len(v) for k, v in value.items())
+            for value in repository.memory_data_source.db.values()
+        )
+        print(
+            f'{name}: add {add_elapsed / entities_size * 1_000_000:.1f}us, '
+            f'get {get_elapsed / entities_size * 1_000_000:.1f}us, '
+            f'{size / entities_size:.0f} bytes per entity '
+            f'({fields_size + 3} fields)'
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+        )
+    )
@@ -0,0 +1,96 @@
+"""Hash entity decoding/encoding with jsondaora and with compiled codecs.
+
+Usage: python benchmarks/hash_codegen.py [entities] [fields]
+"""
+import dataclasses
+import itertools
+import sys
+import time
+from typing import Optional
+
+from jsondaora import dataclasses as jdataclasses
+
+from dbdaora.hash.codegen import make_decoder, make_encoder
+
+
+def make_entity_cls(fields_size: int) -> type:
+    fields = [('id', str), ('active', bool)]
+    fields.extend(
+        (f'field{i}', (int, float, str)[i % 3]) for i in range(fields_size)
+    )
+    fields.append(('description', Optional[str], None))  # type: ignore
+    return dataclasses.make_dataclass('WideEntity', fields)
+
+
+def main(entities_size: int, fields_size: int) -> None:
+    entity_cls = make_entity_cls(fields_size)
+    data = [
+        {
+            b'id': f'entity{n}'.encode(),
+            b'active': b'1',
+            **{
+                f'field{i}'.encode(): str(i * n).encode()
+                for i in range(fields_size)
+            },
+        }
+        for n in range(entities_size)
+    ]
+    decoder = make_decoder(entity_cls)
+
+    for name, decode in (
+        (
+            'jsondaora',
+            lambda d: jdataclasses.asdataclass(
+                d, entity_cls, has_bytes_keys=True
+            ),
+        ),
+        ('compiled', decoder),
+    ):
+        start = time.perf_counter()
+
+        for item in data:
+            decode(item)
+
+        elapsed = time.perf_counter() - start
+        print(
+            f'{name} decode: {elapsed / entities_size * 1_000_000:.1f}us '
+            f'per entity ({fields_size + 3} fields)'
+        )
+
+    entities = [decoder(item) for item in data]
+    encoder = make_encoder(entity_cls)
+
+    for name, encode in (
+        (
+            'jsondaora',
+            lambda e: list(
+                itertools.chain(
+                    *{
+                        k: int(v) if isinstance(v, bool) else v
+                        for k, v in jdataclasses.asdict(
+                            e, dumps_value=True
+                        ).items()
+                        if v is not None
+                    }.items()
+                )
+            ),
+        ),
+        ('compiled', encoder),
+    ):
+        start = time.perf_counter()
+
+        for entity in entities:
+            encode(entity)
+
+        elapsed = time.perf_counter() - start
+        print(
+            f'{name} encode: {elapsed / entities_size * 1_000_000:.1f}us '
+            f'per entity ({fields_size + 3} fields)'
+        )
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+    )
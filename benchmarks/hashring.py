@@ -0,0 +1,44 @@
+"""Keys distribution, remapped keys on resharding and lookup cost of rings.
+
+Usage: python benchmarks/hashring.py [keys] [nodes]
+"""
+import statistics
+import sys
+import time
+from collections import Counter
+
+from dbdaora import ConsistentHashRing, HashRing, JumpHashRing
+
+
+def main(keys_size: int, nodes_size: int) -> None:
+    keys = [f'entity:{i}' for i in range(keys_size)]
+    nodes = [f'redis://shard{i}' for i in range(nodes_size)]
+
+    for hashring_cls in (HashRing, ConsistentHashRing, JumpHashRing):
+        hashring = hashring_cls(nodes, names=nodes)
+        new_hashring = hashring_cls(
+            nodes + ['redis://new'], names=nodes + ['redis://new']
+        )
+        start = time.perf_counter()
+        indexes = [hashring.get_index(key) for key in keys]
+        elapsed = time.perf_counter() - start
+        counts = Counter(indexes).values()
+        moved = sum(
+            index != new_hashring.get_index(key)
+            for key, index in zip(keys, indexes)
+        )
+        print(
+            f'{hashring_cls.__name__}: '
+            f'lookup {elapsed / keys_size * 1_000_000:.2f}us, '
+            f'keys per node stdev '
+            f'{statistics.pstdev(counts) / (keys_size / nodes_size):.1%}, '
+            f'moved adding a node {moved / keys_size:.1%} '
+            f'(ideal {1 / (nodes_size + 1):.1%})'
+        )
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 8,
+    )
@@ -0,0 +1,56 @@
+"""Key routing throughput by hash function and with memoized nodes.
+
+Hot keys are drawn from a small set, like the reads of a cached service.
+
+Usage: python benchmarks/hashring_lookup.py [lookups] [hot_keys]
+"""
+import random
+import sys
+import time
+
+from dbdaora import ConsistentHashRing, HashRing
+from dbdaora.hashring import crc32_hash, md5_hash, xxhash, xxhash_hash
+
+
+def main(lookups_size: int, hot_keys_size: int) -> None:
+    random.seed(0)
+    nodes = [f'redis://shard{i}' for i in range(8)]
+    hot_keys = [f'entity:{i}' for i in range(hot_keys_size)]
+    keys = random.choices(hot_keys, k=lookups_size)
+    hash_functions = [('md5', md5_hash), ('crc32', crc32_hash)]
+
+    if xxhash is not None:
+        hash_functions.append(('xxhash', xxhash_hash))
+
+    for base_cls in (HashRing, ConsistentHashRing):
+        for hash_name, hash_function in hash_functions:
+            for cache_size in (None, hot_keys_size):
+                hashring_cls = type(
+                    base_cls.__name__,
+                    (base_cls,),
+                    {
+                        'hash_function': staticmethod(hash_function),
+                        'cache_size': cache_size,
+                    },
+                )
+                hashring = hashring_cls(nodes, names=nodes)
+                get_node = hashring.get_node
+                start = time.perf_counter()
+
+                for key in keys:
+                    get_node(key)
+
+                elapsed = time.perf_counter() - start
+                print(
+                    f'{base_cls.__name__} {hash_name} '
+                    f'{"cached" if cache_size else "uncached"}: '
+                    f'{elapsed / lookups_size * 1_000_000:.2f}us per lookup, '
+                    f'{lookups_size / elapsed / 1_000_000:.2f}M lookups/s'
+                )
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 500_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10_000,
+    )
@@ -0,0 +1,59 @@
+"""Sequential single key commands against shard grouped multi-key commands.
+
+Needs a redis server on localhost (databases 0, 1 and 2 act as shards).
+
+Usage: python benchmarks/shards_many.py [keys] [rounds]
+"""
+import asyncio
+import sys
+import time
+
+from dbdaora import make_aioredis_data_source
+
+
+async def main(keys_size: int, rounds: int) -> None:
+    memory_data_source = await make_aioredis_data_source(
+        'redis://', 'redis://localhost/1', 'redis://localhost/2'
+    )
+    keys = [f'benchmark:many:{i}' for i in range(keys_size)]
+
+    for key in keys:
+        await memory_data_source.hmset(key, 'id', key, 'value', 'x' * 64)
+
+    async def single() -> None:
+        for key in keys:
+            await memory_data_source.hgetall(key)
+
+    async def gathered() -> None:
+        await asyncio.gather(*(memory_data_source.hgetall(k) for k in keys))
+
+    async def many() -> None:
+        await memory_data_source.hgetall_many(keys)
+
+    for name, run in (
+        ('hgetall sequential', single),
+        ('hgetall gathered', gathered),
+        ('hgetall_many', many),
+    ):
+        start = time.perf_counter()
+
+        for _ in range(rounds):
+            await run()
+
+        elapsed = (time.perf_counter() - start) / rounds
+        print(f'{name}: {elapsed * 1000:.2f}ms per {keys_size} keys')
+
+    for key in keys:
+        await memory_data_source.delete(key)
+
+    memory_data_source.close()
+    await memory_data_source.wait_closed()
+
+
+if __name__ == '__main__':
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 100,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+        )
+    )
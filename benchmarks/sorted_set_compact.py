@@ -0,0 +1,42 @@
+"""Memory used by a cached sorted set entity with and without compact data.
+
+Usage: python benchmarks/sorted_set_compact.py [members]
+"""
+import random
+import sys
+import tracemalloc
+
+from dbdaora import CompactSortedSetData
+
+
+def measure(factory):  # type: ignore
+    tracemalloc.start()
+    data = factory()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return data, size
+
+
+def main(members_size: int) -> None:
+    random_ = random.Random(0)
+    scores = [random_.random() for _ in range(members_size)]
+    data, tuples_size = measure(
+        lambda: [
+            (f'user:{i}'.encode(), score * 1.0)
+            for i, score in enumerate(scores)
+        ]
+    )
+    compact, compact_size = measure(
+        lambda: CompactSortedSetData.from_data(data)
+    )
+
+    assert compact == data
+    print(f'list of tuples: {tuples_size / 1024 / 1024:.2f} MB')
+    print(
+        f'compact: {compact_size / 1024 / 1024:.2f} MB '
+        f'({tuples_size / compact_size:.1f}x smaller)'
+    )
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
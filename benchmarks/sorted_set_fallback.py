@@ -0,0 +1,73 @@
+"""Benchmark of sorted set reads from the fallback data source.
+
+Compares documents written sorted by score against legacy documents,
+which are sorted on every read.
+
+Usage: python benchmarks/sorted_set_fallback.py [members] [reads]
+"""
+import asyncio
+import dataclasses
+import random
+import sys
+import time
+from typing import Optional
+
+from dbdaora import (
+    DictFallbackDataSource,
+    DictMemoryDataSource,
+    SortedSetData,
+    SortedSetQuery,
+    SortedSetRepository,
+)
+
+
+@dataclasses.dataclass
+class Leaderboard:
+    id: str
+    data: SortedSetData
+    max_size: Optional[int] = None
+
+
+class LeaderboardRepository(SortedSetRepository[Leaderboard, str]):
+    ...
+
+
+async def main(members_size: int, reads: int) -> None:
+    random_ = random.Random(0)
+    repository = LeaderboardRepository(
+        memory_data_source=DictMemoryDataSource(),
+        fallback_data_source=DictFallbackDataSource(),
+        expire_time=1,
+    )
+    data = [(f'member{i}', random_.random()) for i in range(members_size)]
+    await repository.add(Leaderboard(id='sorted', data=data), memory=False)
+    legacy = dict(repository.fallback_data_source.db['leaderboard:sorted'])
+    legacy.pop('sorted')
+    repository.fallback_data_source.db['leaderboard:legacy'] = legacy
+
+    for name, filters in (
+        ('page 1', dict(page=1, page_size=10)),
+        ('page 1 reverse', dict(page=1, page_size=10, reverse=True)),
+        ('page 1000', dict(page=1000, page_size=10)),
+        ('score range', dict(min_score=0.5, max_score=0.50002)),
+    ):
+        for id_ in ('legacy', 'sorted'):
+            query = SortedSetQuery(
+                repository, memory=False, id=id_, withscores=True, **filters
+            )
+            start = time.perf_counter()
+
+            for _ in range(reads):
+                await repository.get_fallback_data(query)
+
+            elapsed = (time.perf_counter() - start) / reads * 1000
+            print(f'{name} ({id_}): {elapsed:.2f}ms per read')
+
+
+if __name__ == '__main__':
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 500_000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+        )
+    )
@@ -5,27 +5,40 @@ __version__ = '0.27.0'
 
 from dbdaora.cache import CacheType, TTLDaoraCache
 from dbdaora.circuitbreaker import AsyncCircuitBreaker
+from dbdaora.compression import Compression
 from dbdaora.data_sources.fallback import FallbackDataSource
+from dbdaora.data_sources.fallback.compressed import (
+    CompressedFallbackDataSource,
+)
 from dbdaora.data_sources.fallback.dict import DictFallbackDataSource
+from dbdaora.data_sources.fallback.write_behind import (
+    WriteBehindFallbackDataSource,
+)
 from dbdaora.data_sources.memory import MemoryDataSource
+from dbdaora.data_sources.memory.compressed import CompressedMemoryDataSource
 from dbdaora.data_sources.memory.dict import DictMemoryDataSource
+from dbdaora.data_sources.memory.shards import ShardsMemoryDataSource
 from dbdaora.exceptions import EntityNotFoundError, InvalidGeoSpatialDataError
 from dbdaora.geospatial.entity import GeoSpatialData, GeoSpatialEntity
 from dbdaora.geospatial.factory import make_service as make_geospatial_service
-from dbdaora.geospatial.query import GeoSpatialQuery
+from dbdaora.geospatial.query import GeoSpatialQuery, GeoSpatialQueryType
 from dbdaora.geospatial.repositories import GeoSpatialRepository
 from dbdaora.geospatial.service import GeoSpatialService
 from dbdaora.hash.factory import make_service as make_hash_service
 from dbdaora.hash.query import HashQuery, HashQueryMany
 from dbdaora.hash.repositories import HashData, HashEntity, HashRepository
+from dbdaora.hash.repositories.blob import HashBlobRepository
 from dbdaora.hash.service import HashService
-from dbdaora.hashring import HashRing
+from dbdaora.hashring import ConsistentHashRing, HashRing, JumpHashRing
 from dbdaora.keys import FallbackKey
 from dbdaora.query import Query, QueryMany
 from dbdaora.repository import MemoryRepository
 from dbdaora.service import CACHE_ALREADY_NOT_FOUND, Service
 from dbdaora.service.builder import build as build_service
 from dbdaora.service.builder import build_cache
+from dbdaora.snapshot import dump as dump_snapshot
+from dbdaora.snapshot import restore as restore_snapshot
+from dbdaora.sorted_set.compact import CompactSortedSetData
 from dbdaora.sorted_set.entity import (
     SortedSetData,
     SortedSetDictEntity,
@@ -34,6 +47,9 @@ from dbdaora.sorted_set.entity import (
 from dbdaora.sorted_set.factory import make_service as make_sorted_set_service
 from dbdaora.sorted_set.query import SortedSetQuery
 from dbdaora.sorted_set.repositories import SortedSetRepository
+from dbdaora.warmup import WarmupProgress
+from dbdaora.warmup import warmup as warmup_repository
+from dbdaora.write_behind import WriteBehindJournal, WriteBehindQueue
 
 
 from dbdaora.boolean.factory import (  # noqa isort:skip
@@ -74,14 +90,40 @@ except ImportError:
 try:
     from dbdaora.data_sources.memory.aioredis import (
         AioRedisDataSource,
+        ReplicasAioRedisDataSource,
         ShardsAioRedisDataSource,
         make as make_aioredis_data_source,
     )
 except ImportError:
     AioRedisDataSource = None  # type: ignore
+    ReplicasAioRedisDataSource = None  # type: ignore
     ShardsAioRedisDataSource = None  # type: ignore
     make_aioredis_data_source = None  # type: ignore
 
+try:
+    from dbdaora.data_sources.memory.redis_asyncio import (
+        RedisAsyncioDataSource,
+        ReplicasRedisAsyncioDataSource,
+        ShardsRedisAsyncioDataSource,
+        make as make_redis_asyncio_data_source,
+    )
+except ImportError:
+    RedisAsyncioDataSource = None  # type: ignore
+    ReplicasRedisAsyncioDataSource = None  # type: ignore
+    ShardsRedisAsyncioDataSource = None  # type: ignore
+    make_redis_asyncio_data_source = None  # type: ignore
+
+try:
+    from dbdaora.data_sources.memory.aioredis_cluster import (
+        ClusterAioRedisDataSource,
+        ClusterHashRing,
+        make as make_aioredis_cluster_data_source,
+    )
+except ImportError:
+    ClusterAioRedisDataSource = None  # type: ignore
+    ClusterHashRing = None  # type: ignore
+    make_aioredis_cluster_data_source = None  # type: ignore
+
 try:
     from dbdaora.data_sources.fallback.mongodb import (
         MongoDataSource,
@@ -97,6 +139,7 @@ try:
     from dbdaora.sorted_set.service.mongodb import MongoSortedSetService
     from dbdaora.sorted_set.repositories.mongodb import (
         MongodbSortedSetRepository,
+        MongodbMembersSortedSetRepository,
     )
 except ImportError:
     MongoDataSource = None  # type: ignore
@@ -107,11 +150,13 @@ except ImportError:
     MongoHashService = None  # type: ignore
     MongoSortedSetService = None  # type: ignore
     MongodbSortedSetRepository = None  # type: ignore
+    MongodbMembersSortedSetRepository = None  # type: ignore
 
 
 __all__ = [
     'MemoryRepository',
     'HashRepository',
+    'HashBlobRepository',
     'HashQuery',
     'HashData',
     'SortedSetRepository',
@@ -121,6 +166,8 @@ __all__ = [
     'HashService',
     'AsyncCircuitBreaker',
     'HashRing',
+    'ConsistentHashRing',
+    'JumpHashRing',
     'FallbackDataSource',
     'MemoryDataSource',
     'DictMemoryDataSource',
@@ -132,6 +179,7 @@ __all__ = [
     'make_hash_service',
     'SortedSetData',
     'SortedSetDictEntity',
+    'CompactSortedSetData',
     'TTLDaoraCache',
     'build_cache',
     'BooleanRepository',
@@ -141,6 +189,7 @@ __all__ = [
     'QueryMany',
     'InvalidGeoSpatialDataError',
     'GeoSpatialQuery',
+    'GeoSpatialQueryType',
     'GeoSpatialEntity',
     'GeoSpatialService',
     'GeoSpatialRepository',
@@ -151,6 +200,17 @@ __all__ = [
     'FallbackKey',
     'HashEntity',
     'make_boolean_service',
+    'Compression',
+    'CompressedMemoryDataSource',
+    'CompressedFallbackDataSource',
+    'ShardsMemoryDataSource',
+    'WarmupProgress',
+    'warmup_repository',
+    'dump_snapshot',
+    'restore_snapshot',
+    'WriteBehindFallbackDataSource',
+    'WriteBehindJournal',
+    'WriteBehindQueue',
 ]
 
 if AioRedisDataSource:
@@ -159,9 +219,33 @@ if AioRedisDataSource:
 if ShardsAioRedisDataSource:
     __all__.append('ShardsAioRedisDataSource')
 
+if ReplicasAioRedisDataSource:
+    __all__.append('ReplicasAioRedisDataSource')
+
 if make_aioredis_data_source:
     __all__.append('make_aioredis_data_source')
 
+if RedisAsyncioDataSource:
+    __all__.append('RedisAsyncioDataSource')
+
+if ReplicasRedisAsyncioDataSource:
+    __all__.append('ReplicasRedisAsyncioDataSource')
+
+if ShardsRedisAsyncioDataSource:
+    __all__.append('ShardsRedisAsyncioDataSource')
+
+if make_redis_asyncio_data_source:
+    __all__.append('make_redis_asyncio_data_source')
+
+if ClusterAioRedisDataSource:
+    __all__.append('ClusterAioRedisDataSource')
+
+if ClusterHashRing:
+    __all__.append('ClusterHashRing')
+
+if make_aioredis_cluster_data_source:
+    __all__.append('make_aioredis_cluster_data_source')
+
 if DatastoreDataSource:
     __all__.append('DatastoreDataSource')
 
@@ -210,6 +294,9 @@ if DatastoreSortedSetService:
 if MongodbSortedSetRepository:
     __all__.append('MongodbSortedSetRepository')
 
+if MongodbMembersSortedSetRepository:
+    __all__.append('MongodbMembersSortedSetRepository')
+
 if MongoSortedSetService:
     __all__.append('MongoSortedSetService')
 
@@ -0,0 +1,42 @@
+import pytest
+
+from dbdaora import ConsistentHashRing, make_aioredis_data_source
+
+
+@pytest.mark.asyncio
+@pytest.fixture
+async def memory_data_source():
+    memory_data_source = await make_aioredis_data_source(
+        'redis://',
+        'redis://localhost/1',
+        'redis://localhost/2',
+        hashring_cls=ConsistentHashRing,
+    )
+    yield memory_data_source
+    memory_data_source.close()
+    await memory_data_source.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_should_route_keys_by_uris(memory_data_source):
+    hashring = memory_data_source.hashring
+    multi_exec = memory_data_source.multi_exec()
+
+    assert isinstance(hashring, ConsistentHashRing)
+    assert hashring.names == (
+        'redis://',
+        'redis://localhost/1',
+        'redis://localhost/2',
+    )
+    assert [hashring.get_index(f'fake:{i}') for i in range(100)] == [
+        multi_exec.hashring.get_index(f'fake:{i}') for i in range(100)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_set_and_get(memory_data_source):
+    await memory_data_source.set('fake:consistent', b'value')
+    client = memory_data_source.get_client('fake:consistent')
+
+    assert await memory_data_source.get('fake:consistent') == b'value'
+    assert await client.get('fake:consistent') == b'value'
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from dbdaora import ConsistentHashRing, make_aioredis_data_source
+
+
+KEYS = [f'fake:auto_pipelining:{i}' for i in range(100)]
+
+
+@pytest.fixture
+def uris():
+    return ['redis://']
+
+
+@pytest.mark.asyncio
+@pytest.fixture
+async def memory_data_source(uris):
+    memory_data_source = await make_aioredis_data_source(
+        *uris, hashring_cls=ConsistentHashRing, auto_pipelining=True
+    )
+    await asyncio.gather(*(memory_data_source.delete(k) for k in KEYS))
+
+    yield memory_data_source
+
+    await asyncio.gather(*(memory_data_source.delete(k) for k in KEYS))
+    memory_data_source.close()
+    await memory_data_source.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_should_buffer_commands_of_the_same_loop_iteration(
+    memory_data_source, mocker
+):
+    connection = memory_data_source._pool_or_conn._pool[0]
+    write = mocker.spy(connection._writer, 'write')
+
+    await asyncio.gather(*(memory_data_source.set(k, k) for k in KEYS[:10]))
+
+    assert memory_data_source.auto_pipelining
+    assert write.call_count == 1
+    assert connection._pipeline_buffer is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'uris',
+    [['redis://'], ['redis://', 'redis://localhost/1', 'redis://localhost/2']],
+)
+async def test_should_gather_commands(memory_data_source):
+    await asyncio.gather(*(memory_data_source.set(k, k) for k in KEYS))
+
+    assert await asyncio.gather(
+        *(memory_data_source.get(k) for k in KEYS)
+    ) == [k.encode() for k in KEYS]
+    assert await memory_data_source.mget(*KEYS) == [k.encode() for k in KEYS]
+
+
+@pytest.mark.asyncio
+async def test_should_raise_reply_errors(memory_data_source):
+    await memory_data_source.set(KEYS[0], 'value')
+
+    results = await asyncio.gather(
+        memory_data_source.hgetall(KEYS[0]),
+        memory_data_source.get(KEYS[0]),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], Exception)
+    assert results[1] == b'value'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'uris', [['redis://', 'redis://localhost/1', 'redis://localhost/2']],
+)
+async def test_should_execute_pipelines_and_multi_exec(memory_data_source):
+    multi_exec = memory_data_source.multi_exec()
+
+    for key in KEYS[:10]:
+        multi_exec.hmset(key, 'id', key)
+
+    await asyncio.gather(
+        multi_exec.execute(),
+        *(memory_data_source.set(k, k) for k in KEYS[10:20]),
+    )
+
+    assert await memory_data_source.hgetall_many(KEYS[:10]) == [
+        {b'id': k.encode()} for k in KEYS[:10]
+    ]
+    assert await memory_data_source.exists_many(KEYS[:20]) == [1] * 20
@@ -0,0 +1,306 @@
+import asyncio
+import os
+import shutil
+import socket
+import subprocess
+
+import pytest
+from aioredis import create_redis
+
+from dbdaora import (
+    ClusterAioRedisDataSource,
+    make_aioredis_cluster_data_source,
+)
+from dbdaora.data_sources.memory.aioredis_cluster import (
+    CLUSTER_SLOTS,
+    key_slot,
+)
+
+
+REDIS_SERVER = os.environ.get('REDIS_SERVER') or shutil.which('redis-server')
+
+
+def free_port():
+    while True:
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+
+        # the cluster bus listens on port + 10000
+        if port + 10000 < 65536:
+            return port
+
+
+async def start_cluster(ports):
+    for _ in range(50):
+        try:
+            nodes = [
+                await create_redis(f'redis://127.0.0.1:{port}')
+                for port in ports
+            ]
+            break
+        except OSError:
+            await asyncio.sleep(0.1)
+    else:
+        raise RuntimeError('redis cluster nodes did not start')
+
+    slots_size = CLUSTER_SLOTS // len(nodes) + 1
+
+    for i, node in enumerate(nodes):
+        await node.execute(
+            b'CLUSTER',
+            b'ADDSLOTS',
+            *range(i * slots_size, min((i + 1) * slots_size, CLUSTER_SLOTS)),
+        )
+
+    for port in ports[1:]:
+        await nodes[0].execute(b'CLUSTER', b'MEET', b'127.0.0.1', port)
+
+    for _ in range(100):
+        infos = [await node.execute(b'CLUSTER', b'INFO') for node in nodes]
+
+        if all(b'cluster_state:ok' in info for info in infos):
+            break
+
+        await asyncio.sleep(0.1)
+    else:
+        raise RuntimeError('redis cluster did not start')
+
+    for node in nodes:
+        node.close()
+        await node.wait_closed()
+
+
+@pytest.fixture(scope='module')
+def cluster_ports(tmp_path_factory):
+    if REDIS_SERVER is None:
+        pytest.skip('redis-server is not installed')
+
+    directory = tmp_path_factory.mktemp('cluster')
+    ports = [free_port() for _ in range(3)]
+    processes = [
+        subprocess.Popen(
+            [
+                REDIS_SERVER,
+                '--port',
+                str(port),
+                '--cluster-enabled',
+                'yes',
+                '--cluster-config-file',
+                f'nodes-{port}.conf',
+                '--dir',
+                str(directory),
+                '--save',
+                '',
+                '--appendonly',
+                'no',
+            ],
+            stdout=subprocess.DEVNULL,
+        )
+        for port in ports
+    ]
+
+    try:
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(start_cluster(ports))
+        loop.close()
+        yield ports
+
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
+
+
+@pytest.mark.asyncio
+@pytest.fixture
+async def nodes(cluster_ports):
+    nodes = {
+        port: await create_redis(f'redis://127.0.0.1:{port}')
+        for port in cluster_ports
+    }
+    yield nodes
+
+    for node in nodes.values():
+        await node.flushall()
+        node.close()
+        await node.wait_closed()
+
+
+@pytest.mark.asyncio
+@pytest.fixture
+async def memory_data_source(cluster_ports, nodes):
+    memory_data_source = await make_aioredis_cluster_data_source(
+        f'redis://127.0.0.1:{cluster_ports[0]}'
+    )
+    yield memory_data_source
+    memory_data_source.close()
+    await memory_data_source.wait_closed()
+
+
+async def get_slot_port(nodes, slot):
+    for start, end, master, *_ in await next(iter(nodes.values())).execute(
+        b'CLUSTER', b'SLOTS'
+    ):
+        if start <= slot <= end:
+            return master[1]
+
+
+async def migrate_slot(nodes, slot, source_port, target_port, finish=True):
+    source, target = nodes[source_port], nodes[target_port]
+    source_id = await source.execute(b'CLUSTER', b'MYID')
+    target_id = await target.execute(b'CLUSTER', b'MYID')
+
+    await target.execute(b'CLUSTER', b'SETSLOT', slot, b'IMPORTING', source_id)
+    await source.execute(b'CLUSTER', b'SETSLOT', slot, b'MIGRATING', target_id)
+
+    for key in await source.execute(b'CLUSTER', b'GETKEYSINSLOT', slot, 100):
+        await source.execute(
+            b'MIGRATE', b'127.0.0.1', target_port, key, 0, 5000
+        )
+
+    if finish:
+        await finish_slot_migration(nodes, slot, target_port)
+
+
+async def finish_slot_migration(nodes, slot, target_port):
+    target_id = await nodes[target_port].execute(b'CLUSTER', b'MYID')
+
+    for port in [target_port] + [p for p in nodes if p != target_port]:
+        await nodes[port].execute(
+            b'CLUSTER', b'SETSLOT', slot, b'NODE', target_id
+        )
+
+
+@pytest.mark.asyncio
+async def test_should_load_slots(memory_data_source, cluster_ports, nodes):
+    hashring = memory_data_source.hashring
+
+    assert isinstance(memory_data_source, ClusterAioRedisDataSource)
+    assert sorted(hashring.names) == sorted(
+        f'127.0.0.1:{port}' for port in cluster_ports
+    )
+    assert (
+        hashring.names[hashring.get_index('foo')]
+        == f'127.0.0.1:{await get_slot_port(nodes, key_slot("foo"))}'
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_set_and_get_on_slot_node(memory_data_source, nodes):
+    keys = [f'fake:{i}' for i in range(30)]
+
+    for key in keys:
+        await memory_data_source.set(key, key)
+
+    for key in keys:
+        port = await get_slot_port(nodes, key_slot(key))
+
+        assert await nodes[port].get(key) == key.encode()
+        assert await memory_data_source.get(key) == key.encode()
+
+
+@pytest.mark.asyncio
+async def test_should_run_multi_key_commands(memory_data_source):
+    keys = [f'fake:{i}' for i in range(30)]
+
+    for key in keys[:20]:
+        await memory_data_source.hmset(key, 'id', key)
+        await memory_data_source.set(f'{key}:string', key)
+
+    await memory_data_source.expire_many(keys[:10], 60)
+
+    assert (
+        await memory_data_source.mget(*(f'{key}:string' for key in keys))
+        == [key.encode() for key in keys[:20]] + [None] * 10
+    )
+    assert (
+        await memory_data_source.hgetall_many(keys)
+        == [{b'id': key.encode()} for key in keys[:20]] + [{}] * 10
+    )
+    assert await memory_data_source.exists_many(keys) == [1] * 20 + [0] * 10
+    assert await memory_data_source.get_client('fake:0').ttl('fake:0') > 0
+    assert await memory_data_source.get_client('fake:19').ttl('fake:19') == -1
+
+
+@pytest.mark.asyncio
+async def test_should_execute_multi_exec_by_slot(memory_data_source):
+    multi_exec = memory_data_source.multi_exec()
+
+    for i in range(10):
+        multi_exec.hmset(f'fake:{i}', 'id', str(i))
+
+    await multi_exec.execute()
+
+    assert await memory_data_source.hgetall_many(
+        [f'fake:{i}' for i in range(10)]
+    ) == [{b'id': str(i).encode()} for i in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_should_follow_moved_redirection(
+    memory_data_source, nodes, cluster_ports
+):
+    slot = key_slot('fake:moved')
+    source_port = await get_slot_port(nodes, slot)
+    target_port = next(p for p in cluster_ports if p != source_port)
+    await memory_data_source.set('fake:moved', 'value')
+
+    await migrate_slot(nodes, slot, source_port, target_port)
+
+    try:
+        assert await memory_data_source.get('fake:moved') == b'value'
+        assert (
+            memory_data_source.hashring.names[
+                memory_data_source.hashring.slots[slot]
+            ]
+            == f'127.0.0.1:{target_port}'
+        )
+
+    finally:
+        await migrate_slot(nodes, slot, target_port, source_port)
+
+
+@pytest.mark.asyncio
+async def test_should_follow_ask_redirection(
+    memory_data_source, nodes, cluster_ports
+):
+    slot = key_slot('fake:ask')
+    source_port = await get_slot_port(nodes, slot)
+    target_port = next(p for p in cluster_ports if p != source_port)
+    await memory_data_source.set('fake:ask', 'value')
+
+    await migrate_slot(nodes, slot, source_port, target_port, finish=False)
+
+    try:
+        assert await memory_data_source.get('fake:ask') == b'value'
+        assert (
+            memory_data_source.hashring.names[
+                memory_data_source.hashring.slots[slot]
+            ]
+            == f'127.0.0.1:{source_port}'
+        )
+
+    finally:
+        await finish_slot_migration(nodes, slot, target_port)
+        await migrate_slot(nodes, slot, target_port, source_port)
+
+
+@pytest.mark.asyncio
+async def test_should_refresh_slots_on_pipeline_redirection(
+    memory_data_source, nodes, cluster_ports
+):
+    slot = key_slot('fake:pipeline')
+    source_port = await get_slot_port(nodes, slot)
+    target_port = next(p for p in cluster_ports if p != source_port)
+    await memory_data_source.hmset('fake:pipeline', 'id', 'pipeline')
+
+    await migrate_slot(nodes, slot, source_port, target_port)
+
+    try:
+        assert await memory_data_source.hgetall_many(
+            ['fake:pipeline', 'fake:other']
+        ) == [{b'id': b'pipeline'}, {}]
+
+    finally:
+        await migrate_slot(nodes, slot, target_port, source_port)
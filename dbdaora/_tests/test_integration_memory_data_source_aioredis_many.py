@@ -0,0 +1,69 @@
+import pytest
+
+from dbdaora import ShardsAioRedisDataSource, make_aioredis_data_source
+
+
+KEYS = [f'fake:many:{i}' for i in range(20)]
+
+
+@pytest.mark.asyncio
+@pytest.fixture(params=[1, 3])
+async def memory_data_source(request):
+    uris = ['redis://', 'redis://localhost/1', 'redis://localhost/2']
+    memory_data_source = await make_aioredis_data_source(
+        *uris[: request.param]
+    )
+
+    for key in KEYS:
+        await memory_data_source.delete(key)
+
+    yield memory_data_source
+    memory_data_source.close()
+    await memory_data_source.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_should_mget(memory_data_source):
+    for i, key in enumerate(KEYS[::2]):
+        await memory_data_source.set(key, f'value{i}')
+
+    values = await memory_data_source.mget(*KEYS)
+
+    assert values == [
+        f'value{i // 2}'.encode() if i % 2 == 0 else None
+        for i in range(len(KEYS))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_hgetall_many(memory_data_source):
+    for i, key in enumerate(KEYS[1::2]):
+        await memory_data_source.hmset(key, 'id', f'fake{i}')
+
+    values = await memory_data_source.hgetall_many(KEYS)
+
+    assert values == [
+        {b'id': f'fake{i // 2}'.encode()} if i % 2 else {}
+        for i in range(len(KEYS))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_exists_and_expire_many(memory_data_source):
+    for key in KEYS[:5]:
+        await memory_data_source.set(key, '1')
+
+    exists = await memory_data_source.exists_many(KEYS)
+    await memory_data_source.expire_many(KEYS[:5], 10)
+
+    assert exists == [1] * 5 + [0] * 15
+    assert [
+        await get_client(memory_data_source, key).ttl(key) for key in KEYS[:6]
+    ] == [10] * 5 + [-2]
+
+
+def get_client(memory_data_source, key):
+    if isinstance(memory_data_source, ShardsAioRedisDataSource):
+        return memory_data_source.get_client(key)
+
+    return memory_data_source
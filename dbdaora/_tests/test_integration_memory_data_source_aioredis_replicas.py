@@ -0,0 +1,197 @@
+import dataclasses
+
+import pytest
+
+from dbdaora import (
+    AioRedisDataSource,
+    DictFallbackDataSource,
+    HashRepository,
+    ReplicasAioRedisDataSource,
+    ShardsAioRedisDataSource,
+    make_aioredis_data_source,
+)
+
+
+KEY = 'fake:replicas'
+
+
+@pytest.fixture
+def replicas_balance():
+    return 'round_robin'
+
+
+@pytest.mark.asyncio
+@pytest.fixture
+async def memory_data_source(replicas_balance):
+    memory_data_source = await make_aioredis_data_source(
+        'redis://',
+        replicas=[['redis://localhost/1', 'redis://localhost/2']],
+        replicas_balance=replicas_balance,
+    )
+    nodes = [memory_data_source] + list(memory_data_source.replicas)
+
+    for node in nodes:
+        await AioRedisDataSource.delete(node, KEY)
+
+    yield memory_data_source
+
+    for node in nodes:
+        await AioRedisDataSource.delete(node, KEY)
+
+    memory_data_source.close()
+    await memory_data_source.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_should_write_on_primary(memory_data_source):
+    await memory_data_source.set(KEY, 'primary')
+
+    assert isinstance(memory_data_source, ReplicasAioRedisDataSource)
+    assert await AioRedisDataSource.get(memory_data_source, KEY) == b'primary'
+    assert await memory_data_source.replicas[0].get(KEY) is None
+    assert await memory_data_source.replicas[1].get(KEY) is None
+
+
+@pytest.mark.asyncio
+async def test_should_read_from_replicas_round_robin(memory_data_source):
+    await memory_data_source.set(KEY, 'primary')
+    await memory_data_source.replicas[0].set(KEY, 'replica1')
+    await memory_data_source.replicas[1].set(KEY, 'replica2')
+
+    values = [await memory_data_source.get(KEY) for _ in range(4)]
+
+    assert values == [b'replica2', b'replica1', b'replica2', b'replica1']
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('replicas_balance', ['least_loaded'])
+async def test_should_read_from_least_loaded_replica(memory_data_source):
+    await memory_data_source.replicas[0].hmset(KEY, 'id', 'replica1')
+    await memory_data_source.replicas[1].hmset(KEY, 'id', 'replica2')
+
+    memory_data_source.replicas_pending[0] = 1
+
+    assert await memory_data_source.hgetall(KEY) == {b'id': b'replica2'}
+
+    memory_data_source.replicas_pending[0] = 0
+    memory_data_source.replicas_pending[1] = 1
+
+    assert await memory_data_source.hmget(KEY, 'id') == [b'replica1']
+    assert memory_data_source.replicas_pending == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_should_get_primary_data_source(memory_data_source):
+    await memory_data_source.set(KEY, 'primary')
+    primary = memory_data_source.primary_data_source()
+
+    assert type(primary) is AioRedisDataSource
+    assert await primary.get(KEY) == b'primary'
+    assert await primary.exists(KEY) == 1
+
+
+class FakeAioRedisDataSource(AioRedisDataSource):
+    ...
+
+
+@pytest.mark.asyncio
+async def test_should_keep_primary_data_source_options():
+    memory_data_source = await make_aioredis_data_source(
+        'redis://',
+        replicas=[['redis://localhost/1']],
+        single_commands_factory=FakeAioRedisDataSource,
+        auto_pipelining=True,
+    )
+    primary = memory_data_source.primary_data_source()
+
+    assert type(primary) is FakeAioRedisDataSource
+    assert primary.auto_pipelining
+    assert await primary.exists(KEY) == 0
+
+    primary.close()
+    await primary.wait_closed()
+
+    assert memory_data_source.closed
+    assert all(replica.closed for replica in memory_data_source.replicas)
+
+
+@pytest.mark.asyncio
+async def test_should_get_shards_primary_data_source():
+    memory_data_source = await make_aioredis_data_source(
+        'redis://', 'redis://localhost/1', replicas=[['redis://localhost/2']],
+    )
+    primary = memory_data_source.primary_data_source()
+
+    assert isinstance(primary, ShardsAioRedisDataSource)
+    assert [type(node) for node in primary.hashring.nodes] == [
+        AioRedisDataSource,
+        AioRedisDataSource,
+    ]
+    assert primary.hashring.names == memory_data_source.hashring.names
+    assert primary.hashring.nodes[1] is memory_data_source.hashring.nodes[1]
+
+    memory_data_source.close()
+    await memory_data_source.wait_closed()
+
+
+@dataclasses.dataclass
+class FakeEntity:
+    id: str
+    value: str
+
+
+class FakeRepository(HashRepository[FakeEntity, str]):
+    name = 'fake'
+    key_attrs = ('id',)
+
+
+class FakePrimaryRepository(FakeRepository):
+    read_from_replicas = False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'repository_cls,value',
+    [(FakeRepository, 'replica'), (FakePrimaryRepository, 'primary')],
+)
+async def test_should_opt_out_replicas_reads_by_repository(
+    memory_data_source, repository_cls, value
+):
+    repository = repository_cls(
+        memory_data_source=memory_data_source,
+        fallback_data_source=DictFallbackDataSource(),
+        expire_time=1,
+    )
+    await repository.add(FakeEntity('replicas', 'primary'), memory_always=True)
+
+    for replica in memory_data_source.replicas:
+        await replica.hmset(KEY, 'id', 'replicas', 'value', 'replica')
+
+    entity = await repository.query('replicas').entity
+
+    assert entity == FakeEntity('replicas', value)
+
+
+@pytest.mark.asyncio
+async def test_should_check_cached_and_not_found_keys_on_primary(
+    memory_data_source,
+):
+    repository = FakeRepository(
+        memory_data_source=memory_data_source,
+        fallback_data_source=DictFallbackDataSource(),
+        expire_time=1,
+    )
+    primary = memory_data_source.primary_data_source()
+    await repository.add(FakeEntity('replicas', 'old'), memory_always=True)
+
+    for replica in memory_data_source.replicas:
+        await replica.delete(KEY)
+
+    await repository.add(FakeEntity('replicas', 'new'))
+
+    assert await primary.hmget(KEY, 'value') == [b'new']
+
+    await primary.delete(KEY)
+    await repository.set_fallback_not_found(repository.query('replicas'))
+
+    assert await repository.already_got_not_found(repository.query('replicas'))
@@ -0,0 +1,276 @@
+import dataclasses
+
+import pytest
+
+from dbdaora import (
+    ConsistentHashRing,
+    DictFallbackDataSource,
+    HashRepository,
+    RedisAsyncioDataSource,
+    ReplicasRedisAsyncioDataSource,
+    ShardsRedisAsyncioDataSource,
+    make_redis_asyncio_data_source,
+)
+
+
+if make_redis_asyncio_data_source is None:
+    pytest.skip('redis is not installed', allow_module_level=True)
+
+
+KEYS = [f'fake:redis_asyncio:{i}' for i in range(10)]
+
+
+@pytest.fixture
+def protocol():
+    return 3
+
+
+@pytest.fixture
+def hiredis():
+    return None
+
+
+@pytest.mark.asyncio
+@pytest.fixture
+async def memory_data_source(protocol, hiredis):
+    memory_data_source = await make_redis_asyncio_data_source(
+        'redis://', protocol=protocol, hiredis=hiredis, pool_minsize=2
+    )
+
+    for key in KEYS:
+        await memory_data_source.delete(key)
+
+    yield memory_data_source
+    memory_data_source.close()
+    await memory_data_source.wait_closed()
+
+
+@pytest.mark.asyncio
+@pytest.fixture
+async def shards_data_source():
+    memory_data_source = await make_redis_asyncio_data_source(
+        'redis://',
+        'redis://localhost/1',
+        'redis://localhost/2',
+        hashring_cls=ConsistentHashRing,
+    )
+
+    for key in KEYS:
+        await memory_data_source.delete(key)
+
+    yield memory_data_source
+    memory_data_source.close()
+    await memory_data_source.wait_closed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('protocol', [2, 3])
+@pytest.mark.parametrize('hiredis', [None, False])
+async def test_should_set_and_get(memory_data_source):
+    await memory_data_source.set(KEYS[0], 'value')
+
+    assert isinstance(memory_data_source, RedisAsyncioDataSource)
+    assert await memory_data_source.get(KEYS[0]) == b'value'
+    assert await memory_data_source.exists(KEYS[0]) == 1
+    assert await memory_data_source.mget(KEYS[0], KEYS[1]) == [b'value', None]
+
+
+@pytest.mark.asyncio
+async def test_should_fill_pool(memory_data_source):
+    pool = memory_data_source.client.connection_pool
+
+    assert len(pool._available_connections) == 2
+    assert pool.max_connections == 10
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('protocol', [2, 3])
+async def test_should_hmset_and_hgetall(memory_data_source):
+    await memory_data_source.hmset(KEYS[0], 'id', 'fake', 'integer', '1')
+
+    assert await memory_data_source.hgetall(KEYS[0]) == {
+        b'id': b'fake',
+        b'integer': b'1',
+    }
+    assert await memory_data_source.hmget(KEYS[0], 'integer', 'other') == [
+        b'1',
+        None,
+    ]
+    assert await memory_data_source.hgetall_many(KEYS[:2]) == [
+        {b'id': b'fake', b'integer': b'1'},
+        {},
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('protocol', [2, 3])
+async def test_should_zadd_and_zrange(memory_data_source):
+    await memory_data_source.zadd(KEYS[0], 1, 'one', 2, 'two', 3, 'three')
+
+    assert await memory_data_source.zrange(KEYS[0]) == [
+        b'one',
+        b'two',
+        b'three',
+    ]
+    assert await memory_data_source.zrevrange(
+        KEYS[0], 0, 1, withscores=True
+    ) == [(b'three', 3.0), (b'two', 2.0)]
+    assert await memory_data_source.zrangebyscore(
+        KEYS[0], min=2, withscores=True
+    ) == [(b'two', 2.0), (b'three', 3.0)]
+    assert await memory_data_source.zrevrangebyscore(
+        KEYS[0], max=2, count=1
+    ) == [b'two']
+    assert await memory_data_source.zcard(KEYS[0]) == 3
+    assert await memory_data_source.zrange(KEYS[1]) == []
+
+
+@pytest.mark.asyncio
+async def test_should_expire_and_exists_many(memory_data_source):
+    await memory_data_source.set(KEYS[0], 'value')
+    await memory_data_source.expire_many(KEYS[:2], 60)
+
+    assert await memory_data_source.exists_many(KEYS[:2]) == [1, 0]
+    assert 0 < await memory_data_source.client.ttl(KEYS[0]) <= 60
+
+
+@pytest.mark.asyncio
+async def test_should_execute_multi_exec(memory_data_source):
+    multi_exec = memory_data_source.multi_exec()
+    delete_future = multi_exec.delete(KEYS[0])
+    hmset_future = multi_exec.hmset(KEYS[0], 'id', 'fake')
+    zadd_future = multi_exec.zadd(KEYS[1], 1, 'one')
+
+    results = await multi_exec.execute()
+
+    assert results == [0, 1, 1]
+    assert await delete_future == 0
+    assert await hmset_future == 1
+    assert await zadd_future == 1
+    assert await memory_data_source.hgetall(KEYS[0]) == {b'id': b'fake'}
+
+
+@pytest.mark.asyncio
+async def test_should_georadius(memory_data_source):
+    await memory_data_source.geoadd(
+        KEYS[0], -46.6333, -23.5505, 'sao_paulo', -43.1729, -22.9068, 'rio'
+    )
+
+    members = await memory_data_source.georadius(
+        KEYS[0], -46.6333, -23.5505, 100, 'km', with_dist=True, sort='ASC'
+    )
+    members_coords = await memory_data_source.georadius(
+        KEYS[0], -46.6333, -23.5505, 1000, 'km', with_coord=True, sort='ASC'
+    )
+
+    assert [member.member for member in members] == [b'sao_paulo']
+    assert members[0].dist == pytest.approx(0, abs=0.01)
+    assert [member.member for member in members_coords] == [
+        b'sao_paulo',
+        b'rio',
+    ]
+    assert members_coords[1].coord.longitude == pytest.approx(
+        -43.1729, abs=0.001
+    )
+    assert (
+        await memory_data_source.georadiusbymember(KEYS[0], 'other', 10) == []
+    )
+    assert await memory_data_source.georadius_many(
+        KEYS[0], [(-46.6333, -23.5505), (-43.1729, -22.9068)], 10, 'km'
+    ) == [[b'sao_paulo'], [b'rio']]
+
+
+@pytest.mark.asyncio
+async def test_should_route_keys_by_shards(shards_data_source):
+    for key in KEYS:
+        await shards_data_source.set(key, key)
+
+    assert isinstance(shards_data_source, ShardsRedisAsyncioDataSource)
+    assert len({id(shards_data_source.get_client(k)) for k in KEYS}) > 1
+    assert await shards_data_source.mget(*KEYS) == [
+        key.encode() for key in KEYS
+    ]
+
+    for key in KEYS:
+        client = shards_data_source.get_client(key)
+        assert await client.client.get(key) == key.encode()
+
+
+@pytest.mark.asyncio
+async def test_should_execute_shards_multi_exec(shards_data_source):
+    multi_exec = shards_data_source.multi_exec()
+
+    for key in KEYS:
+        multi_exec.hmset(key, 'id', key)
+
+    await multi_exec.execute()
+
+    assert await shards_data_source.hgetall_many(KEYS) == [
+        {b'id': key.encode()} for key in KEYS
+    ]
+
+
+@dataclasses.dataclass
+class FakeEntity:
+    id: str
+    integer: int
+
+
+class FakeRepository(HashRepository[FakeEntity, str]):
+    name = 'fake:redis_asyncio'
+
+
+@pytest.mark.asyncio
+async def test_should_add_and_get_entity_by_repository(memory_data_source):
+    repository = FakeRepository(
+        memory_data_source=memory_data_source,
+        fallback_data_source=DictFallbackDataSource(),
+        expire_time=1,
+    )
+    await repository.add(FakeEntity('0', 1), memory_always=True)
+    repository.fallback_data_source.db.clear()
+
+    assert await repository.query('0').entity == FakeEntity('0', 1)
+
+
+class FakeRedisAsyncioDataSource(RedisAsyncioDataSource):
+    ...
+
+
+@pytest.mark.asyncio
+async def test_should_read_from_replicas(mocker):
+    memory_data_source = await make_redis_asyncio_data_source(
+        'redis://',
+        replicas=[['redis://localhost/1', 'redis://localhost/2']],
+        replicas_balance='least_loaded',
+        single_commands_factory=FakeRedisAsyncioDataSource,
+    )
+    nodes = [memory_data_source, *memory_data_source.replicas]
+
+    try:
+        for i, node in enumerate(nodes):
+            await RedisAsyncioDataSource.set(node, KEYS[0], f'node{i}')
+
+        assert isinstance(memory_data_source, ReplicasRedisAsyncioDataSource)
+        assert await memory_data_source.get(KEYS[0]) == b'node1'
+
+        memory_data_source.replicas_pending[0] = 1
+
+        assert await memory_data_source.get(KEYS[0]) == b'node2'
+        assert await memory_data_source.mget(KEYS[0]) == [b'node2']
+
+        await memory_data_source.set(KEYS[0], 'primary')
+        primary = memory_data_source.primary_data_source()
+
+        assert type(primary) is FakeRedisAsyncioDataSource
+        assert await primary.get(KEYS[0]) == b'primary'
+
+    finally:
+        for node in nodes:
+            await RedisAsyncioDataSource.delete(node, KEYS[0])
+
+    closes = [mocker.spy(node.client, 'aclose') for node in nodes]
+    primary.close()
+    await primary.wait_closed()
+
+    assert [close.call_count for close in closes] == [1, 1, 1]
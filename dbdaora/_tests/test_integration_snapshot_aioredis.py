@@ -0,0 +1,250 @@
+import asyncio
+import dataclasses
+import gzip
+
+import pytest
+from aioredis import ReplyError
+
+from dbdaora import (
+    DictFallbackDataSource,
+    HashRepository,
+    ShardsAioRedisDataSource,
+    dump_snapshot,
+    make_aioredis_data_source,
+    restore_snapshot,
+)
+from dbdaora.exceptions import InvalidSnapshotError
+from dbdaora.snapshot import main
+
+
+SHARDS_URIS = ['redis://', 'redis://localhost/1', 'redis://localhost/2']
+
+
+@dataclasses.dataclass
+class FakeEntity:
+    id: str
+    value: str
+
+
+class FakeRepository(HashRepository[FakeEntity, str]):
+    name = 'fake_snapshot'
+
+
+async def make_repository(*uris):
+    return FakeRepository(
+        memory_data_source=await make_aioredis_data_source(*uris),
+        fallback_data_source=DictFallbackDataSource(),
+        expire_time=60,
+    )
+
+
+async def make_shards_repository():
+    return await make_repository(*SHARDS_URIS)
+
+
+async def scan(data_source):
+    return [
+        key
+        async for keys in data_source.scan_keys('fake_snapshot:*')
+        for key in keys
+    ]
+
+
+async def ttl(data_source, key):
+    if isinstance(data_source, ShardsAioRedisDataSource):
+        data_source = data_source.get_client(key)
+
+    return await data_source.ttl(key)
+
+
+async def clean(repository):
+    data_source = repository.memory_data_source
+    nodes = (
+        data_source.hashring.nodes
+        if isinstance(data_source, ShardsAioRedisDataSource)
+        else [data_source]
+    )
+
+    for node in nodes:
+        for key in await scan(node):
+            await node.delete(key)
+
+
+@pytest.fixture
+def uris():
+    return ['redis://']
+
+
+@pytest.mark.asyncio
+@pytest.fixture
+async def repository(uris):
+    repository = await make_repository(*uris)
+    await clean(repository)
+
+    for i in range(20):
+        await repository.add(
+            FakeEntity(str(i), f'value{i}'), memory_always=i < 10
+        )
+
+    await repository.memory_data_source.delete('fake_snapshot:9')
+    await repository.memory_data_source.set('fake_snapshot:string', 'string')
+    await repository.memory_data_source.set('other:0', 'other')
+
+    yield repository
+
+    await clean(repository)
+    await repository.memory_data_source.delete('other:0')
+    repository.memory_data_source.close()
+    await repository.memory_data_source.wait_closed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('uris', [['redis://'], SHARDS_URIS])
+async def test_should_dump_and_restore(repository, tmp_path):
+    path = str(tmp_path / 'snapshot')
+    data_source = repository.memory_data_source
+
+    assert await dump_snapshot(repository, path, count=3) == 10
+
+    await clean(repository)
+
+    assert await data_source.get('fake_snapshot:string') is None
+    assert await restore_snapshot(repository, path, batch_size=4) == 10
+    assert await data_source.get('fake_snapshot:string') == b'string'
+    assert await data_source.hgetall('fake_snapshot:0') == {
+        b'id': b'0',
+        b'value': b'value0',
+    }
+    assert 55 < await ttl(data_source, 'fake_snapshot:0') <= 60
+    assert await data_source.exists('fake_snapshot:9') == 0
+    assert await data_source.exists('fake_snapshot:10') == 0
+    assert await repository.query('5').entity == FakeEntity('5', 'value5')
+
+
+@pytest.mark.asyncio
+async def test_should_restore_on_shards(repository, tmp_path):
+    path = str(tmp_path / 'snapshot')
+    await dump_snapshot(repository, path)
+    await clean(repository)
+
+    shards_repository = await make_shards_repository()
+    await clean(shards_repository)
+
+    try:
+        assert await restore_snapshot(shards_repository, path) == 10
+
+        shards = shards_repository.memory_data_source.hashring.nodes
+        keys_by_shard = [await scan(shard) for shard in shards]
+
+        assert sum(len(keys) for keys in keys_by_shard) == 10
+        assert len([keys for keys in keys_by_shard if keys]) > 1
+        assert await shards_repository.query('3').entity == FakeEntity(
+            '3', 'value3'
+        )
+
+    finally:
+        await clean(shards_repository)
+        shards_repository.memory_data_source.close()
+        await shards_repository.memory_data_source.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_should_replace_existing_keys(repository, tmp_path):
+    path = str(tmp_path / 'snapshot')
+    await dump_snapshot(repository, path)
+    await repository.memory_data_source.set('fake_snapshot:string', 'new')
+
+    assert await restore_snapshot(repository, path, replace=True) == 10
+    assert (
+        await repository.memory_data_source.get('fake_snapshot:string')
+        == b'string'
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('uris', [['redis://'], SHARDS_URIS])
+async def test_should_skip_existing_keys(repository, tmp_path):
+    path = str(tmp_path / 'snapshot')
+    data_source = repository.memory_data_source
+    await dump_snapshot(repository, path)
+    await data_source.delete('fake_snapshot:0')
+    await data_source.delete('fake_snapshot:1')
+    await data_source.set('fake_snapshot:string', 'new')
+
+    assert await restore_snapshot(repository, path, batch_size=4) == 2
+    assert await data_source.get('fake_snapshot:string') == b'new'
+    assert await repository.query('1').entity == FakeEntity('1', 'value1')
+
+
+@pytest.mark.asyncio
+async def test_should_raise_restore_errors(repository, tmp_path):
+    path = str(tmp_path / 'snapshot')
+    await dump_snapshot(repository, path)
+    await clean(repository)
+
+    with gzip.open(path, 'rb') as file:
+        data = file.read()
+
+    with gzip.open(path, 'wb') as file:
+        file.write(data[:-1] + bytes([data[-1] ^ 0xFF]))
+
+    with pytest.raises(ReplyError):
+        await restore_snapshot(repository, path)
+
+
+@pytest.mark.asyncio
+async def test_should_skip_keys_expired_after_dump(
+    repository, tmp_path, mocker
+):
+    path = str(tmp_path / 'snapshot')
+    await dump_snapshot(repository, path)
+    await clean(repository)
+    now = mocker.patch('dbdaora.snapshot.now')
+    now.return_value = 10 ** 13
+
+    assert await restore_snapshot(repository, path) == 1
+    assert (
+        await repository.memory_data_source.ttl('fake_snapshot:string') == -1
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_raise_invalid_snapshot_error(repository, tmp_path):
+    path = tmp_path / 'snapshot'
+    await dump_snapshot(repository, str(path))
+
+    with gzip.open(path, 'rb') as file:
+        data = file.read()
+
+    with gzip.open(path, 'wb') as file:
+        file.write(data[:-1])
+
+    with pytest.raises(InvalidSnapshotError):
+        await restore_snapshot(repository, str(path))
+
+    with gzip.open(path, 'wb') as file:
+        file.write(b'invalid')
+
+    with pytest.raises(InvalidSnapshotError):
+        await restore_snapshot(repository, str(path))
+
+
+def test_should_dump_and_restore_by_command_line(tmp_path, capsys):
+    path = str(tmp_path / 'snapshot')
+
+    async def run(*entities):
+        repository = await make_shards_repository()
+        await clean(repository)
+
+        for entity in entities:
+            await repository.add(entity, memory_always=True)
+
+        repository.memory_data_source.close()
+        await repository.memory_data_source.wait_closed()
+
+    asyncio.run(run(FakeEntity('0', 'value0'), FakeEntity('1', 'value1')))
+    main(['dump', f'{__name__}:make_shards_repository', path])
+    main(['restore', f'{__name__}:make_shards_repository', path, '--replace'])
+    asyncio.run(run())
+
+    assert capsys.readouterr().err == '2 keys\n2 keys\n'
@@ -0,0 +1,65 @@
+import pytest
+from aioredis import ReplyError
+
+from dbdaora import ClusterHashRing
+from dbdaora.data_sources.memory.aioredis_cluster import (
+    CLUSTER_SLOTS,
+    crc16,
+    key_slot,
+    parse_redirection,
+)
+
+
+def test_should_compute_crc16_xmodem():
+    assert crc16(b'123456789') == 0x31C3
+    assert crc16(b'') == 0
+
+
+@pytest.mark.parametrize(
+    'key,slot', [('foo', 12182), ('bar', 5061), (b'foo', 12182)]
+)
+def test_should_compute_key_slot(key, slot):
+    assert key_slot(key) == slot
+
+
+def test_should_compute_key_slot_by_hash_tag():
+    assert key_slot('{user1000}.following') == key_slot('user1000')
+    assert key_slot('{user1000}.followers') == key_slot('user1000')
+    assert key_slot('foo{}{bar}') == key_slot('foo{}{bar}')
+    assert key_slot('foo{}{bar}') != key_slot('bar')
+
+
+def test_should_parse_redirections():
+    assert parse_redirection(ReplyError('MOVED 3999 127.0.0.1:6381')) == (
+        'MOVED',
+        3999,
+        '127.0.0.1:6381',
+    )
+    assert parse_redirection(ReplyError('ASK 3999 127.0.0.1:6381')) == (
+        'ASK',
+        3999,
+        '127.0.0.1:6381',
+    )
+    assert parse_redirection(ReplyError('ERR unknown command')) is None
+
+
+def test_should_route_keys_by_slots():
+    slots = [0] * (CLUSTER_SLOTS // 2) + [1] * (CLUSTER_SLOTS // 2)
+    hashring = ClusterHashRing(['node1', 'node2'], slots=slots)
+
+    assert hashring.get_node('bar') == 'node1'
+    assert hashring.get_node('foo') == 'node2'
+    assert hashring.get_node('{foo}:bar') == 'node2'
+
+
+def test_should_add_node():
+    hashring = ClusterHashRing(['node1'], names=['localhost:7000'])
+
+    index = hashring.add_node('node2', 'localhost:7001')
+    hashring.slots[key_slot('foo')] = index
+
+    assert hashring.nodes == ['node1', 'node2']
+    assert hashring.names == ['localhost:7000', 'localhost:7001']
+    assert hashring.nodes_size == 2
+    assert hashring.get_node('foo') == 'node2'
+    assert hashring.get_node('bar') == 'node1'
@@ -0,0 +1,84 @@
+import zlib
+
+import pytest
+
+from dbdaora import Compression
+from dbdaora import compression as compression_module
+from dbdaora.exceptions import InvalidCompressionError
+
+
+@pytest.fixture
+def compression():
+    return Compression(min_size=16)
+
+
+def test_should_not_compress_small_values(compression):
+    assert compression.encode(b'small') == b'small'
+    assert compression.encode('small') == b'small'
+    assert compression.decode(b'small') == b'small'
+
+
+def test_should_compress_large_values(compression):
+    value = b'large value' * 10
+    encoded = compression.encode(value)
+
+    assert encoded[0] == 0xF9
+    assert zlib.decompress(encoded[1:]) == value
+    assert compression.decode(encoded) == value
+
+
+def test_should_not_compress_values_which_does_not_shrink(compression):
+    value = bytes(range(32))
+
+    assert compression.encode(value) == value
+
+
+def test_should_escape_values_starting_with_header_byte(compression):
+    value = b'\xff\x00'
+    encoded = compression.encode(value)
+
+    assert encoded == b'\xf8\xff\x00'
+    assert compression.decode(encoded) == value
+
+
+def test_should_not_change_non_binary_values(compression):
+    assert compression.encode(1) == 1
+    assert compression.decode(None) is None
+    assert compression.decode(b'') == b''
+
+
+def test_should_keep_fallback_text_values_as_text(compression):
+    value = 'large text' * 10
+    encoded = compression.encode_fallback(value)
+
+    assert isinstance(encoded, bytes)
+    assert encoded[0] == 0xFD
+    assert compression.decode_fallback(encoded) == value
+    assert compression.encode_fallback('small') == 'small'
+    assert compression.encode_fallback([1, 2]) == [1, 2]
+    assert compression.decode_fallback(
+        compression.encode_fallback(b'large' * 10)
+    ) == (b'large' * 10)
+
+
+def test_should_raise_error_for_invalid_algorithm():
+    with pytest.raises(InvalidCompressionError):
+        Compression(algorithm='invalid')
+
+
+@pytest.mark.parametrize(
+    'algorithm,module_name', [('lz4', 'lz4_frame'), ('zstd', 'zstandard')]
+)
+def test_should_compress_with_optional_algorithms(
+    algorithm, module_name, mocker
+):
+    if getattr(compression_module, module_name) is None:
+        with pytest.raises(InvalidCompressionError):
+            Compression(algorithm=algorithm)
+
+        return
+
+    compression = Compression(algorithm=algorithm, min_size=16)
+    value = b'large value' * 10
+
+    assert compression.decode(compression.encode(value)) == value
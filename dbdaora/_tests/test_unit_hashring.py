@@ -0,0 +1,168 @@
+from collections import Counter
+from hashlib import md5
+from zlib import crc32
+
+import pytest
+
+from dbdaora import ConsistentHashRing, HashRing, JumpHashRing
+from dbdaora import hashring as hashring_module
+from dbdaora.hashring import crc32_hash, hash_tag, jump_hash, xxhash_hash
+
+
+KEYS = [f'fake:{i}' for i in range(10_000)]
+
+
+def test_should_keep_modulo_mapping():
+    hashring = HashRing(['node0', 'node1', 'node2'])
+
+    assert [hashring.get_node(key) for key in KEYS] == [
+        f'node{int(md5(key.encode()).hexdigest(), 16) % 3}' for key in KEYS
+    ]
+    assert hashring.names == ['0', '1', '2']
+
+
+@pytest.mark.parametrize('hashring_cls', [ConsistentHashRing, JumpHashRing])
+def test_should_distribute_keys(hashring_cls):
+    hashring = hashring_cls(['node0', 'node1', 'node2', 'node3'])
+    counts = Counter(hashring.get_node(key) for key in KEYS)
+
+    assert set(counts) == {'node0', 'node1', 'node2', 'node3'}
+    assert all(count > len(KEYS) / 4 * 0.8 for count in counts.values())
+
+
+@pytest.mark.parametrize('hashring_cls', [ConsistentHashRing, JumpHashRing])
+def test_should_remap_few_keys_when_adding_a_node(hashring_cls):
+    nodes = ['node0', 'node1', 'node2', 'node3']
+    hashring = hashring_cls(nodes)
+    new_hashring = hashring_cls(nodes + ['node4'])
+
+    moved = [
+        key
+        for key in KEYS
+        if hashring.get_node(key) != new_hashring.get_node(key)
+    ]
+
+    assert len(moved) < len(KEYS) / 5 * 1.25
+    assert all(new_hashring.get_node(key) == 'node4' for key in moved)
+
+
+def test_should_remap_only_removed_node_keys_by_names():
+    hashring = ConsistentHashRing(
+        ['node0', 'node1', 'node2'],
+        names=['redis://0', 'redis://1', 'redis://2'],
+    )
+    new_hashring = ConsistentHashRing(
+        ['node0', 'node2'], names=['redis://0', 'redis://2']
+    )
+
+    assert all(
+        new_hashring.get_node(key) == hashring.get_node(key)
+        for key in KEYS
+        if hashring.get_node(key) != 'node1'
+    )
+
+
+def test_should_get_same_nodes_for_same_names():
+    hashring = ConsistentHashRing(['node0', 'node1'], names=['a', 'b'])
+    other_hashring = ConsistentHashRing(['other0', 'other1'], names=['a', 'b'])
+
+    assert [hashring.get_index(key) for key in KEYS] == [
+        other_hashring.get_index(key) for key in KEYS
+    ]
+
+
+def test_should_get_jump_hash_buckets():
+    assert jump_hash(0, 1) == 0
+    assert [jump_hash(key, 10) for key in (1, 2, 3, 2 ** 64 - 1)] == [
+        jump_hash(key, 10) for key in (1, 2, 3, 2 ** 64 - 1)
+    ]
+    assert all(0 <= jump_hash(key, 10) < 10 for key in range(1000))
+
+
+def test_should_map_keys_with_hash_function():
+    class Crc32HashRing(HashRing):
+        hash_function = staticmethod(crc32_hash)
+
+    hashring = Crc32HashRing(['node0', 'node1', 'node2'])
+
+    assert [hashring.get_node(key) for key in KEYS] == [
+        f'node{crc32(key.encode()) % 3}' for key in KEYS
+    ]
+
+
+@pytest.mark.parametrize('hashring_cls', [ConsistentHashRing, JumpHashRing])
+def test_should_distribute_keys_with_crc32(hashring_cls):
+    class Crc32HashRing(hashring_cls):
+        hash_function = staticmethod(crc32_hash)
+
+    hashring = Crc32HashRing(['node0', 'node1', 'node2', 'node3'])
+    counts = Counter(hashring.get_node(key) for key in KEYS)
+
+    assert all(count > len(KEYS) / 4 * 0.8 for count in counts.values())
+
+
+def test_should_hash_with_xxhash():
+    if hashring_module.xxhash is None:
+        pytest.skip('xxhash is not installed')
+
+    assert xxhash_hash(b'fake') == hashring_module.xxhash.xxh64_intdigest(
+        b'fake'
+    )
+
+
+def test_should_memoize_nodes_when_cache_size_is_set():
+    class CachedHashRing(ConsistentHashRing):
+        cache_size = 2
+
+    hashring = CachedHashRing(['node0', 'node1'])
+    uncached_hashring = ConsistentHashRing(['node0', 'node1'])
+
+    nodes = [hashring.get_node(key) for key in ('fake', 'fake', 'fake2')]
+
+    assert nodes == [
+        uncached_hashring.get_node(key) for key in ('fake', 'fake', 'fake2')
+    ]
+    assert hashring.get_node.cache_info().hits == 1
+    assert not hasattr(uncached_hashring.get_node, 'cache_info')
+
+
+@pytest.mark.parametrize(
+    'key,tag',
+    [
+        ('fake:{user1}:item1', 'user1'),
+        ('fake:not-found:{user1}:item1', 'user1'),
+        ('{user1}', 'user1'),
+        ('fake:{}:item1', 'fake:{}:item1'),
+        ('fake:{user1', 'fake:{user1'),
+        ('fake:}user1{', 'fake:}user1{'),
+        ('fake:{{user1}}', '{user1'),
+    ],
+)
+def test_should_get_hash_tag(key, tag):
+    assert hash_tag(key) == tag
+
+
+class TaggedHashRing(HashRing):
+    hash_tags = True
+
+
+@pytest.mark.parametrize(
+    'hashring_cls', [TaggedHashRing, ConsistentHashRing, JumpHashRing]
+)
+def test_should_route_tagged_keys_to_the_same_node(hashring_cls):
+    hashring = hashring_cls([f'node{i}' for i in range(8)])
+
+    for i in range(100):
+        assert (
+            hashring.get_node(f'fake:{{user{i}}}:item1')
+            == hashring.get_node(f'fake:not-found:{{user{i}}}:item2')
+            == hashring.get_node(f'user{i}')
+        )
+
+
+def test_should_not_use_hash_tags_by_default_on_hashring():
+    hashring = HashRing([f'node{i}' for i in range(8)])
+
+    assert hashring.hash_key('fake:{user1}') == int(
+        md5(b'fake:{user1}').hexdigest(), 16
+    )
@@ -0,0 +1,48 @@
+import pytest
+
+from dbdaora import (
+    CompressedMemoryDataSource,
+    Compression,
+    DictMemoryDataSource,
+)
+
+
+@pytest.fixture
+async def memory_data_source():
+    memory_data_source = DictMemoryDataSource()
+    await memory_data_source.set('fake:1', b'value1')
+    await memory_data_source.hmset('fake:2', 'id', 'fake2')
+    return memory_data_source
+
+
+@pytest.mark.asyncio
+async def test_should_get_many_keys(memory_data_source):
+    assert await memory_data_source.mget('fake:1', 'fake:3') == [
+        b'value1',
+        None,
+    ]
+    assert await memory_data_source.hgetall_many(['fake:2', 'fake:3']) == [
+        {b'id': b'fake2'},
+        {},
+    ]
+    assert await memory_data_source.exists_many(
+        ['fake:1', 'fake:2', 'fake:3']
+    ) == [1, 1, 0]
+
+
+@pytest.mark.asyncio
+async def test_should_decompress_many_keys(memory_data_source):
+    compressed = CompressedMemoryDataSource(
+        memory_data_source, Compression(min_size=16)
+    )
+    await compressed.set('fake:4', b'large value' * 10)
+    await compressed.hmset('fake:5', 'text', b'large value' * 10)
+
+    assert await compressed.mget('fake:1', 'fake:4') == [
+        b'value1',
+        b'large value' * 10,
+    ]
+    assert await compressed.hgetall_many(['fake:2', 'fake:5']) == [
+        {b'id': b'fake2'},
+        {b'text': b'large value' * 10},
+    ]
@@ -0,0 +1,190 @@
+import dataclasses
+from typing import Optional
+
+import pytest
+
+from dbdaora import (
+    DictFallbackDataSource,
+    DictMemoryDataSource,
+    HashRepository,
+    SortedSetData,
+    SortedSetRepository,
+    warmup_repository,
+)
+from dbdaora.exceptions import WarmupNotSupportedError
+from dbdaora.warmup import main
+
+
+@dataclasses.dataclass
+class FakeEntity:
+    id: str
+    other_id: str
+    integer: int
+    boolean: bool
+
+
+class FakeRepository(HashRepository[FakeEntity, str]):
+    name = 'fake'
+    key_attrs = ('other_id', 'id')
+
+
+FALLBACK_DB = {
+    f'fake:other{i}:{i}': {
+        'id': str(i),
+        'other_id': f'other{i}',
+        'integer': i,
+        'boolean': i % 2 == 0,
+    }
+    for i in range(10)
+}
+
+
+def make_repository():
+    return FakeRepository(
+        memory_data_source=DictMemoryDataSource(),
+        fallback_data_source=DictFallbackDataSource(dict(FALLBACK_DB)),
+        expire_time=60,
+    )
+
+
+@pytest.fixture
+def repository():
+    return make_repository()
+
+
+@pytest.mark.asyncio
+async def test_should_warmup_all_fallback_entities(repository, mocker):
+    progress = mocker.MagicMock()
+
+    warmup_progress = await warmup_repository(
+        repository, chunk_size=3, concurrency=2, progress=progress
+    )
+
+    assert warmup_progress.written == 10
+    assert warmup_progress.not_found == 0
+    assert warmup_progress.chunks == 4
+    assert progress.call_count == 4
+    assert repository.memory_data_source.db['fake:other2:2'] == {
+        b'id': b'2',
+        b'other_id': b'other2',
+        b'integer': b'2',
+        b'boolean': b'1',
+    }
+    assert (
+        repository.memory_data_source.db['fake:other3:3'][b'boolean'] == b'0'
+    )
+    assert len(repository.memory_data_source.db) == 10
+
+    repository.fallback_data_source.db.clear()
+
+    assert await repository.query('other1', '1').entity == FakeEntity(
+        '1', 'other1', 1, False
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_warmup_ids(repository, mocker):
+    expire = mocker.spy(repository.memory_data_source, 'expire')
+
+    warmup_progress = await warmup_repository(
+        repository, [('other1', '1'), ('other2', '2'), ('other', 'missing')]
+    )
+
+    assert warmup_progress.written == 2
+    assert warmup_progress.not_found == 1
+    assert sorted(repository.memory_data_source.db) == [
+        'fake:other1:1',
+        'fake:other2:2',
+    ]
+    assert expire.call_args_list == [
+        mocker.call('fake:other1:1', 60),
+        mocker.call('fake:other2:2', 60),
+    ]
+
+
+@dataclasses.dataclass
+class FakeSortedSetEntity:
+    id: str
+    data: SortedSetData
+    max_size: Optional[int] = None
+
+
+class FakeSortedSetRepository(SortedSetRepository[FakeSortedSetEntity, str]):
+    name = 'fake_sorted_set'
+    key_attrs = ('id',)
+
+
+@pytest.fixture
+def sorted_set_repository():
+    return FakeSortedSetRepository(
+        memory_data_source=DictMemoryDataSource(),
+        fallback_data_source=DictFallbackDataSource(
+            {'fake_sorted_set:1': {'data': [b'a', 1, b'b', 2]}}
+        ),
+        expire_time=60,
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_raise_not_supported_error_for_sorted_set_without_ids(
+    sorted_set_repository,
+):
+    with pytest.raises(WarmupNotSupportedError) as exc_info:
+        await warmup_repository(sorted_set_repository)
+
+    assert exc_info.value.args == (sorted_set_repository,)
+    assert not sorted_set_repository.memory_data_source.db
+
+
+@pytest.mark.asyncio
+async def test_should_warmup_sorted_set_ids(sorted_set_repository):
+    warmup_progress = await warmup_repository(
+        sorted_set_repository, ['1', 'missing']
+    )
+
+    assert warmup_progress.written == 1
+    assert warmup_progress.not_found == 1
+    sorted_set_repository.fallback_data_source.db.clear()
+    assert await sorted_set_repository.query('1').entity == (
+        FakeSortedSetEntity('1', [b'a', b'b'])
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_raise_write_errors(repository, mocker):
+    mocker.patch.object(
+        repository,
+        'add_memory_data_from_fallback',
+        side_effect=RuntimeError('fake error'),
+    )
+
+    with pytest.raises(RuntimeError):
+        await warmup_repository(repository, chunk_size=1, concurrency=2)
+
+
+def test_should_warmup_by_command_line(tmp_path, mocker, capsys):
+    repository = make_repository()
+    ids_path = tmp_path / 'ids'
+    ids_path.write_text('other1\t1\nother4\t4\n\n')
+    mocker.patch(f'{__name__}.make_repository', return_value=repository)
+    mocker.patch.object(repository.memory_data_source, 'close')
+    mocker.patch.object(
+        repository.memory_data_source, 'wait_closed', mocker.AsyncMock()
+    )
+
+    main(
+        [
+            f'{__name__}:make_repository',
+            '--ids',
+            str(ids_path),
+            '--chunk-size',
+            '1',
+        ]
+    )
+
+    assert sorted(repository.memory_data_source.db) == [
+        'fake:other1:1',
+        'fake:other4:4',
+    ]
+    assert '2 written, 0 not found' in capsys.readouterr().err
+    repository.memory_data_source.close.assert_called_once_with()
@@ -0,0 +1,555 @@
+import asyncio
+import dataclasses
+import os
+from typing import Optional
+
+import pytest
+
+from dbdaora import (
+    DictFallbackDataSource,
+    DictMemoryDataSource,
+    HashRepository,
+    SortedSetData,
+    SortedSetRepository,
+    WriteBehindJournal,
+    WriteBehindQueue,
+    make_hash_service,
+)
+from dbdaora.exceptions import InvalidJournalError
+
+
+@pytest.fixture
+def writes():
+    return []
+
+
+@pytest.fixture
+def write(writes):
+    async def write(key, value):
+        await asyncio.sleep(0)
+        writes.append((key, value))
+
+    return write
+
+
+@pytest.mark.asyncio
+@pytest.fixture
+async def queue():
+    queue = WriteBehindQueue(max_size=3, batch_size=2, flush_interval=0.01)
+    yield queue
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_should_coalesce_writes_by_key(queue, write, writes):
+    await queue.put('key1', write, 'key1', 1)
+    await queue.put('key1', write, 'key1', 2)
+
+    assert queue.metrics() == {
+        'depth': 1,
+        'in_flight': 0,
+        'coalesced': 1,
+        'written': 0,
+        'failed': 0,
+    }
+
+    await asyncio.sleep(0.05)
+
+    assert writes == [('key1', 2)]
+    assert queue.depth == 0
+    assert queue.written == 1
+
+
+@pytest.mark.asyncio
+async def test_should_flush_full_batches_before_the_interval(write, writes):
+    queue = WriteBehindQueue(batch_size=2, flush_interval=10)
+    await queue.put('key1', write, 'key1', 1)
+    await queue.put('key2', write, 'key2', 2)
+    await queue.put('key3', write, 'key3', 3)
+
+    await asyncio.sleep(0.05)
+
+    assert writes == [('key1', 1), ('key2', 2)]
+    assert queue.depth == 1
+
+    await queue.close()
+
+    assert writes == [('key1', 1), ('key2', 2), ('key3', 3)]
+    assert queue.depth == 0
+
+
+@pytest.mark.asyncio
+async def test_should_wait_for_space_on_full_queue(queue, write, writes):
+    for i in range(3):
+        await queue.put(f'key{i}', write, f'key{i}', i)
+
+    put = asyncio.ensure_future(queue.put('key3', write, 'key3', 3))
+    await asyncio.sleep(0)
+
+    assert not put.done()
+
+    await queue.put('key0', write, 'key0', 'coalesced')
+    await asyncio.wait_for(put, 1)
+    await queue.close()
+
+    assert sorted(writes) == [
+        ('key0', 'coalesced'),
+        ('key1', 1),
+        ('key2', 2),
+        ('key3', 3),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_not_write_a_key_while_it_is_in_flight(writes):
+    queue = WriteBehindQueue(batch_size=1, flush_interval=0.01, workers_size=2)
+    release = asyncio.Event()
+
+    async def write(value):
+        await release.wait()
+        writes.append(value)
+
+    await queue.put('key', write, 1)
+    await asyncio.sleep(0.02)
+    await queue.put('key', write, 2)
+    await asyncio.sleep(0.02)
+
+    assert list(queue.in_flight) == ['key']
+    assert queue.depth == 1
+
+    release.set()
+    await queue.close()
+
+    assert writes == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_should_count_failed_writes(queue, mocker):
+    write = mocker.AsyncMock(side_effect=RuntimeError('fake'))
+    logger = mocker.patch.object(queue, 'logger')
+
+    await queue.put('key', write)
+    await queue.close()
+
+    assert queue.failed == 1
+    assert logger.error.call_args[0] == ('write behind failed for key=key',)
+
+
+@pytest.mark.asyncio
+async def test_should_discard_pending_write(queue, write, writes):
+    await queue.put('key', write, 'key', 1)
+    queue.discard('key')
+    await queue.close()
+
+    assert writes == []
+
+
+@pytest.mark.asyncio
+async def test_should_wait_in_flight_write(writes):
+    queue = WriteBehindQueue(batch_size=1, flush_interval=0.01)
+    release = asyncio.Event()
+
+    async def write(value):
+        await release.wait()
+        writes.append(value)
+
+    await queue.put('key', write, 1)
+    await asyncio.sleep(0.02)
+    wait_written = asyncio.ensure_future(queue.wait_written('key'))
+    await asyncio.sleep(0.02)
+
+    assert not wait_written.done()
+
+    release.set()
+    await asyncio.wait_for(wait_written, 1)
+    await queue.close()
+
+    assert writes == [1]
+
+
+@pytest.mark.asyncio
+async def test_should_write_directly_after_close(queue, write, writes):
+    await queue.close()
+    await queue.put('key', write, 'key', 1)
+
+    assert writes == [('key', 1)]
+    assert queue.depth == 0
+
+
+@dataclasses.dataclass
+class FakeEntity:
+    id: str
+    integer: int
+
+
+class FakeRepository(HashRepository[FakeEntity, str]):
+    name = 'fake'
+
+
+@pytest.mark.asyncio
+@pytest.fixture
+async def service(mocker):
+    async def memory_data_source_factory():
+        memory_data_source = DictMemoryDataSource()
+        mocker.patch.object(memory_data_source, 'close')
+        mocker.patch.object(
+            memory_data_source, 'wait_closed', mocker.AsyncMock()
+        )
+        return memory_data_source
+
+    async def fallback_data_source_factory():
+        return DictFallbackDataSource()
+
+    return await make_hash_service(
+        FakeRepository,
+        memory_data_source_factory,
+        fallback_data_source_factory,
+        repository_expire_time=60,
+        write_behind=WriteBehindQueue(flush_interval=10),
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_add_memory_before_fallback(service):
+    repository = service.repository
+    await service.add(FakeEntity('1', 1))
+    await service.add(FakeEntity('1', 2))
+
+    assert repository.memory_data_source.db['fake:1'] == {
+        b'id': b'1',
+        b'integer': b'2',
+    }
+    assert repository.fallback_data_source.db == {}
+    assert repository.write_behind.metrics()['depth'] == 1
+    assert await service.get_one('1') == FakeEntity('1', 2)
+
+    await service.shutdown()
+
+    assert repository.fallback_data_source.db == {
+        'fake:1': {'id': '1', 'integer': 2}
+    }
+    assert repository.write_behind.written == 1
+
+
+@pytest.mark.asyncio
+async def test_should_discard_pending_fallback_write_on_delete(service):
+    repository = service.repository
+    await service.add(FakeEntity('1', 1))
+    await service.delete('1')
+    await service.shutdown()
+
+    assert repository.fallback_data_source.db == {}
+    assert repository.write_behind.depth == 0
+
+
+@pytest.mark.asyncio
+async def test_should_get_pending_fallback_write(service):
+    repository = service.repository
+    await service.add(FakeEntity('1', 1))
+
+    assert await service.get_one('1', memory=False) == FakeEntity('1', 1)
+
+    repository.memory_data_source.db.clear()
+
+    assert await service.get_one('1') == FakeEntity('1', 1)
+    assert repository.fallback_data_source.db == {}
+
+    await service.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_should_get_in_flight_fallback_write(service):
+    repository = service.repository
+    fallback_data_source = repository.fallback_data_source.data_source
+    fallback_put = fallback_data_source.put
+    release = asyncio.Event()
+
+    async def put(*args, **kwargs):
+        await release.wait()
+        await fallback_put(*args, **kwargs)
+
+    fallback_data_source.put = put
+    repository.write_behind.flush_interval = 0.01
+    await service.add(FakeEntity('1', 1))
+    await asyncio.sleep(0.05)
+
+    assert list(repository.write_behind.in_flight) == ['fake:1']
+    assert await service.get_one('1', memory=False) == FakeEntity('1', 1)
+
+    release.set()
+    await service.shutdown()
+
+
+@dataclasses.dataclass
+class FakeSortedSetEntity:
+    id: str
+    data: SortedSetData
+    max_size: Optional[int] = None
+
+
+class FakeSortedSetRepository(SortedSetRepository[FakeSortedSetEntity, str]):
+    name = 'fake_sorted_set'
+
+
+@pytest.mark.asyncio
+async def test_should_increment_member_with_pending_fallback_write():
+    repository = FakeSortedSetRepository(
+        memory_data_source=DictMemoryDataSource(),
+        fallback_data_source=DictFallbackDataSource(),
+        expire_time=60,
+        write_behind=WriteBehindQueue(flush_interval=10),
+    )
+    query = repository.query('1')
+
+    assert await repository.increment_member(query, 'a', 1) == 1
+    assert await repository.increment_member(query, 'a', 1) == 2
+
+    await repository.add_member(query, 'b', 1)
+    await repository.write_behind.close()
+
+    assert repository.fallback_data_source.db == {
+        'fake_sorted_set:1': {'data': [b'b', 1, b'a', 2], 'sorted': True}
+    }
+
+
+@pytest.mark.asyncio
+async def test_should_delete_after_in_flight_fallback_write(service):
+    repository = service.repository
+    fallback_data_source = repository.fallback_data_source.data_source
+    fallback_put = fallback_data_source.put
+    release = asyncio.Event()
+
+    async def put(*args, **kwargs):
+        await release.wait()
+        await fallback_put(*args, **kwargs)
+
+    fallback_data_source.put = put
+    repository.write_behind.flush_interval = 0.01
+    await service.add(FakeEntity('1', 1))
+    await asyncio.sleep(0.05)
+
+    assert list(repository.write_behind.in_flight) == ['fake:1']
+
+    delete = asyncio.ensure_future(service.delete('1'))
+    await asyncio.sleep(0.02)
+
+    assert not delete.done()
+
+    release.set()
+    await asyncio.wait_for(delete, 1)
+    await service.shutdown()
+
+    assert fallback_data_source.db == {}
+
+
+async def crash(queue):
+    for worker in queue.workers:
+        worker.cancel()
+
+    await asyncio.gather(*queue.workers, return_exceptions=True)
+    queue.journal.file.close()
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / 'journal')
+
+
+@pytest.mark.asyncio
+@pytest.fixture
+async def journaled_service(mocker, journal_path):
+    async def memory_data_source_factory():
+        memory_data_source = DictMemoryDataSource()
+        mocker.patch.object(memory_data_source, 'close')
+        mocker.patch.object(
+            memory_data_source, 'wait_closed', mocker.AsyncMock()
+        )
+        return memory_data_source
+
+    async def fallback_data_source_factory():
+        return DictFallbackDataSource()
+
+    async def make():
+        return await make_hash_service(
+            FakeRepository,
+            memory_data_source_factory,
+            fallback_data_source_factory,
+            repository_expire_time=60,
+            write_behind=WriteBehindQueue(
+                flush_interval=10, journal=WriteBehindJournal(journal_path)
+            ),
+        )
+
+    return make
+
+
+@pytest.mark.asyncio
+async def test_should_replay_journal_on_startup(journaled_service):
+    service = await journaled_service()
+    await service.add(FakeEntity('1', 1))
+    await service.add(FakeEntity('1', 2))
+    await service.add(FakeEntity('2', 2))
+    await service.add(FakeEntity('3', 3))
+    await service.delete('3')
+    await crash(service.repository.write_behind)
+
+    assert service.repository.fallback_data_source.db == {}
+
+    service = await journaled_service()
+
+    assert service.repository.fallback_data_source.db == {
+        'fake:1': {'id': '1', 'integer': 2},
+        'fake:2': {'id': '2', 'integer': 2},
+    }
+    assert os.listdir(service.repository.write_behind.journal.directory) == []
+
+    await service.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_should_replay_journal_before_the_first_operation(
+    journaled_service, journal_path
+):
+    service = await journaled_service()
+    await service.add(FakeEntity('1', 1))
+    await crash(service.repository.write_behind)
+
+    repository = FakeRepository(
+        memory_data_source=DictMemoryDataSource(),
+        fallback_data_source=DictFallbackDataSource(),
+        expire_time=60,
+        write_behind=WriteBehindQueue(
+            flush_interval=10, journal=WriteBehindJournal(journal_path)
+        ),
+    )
+
+    assert await repository.query('1').entity == FakeEntity('1', 1)
+    assert os.listdir(journal_path) == []
+
+    await repository.write_behind.close()
+
+
+@pytest.mark.asyncio
+async def test_should_raise_invalid_journal_error_for_shared_journal(
+    journal_path,
+):
+    write_behind = WriteBehindQueue(journal=WriteBehindJournal(journal_path))
+    FakeRepository(
+        memory_data_source=DictMemoryDataSource(),
+        fallback_data_source=DictFallbackDataSource(),
+        expire_time=60,
+        write_behind=write_behind,
+    )
+
+    with pytest.raises(InvalidJournalError) as exc_info:
+        FakeRepository(
+            memory_data_source=DictMemoryDataSource(),
+            fallback_data_source=DictFallbackDataSource(),
+            expire_time=60,
+            write_behind=write_behind,
+        )
+
+    assert exc_info.value.args == (write_behind.journal,)
+
+
+@pytest.mark.asyncio
+async def test_should_remove_journal_segments_after_flush(journaled_service):
+    service = await journaled_service()
+    journal = service.repository.write_behind.journal
+    journal.segment_size = 1
+
+    await service.add(FakeEntity('1', 1))
+    await service.add(FakeEntity('2', 2))
+
+    assert len(os.listdir(journal.directory)) == 2
+
+    await service.repository.write_behind.flush_batch()
+
+    assert os.listdir(journal.directory) == ['0000000000000002.journal']
+
+    await service.shutdown()
+
+    assert os.listdir(journal.directory) == []
+    assert service.repository.fallback_data_source.db == {
+        'fake:1': {'id': '1', 'integer': 1},
+        'fake:2': {'id': '2', 'integer': 2},
+    }
+
+
+@pytest.mark.asyncio
+async def test_should_keep_journal_segments_with_unwritten_puts(journal_path,):
+    journal = WriteBehindJournal(journal_path, segment_size=1)
+    first = await journal.append_put('key1', 'key1', {'value': 1}, {})
+    await journal.append_put('key2', 'key2', {'value': 2}, {})
+    await journal.append_put('key3', 'key3', {'value': 3}, {})
+    journal.done('key3', 3)
+    journal.done('key2', 2)
+
+    assert len(os.listdir(journal_path)) == 3
+
+    journal.done('key1', first)
+
+    assert os.listdir(journal_path) == ['0000000000000003.journal']
+
+    await journal.close()
+
+    assert os.listdir(journal_path) == []
+
+
+@pytest.mark.asyncio
+async def test_should_share_fsync_between_concurrent_appends(
+    journal_path, mocker
+):
+    fsync = mocker.patch('dbdaora.write_behind.fsync')
+    journal = WriteBehindJournal(journal_path)
+
+    await asyncio.gather(
+        *(
+            journal.append_put(f'key{i}', f'key{i}', {'value': i}, {})
+            for i in range(10)
+        )
+    )
+
+    assert fsync.call_count == 1
+    assert len(fsync.call_args[0][0]) == 1
+    assert fsync.call_args[0][1] == journal_path
+
+    await journal.append_put('key0', 'key0', {'value': 0}, {})
+
+    assert fsync.call_count == 2
+    assert fsync.call_args[0][1] is None
+
+    await journal.close()
+
+
+@pytest.mark.asyncio
+async def test_should_discard_torn_journal_tail(journal_path, mocker):
+    journal = WriteBehindJournal(journal_path)
+    await journal.append_put('key1', 'key1', {'value': 1}, {})
+    await journal.append_put('key2', 'key2', {'value': 2}, {})
+    journal.file.close()
+
+    with open(journal.path(1), 'r+b') as file:
+        file.truncate(os.path.getsize(journal.path(1)) - 1)
+
+    fallback_data_source = DictFallbackDataSource()
+    journal = WriteBehindJournal(journal_path)
+    logger = mocker.patch.object(journal, 'logger')
+
+    assert await journal.replay(fallback_data_source) == 1
+    assert fallback_data_source.db == {'key1': {'value': 1}}
+    assert logger.warning.call_args[0] == (
+        f'discarding torn journal tail {journal.path(1)}',
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_raise_invalid_journal_error(journal_path):
+    journal = WriteBehindJournal(journal_path)
+    os.makedirs(journal_path)
+
+    with open(journal.path(1), 'wb') as file:
+        file.write(b'invalid')
+
+    with pytest.raises(InvalidJournalError):
+        await journal.replay(DictFallbackDataSource())
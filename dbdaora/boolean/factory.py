@@ -8,6 +8,7 @@ from dbdaora.service.builder import build as build_base_service
 from ..cache import CacheType
 from ..repository import MemoryRepository
 from ..service import Service
+from ..write_behind import WriteBehindQueue
 from .service import BooleanService
 
 
@@ -26,6 +27,7 @@ async def make_service(
     logger: Logger = getLogger(__name__),
     has_add_circuit_breaker: bool = False,
     has_delete_circuit_breaker: bool = False,
+    write_behind: Optional[WriteBehindQueue] = None,
 ) -> Service[Entity, EntityData, FallbackKey]:
     return await build_base_service(
         BooleanService,  # type: ignore
@@ -43,4 +45,5 @@ async def make_service(
         logger=logger,
         has_add_circuit_breaker=has_add_circuit_breaker,
         has_delete_circuit_breaker=has_delete_circuit_breaker,
+        write_behind=write_behind,
     )
@@ -0,0 +1,156 @@
+import dataclasses
+import zlib
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from dbdaora.exceptions import InvalidCompressionError
+
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None  # type: ignore
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore
+
+
+# Header bytes are never the first byte of an utf-8 text, so plain text
+# values are stored unchanged. Binary values starting with a header byte
+# are escaped with RAW_HEADER.
+HEADER_MIN = 0xF8
+RAW_HEADER = 0xF8
+TEXT_FLAG = 0x04
+ALGORITHMS_IDS = {'zlib': 1, 'lz4': 2, 'zstd': 3}
+
+Compressor = Callable[[bytes], bytes]
+
+
+@dataclasses.dataclass(frozen=True)
+class Compression:
+    algorithm: str = 'zlib'
+    min_size: int = 1024
+    level: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.algorithm not in ALGORITHMS_IDS:
+            raise InvalidCompressionError(self.algorithm)
+
+        if self.algorithm == 'lz4' and lz4_frame is None:
+            raise InvalidCompressionError(self.algorithm, 'lz4')
+
+        if self.algorithm == 'zstd' and zstandard is None:
+            raise InvalidCompressionError(self.algorithm, 'zstandard')
+
+    @property
+    def header(self) -> int:
+        return HEADER_MIN | ALGORITHMS_IDS[self.algorithm]
+
+    def compress(self, data: bytes) -> bytes:
+        return get_compressor(self.algorithm, self.level)(data)
+
+    def encode(self, value: Any) -> Any:
+        if isinstance(value, str):
+            value = value.encode()
+
+        elif not isinstance(value, bytes):
+            return value
+
+        compressed = self.compress_value(value, self.header)
+
+        if compressed is not None:
+            return compressed
+
+        if value and value[0] >= HEADER_MIN:
+            return bytes((RAW_HEADER,)) + value
+
+        return value
+
+    def decode(self, value: Any) -> Any:
+        if not isinstance(value, bytes) or not value:
+            return value
+
+        header = value[0]
+
+        if header < HEADER_MIN:
+            return value
+
+        if header == RAW_HEADER:
+            return value[1:]
+
+        return decompress(value)
+
+    def encode_fallback(self, value: Any) -> Any:
+        if isinstance(value, str):
+            compressed = self.compress_value(
+                value.encode(), self.header | TEXT_FLAG
+            )
+            return value if compressed is None else compressed
+
+        if isinstance(value, bytes):
+            return self.encode(value)
+
+        return value
+
+    def decode_fallback(self, value: Any) -> Any:
+        if isinstance(value, bytes) and value and value[0] >= HEADER_MIN:
+            if value[0] & TEXT_FLAG:
+                return decompress(value).decode()
+
+        return self.decode(value)
+
+    def compress_value(self, value: bytes, header: int) -> Optional[bytes]:
+        if len(value) < self.min_size:
+            return None
+
+        compressed = self.compress(value)
+
+        if len(compressed) + 1 >= len(value):
+            return None
+
+        return bytes((header,)) + compressed
+
+
+def decompress(value: bytes) -> bytes:
+    algorithm_id = value[0] & ~(HEADER_MIN | TEXT_FLAG)
+
+    if algorithm_id == ALGORITHMS_IDS['zlib']:
+        return zlib.decompress(value[1:])
+
+    if algorithm_id == ALGORITHMS_IDS['lz4'] and lz4_frame is not None:
+        return lz4_frame.decompress(value[1:])
+
+    if algorithm_id == ALGORITHMS_IDS['zstd'] and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress(value[1:])
+
+    raise InvalidCompressionError(value[0])
+
+
+COMPRESSORS: Dict[Tuple[str, Optional[int]], Compressor] = {}
+
+
+def get_compressor(algorithm: str, level: Optional[int]) -> Compressor:
+    compressor = COMPRESSORS.get((algorithm, level))
+
+    if compressor is None:
+        if algorithm == 'zlib':
+            compressor = partial(
+                zlib.compress, level=-1 if level is None else level
+            )
+
+        elif algorithm == 'lz4':
+            compressor = partial(
+                lz4_frame.compress,
+                compression_level=0 if level is None else level,
+            )
+
+        else:
+            compressor = zstandard.ZstdCompressor(
+                level=3 if level is None else level
+            ).compress
+
+        COMPRESSORS[(algorithm, level)] = compressor
+
+    return compressor
@@ -0,0 +1,59 @@
+import dataclasses
+from typing import Any, Dict, Iterable, Optional
+
+from dbdaora.compression import Compression
+from dbdaora.keys import FallbackKey
+
+from . import FallbackDataSource
+
+
+@dataclasses.dataclass
+class CompressedFallbackDataSource(FallbackDataSource[FallbackKey]):
+    """Compresses the top level string and bytes values of the documents.
+
+    Other methods of the wrapped data source are proxied unchanged.
+    """
+
+    data_source: FallbackDataSource[FallbackKey]
+    compression: Compression = dataclasses.field(default_factory=Compression)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == 'data_source':
+            raise AttributeError(name)
+
+        return getattr(self.data_source, name)
+
+    def make_key(self, *key_parts: Any) -> FallbackKey:
+        return self.data_source.make_key(*key_parts)
+
+    async def get(self, key: FallbackKey) -> Optional[Dict[str, Any]]:
+        data = await self.data_source.get(key)
+
+        if data is None:
+            return None
+
+        return self.decode(data)
+
+    async def put(
+        self, key: FallbackKey, data: Dict[str, Any], **kwargs: Any
+    ) -> None:
+        await self.data_source.put(key, self.encode(data), **kwargs)
+
+    async def delete(self, key: FallbackKey) -> None:
+        await self.data_source.delete(key)
+
+    async def query(
+        self, key: FallbackKey, **kwargs: Any
+    ) -> Iterable[Dict[str, Any]]:
+        return [
+            self.decode(data)
+            for data in await self.data_source.query(key, **kwargs)
+        ]
+
+    def encode(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        encode = self.compression.encode_fallback
+        return {field: encode(value) for field, value in data.items()}
+
+    def decode(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        decode = self.compression.decode_fallback
+        return {field: decode(value) for field, value in data.items()}
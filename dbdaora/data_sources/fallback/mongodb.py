@@ -1,10 +1,22 @@
 import dataclasses
 import datetime
 from hashlib import sha256
-from typing import Any, ClassVar, Dict, Iterable, Optional, Set, Union
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import motor.motor_asyncio as motor
 from bson.objectid import ObjectId
+from pymongo import ReturnDocument, UpdateOne
 from pymongo.errors import OperationFailure
 
 from . import FallbackDataSource
@@ -23,6 +35,9 @@ class MongoDataSource(FallbackDataSource[Key]):
         default_factory=motor.AsyncIOMotorClient
     )
     collections_has_ttl_index: ClassVar[Set[str]] = set()
+    collections_indexes: ClassVar[
+        Set[Tuple[str, Tuple[Tuple[str, int], ...]]]
+    ] = set()
     key_is_object_id: bool = True
 
     def make_key(self, *key_parts: Any) -> Key:
@@ -55,21 +70,94 @@ class MongoDataSource(FallbackDataSource[Key]):
 
         if document_ttl:
             data['last_modified'] = datetime.datetime.now()
-
-            if key.collection_name not in type(self).collections_has_ttl_index:
-                try:
-                    await self.create_ttl_index(key, document_ttl)
-                except OperationFailure:
-                    if await self.drop_ttl_index(key, document_ttl):
-                        await self.create_ttl_index(key, document_ttl)
-
-                type(self).collections_has_ttl_index.add(key.collection_name)
+            await self.ensure_ttl_index(key, document_ttl)
 
         collection = self.collection(key)
         await collection.replace_one(
             {'_id': key.document_id}, data, upsert=True,
         )
 
+    async def upsert_many(
+        self,
+        key: Key,
+        documents: Sequence[Dict[str, Any]],
+        unique_fields: Sequence[str],
+        **kwargs: Any,
+    ) -> None:
+        if not documents:
+            return
+
+        document_ttl = kwargs.get('fallback_ttl')
+
+        if document_ttl:
+            last_modified = datetime.datetime.now()
+
+            for document in documents:
+                document['last_modified'] = last_modified
+
+            await self.ensure_ttl_index(key, document_ttl)
+
+        await self.collection(key).bulk_write(
+            [
+                UpdateOne(
+                    {field: document[field] for field in unique_fields},
+                    {'$set': document},
+                    upsert=True,
+                )
+                for document in documents
+            ],
+            ordered=False,
+        )
+
+    async def update_one(
+        self,
+        key: Key,
+        filter: Dict[str, Any],
+        update: Dict[str, Any],
+        upsert: bool = False,
+        **kwargs: Any,
+    ) -> Optional[Dict[str, Any]]:
+        document_ttl = kwargs.get('fallback_ttl')
+
+        if document_ttl:
+            update = dict(update)
+            update['$set'] = dict(
+                update.get('$set', {}), last_modified=datetime.datetime.now()
+            )
+            await self.ensure_ttl_index(key, document_ttl)
+
+        return await self.collection(key).find_one_and_update(
+            filter,
+            update,
+            upsert=upsert,
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def delete_many(self, key: Key, filter: Dict[str, Any]) -> None:
+        await self.collection(key).delete_many(filter)
+
+    async def count(self, key: Key, filter: Dict[str, Any]) -> int:
+        return await self.collection(key).count_documents(filter)
+
+    async def ensure_index(
+        self, key: Key, keys: List[Tuple[str, int]], **kwargs: Any
+    ) -> None:
+        index_id = (key.collection_name, tuple(keys))
+
+        if index_id not in type(self).collections_indexes:
+            await self.collection(key).create_index(keys, **kwargs)
+            type(self).collections_indexes.add(index_id)
+
+    async def ensure_ttl_index(self, key: Key, document_ttl: int) -> None:
+        if key.collection_name not in type(self).collections_has_ttl_index:
+            try:
+                await self.create_ttl_index(key, document_ttl)
+            except OperationFailure:
+                if await self.drop_ttl_index(key, document_ttl):
+                    await self.create_ttl_index(key, document_ttl)
+
+            type(self).collections_has_ttl_index.add(key.collection_name)
+
     async def delete(self, key: Key) -> None:
         collection = self.collection(key)
         await collection.delete_one({'_id': key.document_id})
@@ -0,0 +1,120 @@
+import dataclasses
+from typing import Any, Dict, Iterable, Optional
+
+from dbdaora.exceptions import InvalidJournalError
+from dbdaora.keys import FallbackKey
+from dbdaora.write_behind import WriteBehindQueue
+
+from . import FallbackDataSource
+
+
+@dataclasses.dataclass
+class WriteBehindFallbackDataSource(FallbackDataSource[FallbackKey]):
+    """Sends the puts to the write behind queue, keyed by the fallback key.
+
+    ``get`` returns the data of the pending or in flight put of the key,
+    so the read-modify-write updates don't lose the queued ones.
+    ``delete`` discards the pending put and waits the in flight one,
+    so a put sent before the delete can't resurrect the entity.
+    The journal recovered segments are replayed before the first operation,
+    a journal can't be shared with other data sources.
+    Other methods of the wrapped data source are proxied unchanged.
+    """
+
+    data_source: FallbackDataSource[FallbackKey]
+    queue: WriteBehindQueue
+
+    def __post_init__(self) -> None:
+        journal = self.queue.journal
+
+        if journal is not None:
+            if journal.data_source is None:
+                journal.data_source = self.data_source
+
+            elif journal.data_source is not self.data_source:
+                raise InvalidJournalError(journal)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == 'data_source':
+            raise AttributeError(name)
+
+        return getattr(self.data_source, name)
+
+    def make_key(self, *key_parts: Any) -> FallbackKey:
+        return self.data_source.make_key(*key_parts)
+
+    async def get(self, key: FallbackKey) -> Optional[Dict[str, Any]]:
+        await self.replay()
+        write = self.queue.get(str(key))
+
+        if write is not None:
+            # the data is the last argument of both put writes
+            return write[1][-1]  # type: ignore
+
+        return await self.data_source.get(key)
+
+    async def put(
+        self, key: FallbackKey, data: Dict[str, Any], **kwargs: Any
+    ) -> None:
+        await self.replay()
+
+        if self.queue.closed:
+            await self.data_source.put(key, data, **kwargs)
+            return
+
+        queue_key = str(key)
+
+        if self.queue.journal is None:
+            await self.queue.put(
+                queue_key, self.data_source.put, key, data, **kwargs
+            )
+            return
+
+        sequence = await self.queue.journal.append_put(
+            queue_key, key, data, kwargs
+        )
+        await self.queue.put(
+            queue_key,
+            self.write_journaled,
+            queue_key,
+            sequence,
+            key,
+            data,
+            **kwargs,
+        )
+
+    async def write_journaled(
+        self,
+        queue_key: str,
+        sequence: int,
+        key: FallbackKey,
+        data: Dict[str, Any],
+        **kwargs: Any,
+    ) -> None:
+        await self.data_source.put(key, data, **kwargs)
+
+        if self.queue.journal is not None:
+            self.queue.journal.done(queue_key, sequence)
+
+    async def delete(self, key: FallbackKey) -> None:
+        await self.replay()
+        queue_key = str(key)
+
+        if self.queue.journal is not None and not self.queue.closed:
+            await self.queue.journal.append_delete(queue_key)
+
+        self.queue.discard(queue_key)
+        await self.queue.wait_written(queue_key)
+        await self.data_source.delete(key)
+
+    async def query(
+        self, key: FallbackKey, **kwargs: Any
+    ) -> Iterable[Dict[str, Any]]:
+        await self.replay()
+        return await self.data_source.query(key, **kwargs)
+
+    async def replay(self) -> int:
+        if self.queue.journal is None:
+            return 0
+
+        return await self.queue.journal.replay(self.data_source)
@@ -1,5 +1,6 @@
 from typing import (
     Any,
+    AsyncIterator,
     ClassVar,
     Dict,
     Optional,
@@ -13,6 +14,20 @@ from typing import (
 from .. import DataSource
 
 
+# EXISTS and the write run atomically, so an expired key is not recreated
+# as a partial sorted set without time to live
+ZADD_IF_EXISTS_SCRIPT = (
+    "if redis.call('exists', KEYS[1]) == 1 then "
+    "return redis.call('zadd', KEYS[1], ARGV[1], ARGV[2]) end "
+    "return false"
+)
+ZINCRBY_IF_EXISTS_SCRIPT = (
+    "if redis.call('exists', KEYS[1]) == 1 then "
+    "return redis.call('zincrby', KEYS[1], ARGV[1], ARGV[2]) end "
+    "return false"
+)
+
+
 class GeoPoint(Protocol):
     longitude: float
     latitude: float
@@ -36,7 +51,7 @@ class GeoMember(Protocol):
         ...
 
 
-GeoRadiusOutput = Union[Sequence[GeoMember], Sequence[str]]
+GeoRadiusOutput = Union[Sequence[GeoMember], Sequence[str], Sequence[bytes]]
 
 
 RangeOutput = Union[
@@ -79,7 +94,7 @@ class MemoryDataSource(DataSource):
     async def get(self, key: str) -> Optional[bytes]:
         raise NotImplementedError()  # pragma: no cover
 
-    async def set(self, key: str, data: str) -> None:
+    async def set(self, key: str, data: Union[str, bytes]) -> None:
         raise NotImplementedError()  # pragma: no cover
 
     async def delete(self, key: str) -> None:
@@ -111,6 +126,8 @@ class MemoryDataSource(DataSource):
         max: float = float('inf'),
         min: float = float('-inf'),
         withscores: bool = False,
+        offset: Optional[int] = None,
+        count: Optional[int] = None,
     ) -> Optional[RangeOutput]:
         raise NotImplementedError()  # pragma: no cover
 
@@ -120,6 +137,8 @@ class MemoryDataSource(DataSource):
         min: float = float('-inf'),
         max: float = float('inf'),
         withscores: bool = False,
+        offset: Optional[int] = None,
+        count: Optional[int] = None,
     ) -> Optional[RangeOutput]:
         raise NotImplementedError()  # pragma: no cover
 
@@ -131,6 +150,26 @@ class MemoryDataSource(DataSource):
     async def zcard(self, key: str) -> int:
         raise NotImplementedError()  # pragma: no cover
 
+    async def zincrby(
+        self, key: str, increment: float, member: Union[str, bytes]
+    ) -> float:
+        raise NotImplementedError()  # pragma: no cover
+
+    async def zrem(
+        self, key: str, member: Union[str, bytes], *members: Union[str, bytes],
+    ) -> int:
+        raise NotImplementedError()  # pragma: no cover
+
+    async def zadd_if_exists(
+        self, key: str, score: float, member: Union[str, bytes]
+    ) -> bool:
+        raise NotImplementedError()  # pragma: no cover
+
+    async def zincrby_if_exists(
+        self, key: str, increment: float, member: Union[str, bytes]
+    ) -> Optional[float]:
+        raise NotImplementedError()  # pragma: no cover
+
     async def hmset(
         self,
         key: str,
@@ -148,6 +187,35 @@ class MemoryDataSource(DataSource):
     async def hgetall(self, key: str) -> Dict[bytes, bytes]:
         raise NotImplementedError()  # pragma: no cover
 
+    async def mget(self, key: str, *keys: str) -> Sequence[Optional[bytes]]:
+        raise NotImplementedError()  # pragma: no cover
+
+    async def hgetall_many(
+        self, keys: Sequence[str]
+    ) -> Sequence[Dict[bytes, bytes]]:
+        raise NotImplementedError()  # pragma: no cover
+
+    async def exists_many(self, keys: Sequence[str]) -> Sequence[int]:
+        raise NotImplementedError()  # pragma: no cover
+
+    async def expire_many(self, keys: Sequence[str], time: int) -> None:
+        raise NotImplementedError()  # pragma: no cover
+
+    def scan_keys(
+        self, match: str, count: int = 1000
+    ) -> AsyncIterator[Sequence[bytes]]:
+        raise NotImplementedError()  # pragma: no cover
+
+    async def dump_many(
+        self, keys: Sequence[Union[str, bytes]]
+    ) -> Sequence[Tuple[Optional[bytes], int]]:
+        raise NotImplementedError()  # pragma: no cover
+
+    async def restore_many(
+        self, entries: Sequence[Tuple[str, int, bytes]], replace: bool = False
+    ) -> int:
+        raise NotImplementedError()  # pragma: no cover
+
     def close(self) -> None:
         raise NotImplementedError()  # pragma: no cover
 
@@ -157,6 +225,9 @@ class MemoryDataSource(DataSource):
     def multi_exec(self) -> MemoryMultiExec:
         raise NotImplementedError()  # pragma: no cover
 
+    def primary_data_source(self) -> 'MemoryDataSource':
+        return self
+
     async def georadius(
         self,
         key: str,
@@ -168,9 +239,54 @@ class MemoryDataSource(DataSource):
         with_dist: bool = False,
         with_coord: bool = False,
         count: Optional[int] = None,
+        sort: Optional[str] = None,
     ) -> GeoRadiusOutput:
         raise NotImplementedError()  # pragma: no cover
 
+    async def georadiusbymember(
+        self,
+        key: str,
+        member: Union[str, bytes],
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        raise NotImplementedError()  # pragma: no cover
+
+    async def geosearchbox(
+        self,
+        key: str,
+        longitude: float,
+        latitude: float,
+        width: float,
+        height: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        raise NotImplementedError()  # pragma: no cover
+
+    async def georadius_many(
+        self,
+        key: str,
+        centers: Sequence[Tuple[float, float]],
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> Sequence[GeoRadiusOutput]:
+        raise NotImplementedError()  # pragma: no cover
+
     async def geoadd(
         self,
         key: str,
@@ -2,22 +2,44 @@ import asyncio
 import dataclasses
 from typing import (
     Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
     ClassVar,
     Dict,
     List,
     Optional,
     Sequence,
-    Set,
+    Tuple,
     Type,
     Union,
 )
 
-from aioredis import GeoMember, GeoPoint, Redis, create_redis_pool
+from aioredis import (
+    ConnectionsPool,
+    GeoMember,
+    GeoPoint,
+    Redis,
+    RedisConnection,
+    ReplyError,
+    create_redis_pool,
+)
+from aioredis.commands.geo import make_geomember
 from aioredis.commands.transaction import MultiExec
+from aioredis.errors import ConnectionClosedError
+from aioredis.util import wait_convert
 
 from dbdaora.hashring import HashRing
 
-from . import GeoRadiusOutput, MemoryDataSource, MemoryMultiExec, RangeOutput
+from . import (
+    ZADD_IF_EXISTS_SCRIPT,
+    ZINCRBY_IF_EXISTS_SCRIPT,
+    GeoRadiusOutput,
+    MemoryDataSource,
+    MemoryMultiExec,
+    RangeOutput,
+)
+from .shards import ShardsMemoryDataSource, ShardsMemoryMultiExec
 
 
 try:
@@ -27,159 +49,403 @@ except ImportError:
 
 
 class AioRedisDataSource(Redis, MemoryDataSource):
+    """``auto_pipelining`` buffers the commands sent on a connection during
+    an event loop iteration and writes them at once on the next one."""
+
     geopoint_cls: ClassVar[Type[GeoPoint]] = GeoPoint  # type: ignore
     geomember_cls: ClassVar[Type[GeoMember]] = GeoMember  # type: ignore
+    auto_pipelining: bool = False
+    primary_of: Optional['ReplicasAioRedisDataSource'] = None
 
+    def close(self) -> None:
+        if self.primary_of is None:
+            super().close()
+        else:
+            self.primary_of.close()
 
-class AioRedisMultiExec(MultiExec):
-    geopoint_cls: ClassVar[Type[GeoPoint]] = GeoPoint
-    geomember_cls: ClassVar[Type[GeoMember]] = GeoMember
+    async def wait_closed(self) -> None:
+        if self.primary_of is None:
+            await super().wait_closed()
+        else:
+            await self.primary_of.wait_closed()
 
+    def execute(self, command: Any, *args: Any, **kwargs: Any) -> Any:
+        pool = self._pool_or_conn
 
-@dataclasses.dataclass
-class ShardsAioRedisMultiExec(MemoryMultiExec):
-    hashring: HashRing[AioRedisMultiExec]
-    futures: List[Any] = dataclasses.field(default_factory=list)
-    clients_to_execute: Set[AioRedisMultiExec] = dataclasses.field(
-        default_factory=set
-    )
-    geopoint_cls: ClassVar[Type[GeoPoint]] = GeoPoint
-    geomember_cls: ClassVar[Type[GeoMember]] = GeoMember
+        if not self.auto_pipelining or not isinstance(pool, ConnectionsPool):
+            return super().execute(command, *args, **kwargs)
 
-    def get_client(self, key: str) -> AioRedisMultiExec:
-        return self.hashring.get_node(key)
+        connection, _ = pool.get_connection(command, args)
 
-    def delete(self, key: str) -> Any:
-        client = self.get_client(key)
-        future = client.delete(key)
-        self.clients_to_execute.add(client)
-        self.futures.append(future)
-        return future
+        if connection is None:
+            return super().execute(command, *args, **kwargs)
 
-    def hmset(
-        self,
-        key: str,
-        field: Union[str, bytes],
-        value: Union[str, bytes],
-        *pairs: Union[str, bytes],
-    ) -> Any:
-        client = self.get_client(key)
-        future = client.hmset(key, field, value, *pairs)
-        self.clients_to_execute.add(client)
-        self.futures.append(future)
-        return future
-
-    def zadd(
-        self, key: str, score: float, member: str, *pairs: Union[float, str]
+        if connection._pipeline_buffer is None:
+            connection._pipeline_buffer = bytearray()
+            asyncio.get_event_loop().call_soon(flush_commands, connection)
+
+        return pool._check_result(
+            connection.execute(command, *args, **kwargs),
+            command,
+            args,
+            kwargs,
+        )
+
+    async def hgetall_many(
+        self, keys: Sequence[str]
+    ) -> Sequence[Dict[bytes, bytes]]:
+        pipeline = self.pipeline()
+
+        for key in keys:
+            pipeline.hgetall(key)
+
+        return await pipeline.execute()  # type: ignore
+
+    async def exists_many(self, keys: Sequence[str]) -> Sequence[int]:
+        pipeline = self.pipeline()
+
+        for key in keys:
+            pipeline.exists(key)
+
+        return await pipeline.execute()  # type: ignore
+
+    async def expire_many(self, keys: Sequence[str], time: int) -> None:
+        pipeline = self.pipeline()
+
+        for key in keys:
+            pipeline.expire(key, time)
+
+        await pipeline.execute()
+
+    async def scan_keys(
+        self, match: str, count: int = 1000
+    ) -> AsyncIterator[Sequence[bytes]]:
+        cursor: Union[int, bytes] = b'0'
+
+        while cursor:
+            cursor, keys = await self.scan(cursor, match=match, count=count)
+
+            if keys:
+                yield keys
+
+    async def dump_many(
+        self, keys: Sequence[Union[str, bytes]]
+    ) -> Sequence[Tuple[Optional[bytes], int]]:
+        pipeline = self.pipeline()
+
+        for key in keys:
+            pipeline.dump(key)
+            pipeline.pttl(key)
+
+        results = await pipeline.execute()
+        return list(zip(results[::2], results[1::2]))
+
+    def restore(
+        self, key: str, ttl: int, value: bytes, replace: bool = False
     ) -> Any:
-        client = self.get_client(key)
-        future = client.zadd(key, score, member, *pairs)
-        self.clients_to_execute.add(client)
-        self.futures.append(future)
-        return future
-
-    async def execute(self, *, return_exceptions: bool = False) -> Any:
-        await asyncio.gather(
-            *[
-                client.execute(return_exceptions=return_exceptions)
-                for client in self.clients_to_execute
-            ]
+        if replace:
+            return self.execute(b'RESTORE', key, ttl, value, b'REPLACE')
+
+        return self.execute(b'RESTORE', key, ttl, value)
+
+    async def restore_many(
+        self, entries: Sequence[Tuple[str, int, bytes]], replace: bool = False
+    ) -> int:
+        pipeline = self.pipeline()
+
+        for key, ttl, value in entries:
+            pipeline.restore(key, ttl, value, replace)
+
+        restored = 0
+
+        for result in await pipeline.execute(return_exceptions=True):
+            if not isinstance(result, ReplyError):
+                restored += 1
+
+            elif not str(result).startswith('BUSYKEY'):
+                raise result
+
+        return restored
+
+    async def zadd_if_exists(
+        self, key: str, score: float, member: Union[str, bytes]
+    ) -> bool:
+        return (
+            await self.eval(
+                ZADD_IF_EXISTS_SCRIPT, keys=[key], args=[score, member]
+            )
+            is not None
         )
-        self.clients_to_execute.clear()
 
-        results = await asyncio.gather(*self.futures)
-        self.futures.clear()
-        return results
+    async def zincrby_if_exists(
+        self, key: str, increment: float, member: Union[str, bytes]
+    ) -> Optional[float]:
+        score = await self.eval(
+            ZINCRBY_IF_EXISTS_SCRIPT, keys=[key], args=[increment, member]
+        )
+        return None if score is None else float(score)
 
+    async def georadiusbymember(
+        self,
+        key: str,
+        member: Union[str, bytes],
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        try:
+            return await super().georadiusbymember(
+                key,
+                member,
+                radius,
+                unit,
+                with_dist=with_dist,
+                with_coord=with_coord,
+                count=count,
+                sort=sort,
+            )
+        except ReplyError as error:
+            if 'could not decode requested zset member' in str(error):
+                return []
 
-@dataclasses.dataclass
-class ShardsAioRedisDataSource(MemoryDataSource):
-    hashring: HashRing[AioRedisDataSource]
-    geopoint_cls: ClassVar[Type[GeoPoint]] = GeoPoint  # type: ignore
-    geomember_cls: ClassVar[Type[GeoMember]] = GeoMember  # type: ignore
+            raise
 
-    def get_client(self, key: str) -> AioRedisDataSource:
-        return self.hashring.get_node(key)
+    async def geosearchbox(
+        self,
+        key: str,
+        longitude: float,
+        latitude: float,
+        width: float,
+        height: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        args: List[Any] = [
+            b'FROMLONLAT',
+            longitude,
+            latitude,
+            b'BYBOX',
+            width,
+            height,
+            unit,
+        ]
 
-    async def get(self, key: str) -> Optional[bytes]:
-        return await self.get_client(key).get(key)
+        if sort is not None:
+            args.append(sort)
+
+        if count is not None:
+            args.extend([b'COUNT', count])
+
+        if with_dist:
+            args.append(b'WITHDIST')
+
+        if with_coord:
+            args.append(b'WITHCOORD')
+
+        future = self.execute(b'GEOSEARCH', key, *args)
+
+        if with_dist or with_coord:
+            future = wait_convert(
+                future,
+                make_geomember,
+                with_dist=with_dist,
+                with_hash=False,
+                with_coord=with_coord,
+            )
+
+        return await future  # type: ignore
+
+    async def georadius_many(
+        self,
+        key: str,
+        centers: Sequence[Tuple[float, float]],
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> Sequence[GeoRadiusOutput]:
+        pipeline = self.pipeline()
+
+        for longitude, latitude in centers:
+            pipeline.georadius(
+                key,
+                longitude,
+                latitude,
+                radius,
+                unit,
+                with_dist=with_dist,
+                with_coord=with_coord,
+                count=count,
+                sort=sort,
+            )
+
+        return await pipeline.execute()  # type: ignore
+
+
+class ReplicasAioRedisDataSource(AioRedisDataSource):
+    """Sends the read commands to the replicas and the writes to the primary.
+
+    ``replicas_balance`` is ``round_robin`` or ``least_loaded``, which picks
+    the replica with less pending reads. Reads fall back to the primary
+    when a replica connection fails.
+    """
+
+    replicas: Sequence[AioRedisDataSource] = ()
+    replicas_balance: str = 'round_robin'
+    primary_commands_factory: Type[AioRedisDataSource] = AioRedisDataSource
+
+    def set_replicas(
+        self,
+        replicas: Sequence[AioRedisDataSource],
+        balance: str = 'round_robin',
+    ) -> None:
+        self.replicas = replicas
+        self.replicas_balance = balance
+        self.replicas_pending = [0] * len(replicas)
+        self.replicas_position = 0
+
+    def get_replica_index(self) -> int:
+        if self.replicas_balance == 'least_loaded':
+            return min(
+                range(len(self.replicas)),
+                key=self.replicas_pending.__getitem__,
+            )
+
+        self.replicas_position = (self.replicas_position + 1) % len(
+            self.replicas
+        )
+        return self.replicas_position
+
+    async def read(
+        self, command: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        if not self.replicas:
+            return await command(self, *args, **kwargs)
 
-    async def set(self, key: str, data: str) -> None:
-        await self.get_client(key).set(key, data)
+        index = self.get_replica_index()
+        self.replicas_pending[index] += 1
 
-    async def delete(self, key: str) -> None:
-        await self.get_client(key).delete(key)
+        try:
+            return await command(self.replicas[index], *args, **kwargs)
 
-    async def expire(self, key: str, time: int) -> None:
-        await self.get_client(key).expire(key, time)
+        except (ConnectionClosedError, OSError):
+            return await command(self, *args, **kwargs)
+
+        finally:
+            self.replicas_pending[index] -= 1
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.read(AioRedisDataSource.get, key)  # type: ignore
 
     async def exists(self, key: str) -> int:
-        return await self.get_client(key).exists(key)
+        return await self.read(AioRedisDataSource.exists, key)  # type: ignore
 
-    async def zrevrange(
+    async def zrevrange(  # type: ignore
         self, key: str, start: int, stop: int, withscores: bool = False
     ) -> Optional[RangeOutput]:
-        return await self.get_client(key).zrevrange(
-            key, start=start, stop=stop, withscores=withscores
+        return await self.read(  # type: ignore
+            AioRedisDataSource.zrevrange,
+            key,
+            start=start,
+            stop=stop,
+            withscores=withscores,
         )
 
-    async def zrange(
+    async def zrange(  # type: ignore
         self,
         key: str,
         start: int = 0,
         stop: int = -1,
         withscores: bool = False,
     ) -> Optional[RangeOutput]:
-        return await self.get_client(key).zrange(
-            key, start=start, stop=stop, withscores=withscores
+        return await self.read(  # type: ignore
+            AioRedisDataSource.zrange,
+            key,
+            start=start,
+            stop=stop,
+            withscores=withscores,
         )
 
-    async def zadd(
-        self, key: str, score: float, member: str, *pairs: Union[float, str]
-    ) -> None:
-        await self.get_client(key).zadd(key, score, member, *pairs)
-
-    async def zcard(self, key: str) -> int:
-        return await self.get_client(key).zcard(key)
-
-    async def zrevrangebyscore(
+    async def zrevrangebyscore(  # type: ignore
         self,
         key: str,
         max: float = float('inf'),
         min: float = float('-inf'),
         withscores: bool = False,
+        offset: Optional[int] = None,
+        count: Optional[int] = None,
     ) -> Optional[RangeOutput]:
-        return await self.get_client(key).zrevrangebyscore(
-            key, max=max, min=min, withscores=withscores
+        return await self.read(  # type: ignore
+            AioRedisDataSource.zrevrangebyscore,
+            key,
+            max=max,
+            min=min,
+            withscores=withscores,
+            offset=offset,
+            count=count,
         )
 
-    async def zrangebyscore(
+    async def zrangebyscore(  # type: ignore
         self,
         key: str,
         min: float = float('-inf'),
         max: float = float('inf'),
         withscores: bool = False,
+        offset: Optional[int] = None,
+        count: Optional[int] = None,
     ) -> Optional[RangeOutput]:
-        return await self.get_client(key).zrangebyscore(
-            key, min=min, max=max, withscores=withscores
+        return await self.read(  # type: ignore
+            AioRedisDataSource.zrangebyscore,
+            key,
+            min=min,
+            max=max,
+            withscores=withscores,
+            offset=offset,
+            count=count,
         )
 
-    async def hmset(
-        self,
-        key: str,
-        field: Union[str, bytes],
-        value: Union[str, bytes],
-        *pairs: Union[str, bytes],
-    ) -> None:
-        await self.get_client(key).hmset(key, field, value, *pairs)
+    async def zcard(self, key: str) -> int:
+        return await self.read(AioRedisDataSource.zcard, key)  # type: ignore
 
     async def hmget(
         self, key: str, field: Union[str, bytes], *fields: Union[str, bytes]
     ) -> Sequence[Optional[bytes]]:
-        return await self.get_client(key).hmget(key, field, *fields)
+        return await self.read(  # type: ignore
+            AioRedisDataSource.hmget, key, field, *fields
+        )
 
     async def hgetall(self, key: str) -> Dict[bytes, bytes]:
-        return await self.get_client(key).hgetall(key)
+        return await self.read(  # type: ignore
+            AioRedisDataSource.hgetall, key
+        )
+
+    async def mget(self, key: str, *keys: str) -> Sequence[Optional[bytes]]:
+        return await self.read(  # type: ignore
+            AioRedisDataSource.mget, key, *keys
+        )
+
+    async def hgetall_many(
+        self, keys: Sequence[str]
+    ) -> Sequence[Dict[bytes, bytes]]:
+        return await self.read(  # type: ignore
+            AioRedisDataSource.hgetall_many, keys
+        )
+
+    async def exists_many(self, keys: Sequence[str]) -> Sequence[int]:
+        return await self.read(  # type: ignore
+            AioRedisDataSource.exists_many, keys
+        )
 
     async def georadius(
         self,
@@ -192,38 +458,139 @@ class ShardsAioRedisDataSource(MemoryDataSource):
         with_dist: bool = False,
         with_coord: bool = False,
         count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        return await self.read(  # type: ignore
+            AioRedisDataSource.georadius,
+            key,
+            longitude,
+            latitude,
+            radius,
+            unit,
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
+        )
+
+    async def georadiusbymember(
+        self,
+        key: str,
+        member: Union[str, bytes],
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
     ) -> GeoRadiusOutput:
-        return await self.get_client(key).georadius(
-            key=key,
-            longitude=longitude,
-            latitude=latitude,
-            radius=radius,
-            unit=unit,
+        return await self.read(  # type: ignore
+            AioRedisDataSource.georadiusbymember,
+            key,
+            member,
+            radius,
+            unit,
             with_dist=with_dist,
             with_coord=with_coord,
             count=count,
+            sort=sort,
         )
 
-    async def geoadd(
+    async def geosearchbox(
         self,
         key: str,
         longitude: float,
         latitude: float,
-        member: Union[str, bytes],
-        *args: Any,
-        **kwargs: Any,
-    ) -> int:
-        return await self.get_client(key).geoadd(
-            key, longitude, latitude, member, *args, **kwargs,
+        width: float,
+        height: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        return await self.read(  # type: ignore
+            AioRedisDataSource.geosearchbox,
+            key,
+            longitude,
+            latitude,
+            width,
+            height,
+            unit,
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
+        )
+
+    async def georadius_many(
+        self,
+        key: str,
+        centers: Sequence[Tuple[float, float]],
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> Sequence[GeoRadiusOutput]:
+        return await self.read(  # type: ignore
+            AioRedisDataSource.georadius_many,
+            key,
+            centers,
+            radius,
+            unit,
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
         )
 
     def close(self) -> None:
-        for client in self.hashring.nodes:
-            client.close()
+        super().close()
+
+        for replica in self.replicas:
+            replica.close()
 
     async def wait_closed(self) -> None:
-        for client in self.hashring.nodes:
-            await client.wait_closed()
+        await super().wait_closed()
+
+        for replica in self.replicas:
+            await replica.wait_closed()
+
+    def primary_data_source(self) -> MemoryDataSource:
+        primary = self.primary_commands_factory(self._pool_or_conn)
+        primary.auto_pipelining = self.auto_pipelining
+        primary.primary_of = self
+        return primary
+
+
+class AioRedisMultiExec(MultiExec):
+    geopoint_cls: ClassVar[Type[GeoPoint]] = GeoPoint
+    geomember_cls: ClassVar[Type[GeoMember]] = GeoMember
+
+
+@dataclasses.dataclass
+class ShardsAioRedisMultiExec(ShardsMemoryMultiExec):
+    hashring: HashRing[AioRedisMultiExec]  # type: ignore
+    geopoint_cls: ClassVar[Type[GeoPoint]] = GeoPoint
+    geomember_cls: ClassVar[Type[GeoMember]] = GeoMember
+
+    def get_client(self, key: str) -> AioRedisMultiExec:  # type: ignore
+        return self.hashring.get_node(key)
+
+
+@dataclasses.dataclass
+class ShardsAioRedisDataSource(ShardsMemoryDataSource):
+    hashring: HashRing[AioRedisDataSource]  # type: ignore
+    geopoint_cls: ClassVar[Type[GeoPoint]] = GeoPoint  # type: ignore
+    geomember_cls: ClassVar[Type[GeoMember]] = GeoMember  # type: ignore
+
+    def get_client(self, key: str) -> AioRedisDataSource:
+        return self.hashring.get_node(key)
 
     def multi_exec(self) -> MemoryMultiExec:
         hashring = type(self.hashring)(
@@ -232,10 +599,19 @@ class ShardsAioRedisDataSource(MemoryDataSource):
                 for node in self.hashring.nodes
             ],
             self.hashring.nodes_size,
+            self.hashring.names,
         )
         return ShardsAioRedisMultiExec(hashring)  # type: ignore
 
 
+def flush_commands(connection: RedisConnection) -> None:
+    buffer = connection._pipeline_buffer
+    connection._pipeline_buffer = None
+
+    if buffer and not connection.closed:
+        connection._writer.write(buffer)
+
+
 async def make(
     *uris: str,
     hashring_cls: Type[HashRing[AioRedisDataSource]] = HashRing,
@@ -244,24 +620,56 @@ async def make(
         ShardsAioRedisDataSource
     ] = ShardsAioRedisDataSource,
     single_commands_factory: Type[AioRedisDataSource] = AioRedisDataSource,
+    replicas: Optional[Sequence[Sequence[str]]] = None,
+    replicas_balance: str = 'round_robin',
+    replicas_commands_factory: Type[
+        ReplicasAioRedisDataSource
+    ] = ReplicasAioRedisDataSource,
+    auto_pipelining: bool = False,
 ) -> Union[Redis, ShardsAioRedisDataSource]:
     if len(uris) == 0:
         uris = ['redis://']  # type: ignore
 
-    if len(uris) > 1:
-        clients: Sequence[AioRedisDataSource] = [
-            await create_redis_pool(  # type: ignore
+    clients: List[AioRedisDataSource] = []
+
+    for i, uri in enumerate(uris):
+        uri_replicas = replicas[i] if replicas and i < len(replicas) else ()
+
+        if uri_replicas:
+            client = await create_redis_pool(
+                uri, commands_factory=replicas_commands_factory
+            )
+            replicas_clients = [
+                await create_redis_pool(
+                    replica_uri, commands_factory=single_commands_factory
+                )
+                for replica_uri in uri_replicas
+            ]
+
+            for replica in replicas_clients:
+                replica.auto_pipelining = auto_pipelining  # type: ignore
+
+            client.set_replicas(  # type: ignore
+                replicas_clients, replicas_balance
+            )
+            client.primary_commands_factory = (  # type: ignore
+                single_commands_factory
+            )
+
+        else:
+            client = await create_redis_pool(
                 uri, commands_factory=single_commands_factory
             )
-            for uri in uris
-        ]
-        hashring = hashring_cls(clients, hashring_nodes_size)
+
+        client.auto_pipelining = auto_pipelining  # type: ignore
+        clients.append(client)  # type: ignore
+
+    if len(clients) > 1:
+        hashring = hashring_cls(clients, hashring_nodes_size, uris)
         return sharded_commands_factory(hashring)
 
     else:
-        return await create_redis_pool(
-            uris[0], commands_factory=single_commands_factory
-        )
+        return clients[0]
 
 
 if newrelic is not None:
@@ -301,6 +709,27 @@ if newrelic is not None:
         target=None,
         operation='exists',
     )
+    newrelic.agent.wrap_datastore_trace(
+        AioRedisDataSource,
+        'mget',
+        product='Redis',
+        target=None,
+        operation='mget',
+    )
+    newrelic.agent.wrap_datastore_trace(
+        AioRedisDataSource,
+        'exists_many',
+        product='Redis',
+        target=None,
+        operation='exists',
+    )
+    newrelic.agent.wrap_datastore_trace(
+        AioRedisDataSource,
+        'expire_many',
+        product='Redis',
+        target=None,
+        operation='expire',
+    )
 
     # HASH COMMANDS
     newrelic.agent.wrap_datastore_trace(
@@ -317,6 +746,13 @@ if newrelic is not None:
         target=None,
         operation='hgetall',
     )
+    newrelic.agent.wrap_datastore_trace(
+        AioRedisDataSource,
+        'hgetall_many',
+        product='Redis',
+        target=None,
+        operation='hgetall',
+    )
     newrelic.agent.wrap_datastore_trace(
         AioRedisDataSource,
         'hmget',
@@ -368,6 +804,34 @@ if newrelic is not None:
         target=None,
         operation='zcard',
     )
+    newrelic.agent.wrap_datastore_trace(
+        AioRedisDataSource,
+        'zincrby',
+        product='Redis',
+        target=None,
+        operation='zincrby',
+    )
+    newrelic.agent.wrap_datastore_trace(
+        AioRedisDataSource,
+        'zrem',
+        product='Redis',
+        target=None,
+        operation='zrem',
+    )
+    newrelic.agent.wrap_datastore_trace(
+        AioRedisDataSource,
+        'zadd_if_exists',
+        product='Redis',
+        target=None,
+        operation='eval',
+    )
+    newrelic.agent.wrap_datastore_trace(
+        AioRedisDataSource,
+        'zincrby_if_exists',
+        product='Redis',
+        target=None,
+        operation='eval',
+    )
 
     # GEOSPATIAL COMMANDS
     newrelic.agent.wrap_datastore_trace(
@@ -384,3 +848,24 @@ if newrelic is not None:
         target=None,
         operation='georadius',
     )
+    newrelic.agent.wrap_datastore_trace(
+        AioRedisDataSource,
+        'georadiusbymember',
+        product='Redis',
+        target=None,
+        operation='georadiusbymember',
+    )
+    newrelic.agent.wrap_datastore_trace(
+        AioRedisDataSource,
+        'geosearchbox',
+        product='Redis',
+        target=None,
+        operation='geosearch',
+    )
+    newrelic.agent.wrap_datastore_trace(
+        AioRedisDataSource,
+        'georadius_many',
+        product='Redis',
+        target=None,
+        operation='georadius',
+    )
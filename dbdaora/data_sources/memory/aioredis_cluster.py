@@ -0,0 +1,355 @@
+import asyncio
+import dataclasses
+from logging import Logger, getLogger
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from aioredis import Redis, ReplyError, create_redis, create_redis_pool
+from aioredis.errors import ConnectionClosedError, PipelineError, RedisError
+
+from dbdaora.hashring import DataSource, HashRing, hash_tag
+
+from . import MemoryDataSource, MemoryMultiExec
+from .aioredis import (
+    AioRedisDataSource,
+    AioRedisMultiExec,
+    ShardsAioRedisDataSource,
+    ShardsAioRedisMultiExec,
+)
+
+
+CLUSTER_SLOTS = 16384
+
+
+class ClusterHashRing(HashRing[DataSource]):
+    """Routes keys to the node serving their redis cluster slot.
+
+    ``slots`` maps each one of the 16384 slots to a node index.
+    """
+
+    def __init__(
+        self,
+        nodes: Sequence[DataSource],
+        nodes_size: Optional[int] = None,
+        names: Optional[Sequence[str]] = None,
+        slots: Optional[List[int]] = None,
+    ):
+        super().__init__(nodes, nodes_size, names)
+        self.slots = [0] * CLUSTER_SLOTS if slots is None else slots
+
+    def get_index(self, key: str) -> int:
+        return self.slots[key_slot(key)]
+
+    def add_node(self, node: DataSource, name: str) -> int:
+        self.nodes = [*self.nodes, node]
+        self.names = [*self.names, name]
+        self.nodes_size += 1
+        return self.nodes_size - 1
+
+
+class ClusterNodeAioRedisDataSource(AioRedisDataSource):
+    cluster: Optional['ClusterAioRedisDataSource'] = None
+
+    def execute(self, command: Any, *args: Any, **kwargs: Any) -> Any:
+        if self.cluster is None:
+            return super().execute(command, *args, **kwargs)
+
+        return asyncio.ensure_future(
+            self.cluster.execute_on(self, command, *args, **kwargs)
+        )
+
+    async def execute_asking(
+        self, command: Any, *args: Any, **kwargs: Any
+    ) -> Any:
+        async with self._pool_or_conn.get() as connection:
+            await connection.execute(b'ASKING')
+            return await connection.execute(command, *args, **kwargs)
+
+    async def mget_slots(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        slots_positions: Dict[int, List[int]] = {}
+
+        for position, key in enumerate(keys):
+            slots_positions.setdefault(key_slot(key), []).append(position)
+
+        pipeline = self.pipeline()
+
+        for positions in slots_positions.values():
+            pipeline.mget(*(keys[position] for position in positions))
+
+        values: List[Optional[bytes]] = [None] * len(keys)
+
+        for positions, slot_values in zip(
+            slots_positions.values(), await pipeline.execute()
+        ):
+            for position, value in zip(positions, slot_values):
+                values[position] = value
+
+        return values
+
+
+@dataclasses.dataclass
+class ClusterAioRedisMultiExec(ShardsAioRedisMultiExec):
+    slots_clients: Dict[int, AioRedisMultiExec] = dataclasses.field(
+        default_factory=dict
+    )
+
+    def get_client(self, key: str) -> AioRedisMultiExec:  # type: ignore
+        slot = key_slot(key)
+        client = self.slots_clients.get(slot)
+
+        if client is None:
+            hashring: ClusterHashRing[Any] = self.hashring  # type: ignore
+            node = hashring.nodes[hashring.slots[slot]]
+            client = self.slots_clients[slot] = AioRedisMultiExec(
+                node._pool_or_conn, node.__class__
+            )
+
+        return client
+
+
+@dataclasses.dataclass
+class ClusterAioRedisDataSource(ShardsAioRedisDataSource):
+    """Redis Cluster client with a connections pool per master node.
+
+    Keys are routed by the cluster slots map, loaded with CLUSTER SLOTS.
+    MOVED redirections update the map and schedule a full refresh, ASK
+    redirections are sent to the importing node without changing it.
+    """
+
+    hashring: ClusterHashRing[  # type: ignore
+        ClusterNodeAioRedisDataSource
+    ]
+    max_redirections: int = 5
+    commands_factory: Type[
+        ClusterNodeAioRedisDataSource
+    ] = ClusterNodeAioRedisDataSource
+    pool_options: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    refresh_task: Optional['asyncio.Future[None]'] = dataclasses.field(
+        default=None, repr=False, compare=False
+    )
+    logger: ClassVar[Logger] = getLogger(__name__)
+
+    async def execute_on(
+        self,
+        client: ClusterNodeAioRedisDataSource,
+        command: Any,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        asking = False
+
+        for redirections in range(self.max_redirections + 1):
+            try:
+                if asking:
+                    return await client.execute_asking(
+                        command, *args, **kwargs
+                    )
+
+                return await Redis.execute(client, command, *args, **kwargs)
+
+            except ReplyError as error:
+                redirection = parse_redirection(error)
+
+                if (
+                    redirection is None
+                    or redirections == self.max_redirections
+                ):
+                    raise
+
+                kind, slot, address = redirection
+                index = await self.get_node_index(address)
+                client = self.hashring.nodes[index]
+                asking = kind == 'ASK'
+
+                if not asking:
+                    self.hashring.slots[slot] = index
+                    self.schedule_refresh()
+
+            except (ConnectionClosedError, OSError):
+                self.schedule_refresh()
+                raise
+
+    async def mget(self, key: str, *keys: str) -> Sequence[Optional[bytes]]:
+        return await self.scatter(
+            (key,) + keys,
+            lambda client, keys: client.mget_slots(keys),  # type: ignore
+        )
+
+    async def scatter(
+        self,
+        keys: Sequence[str],
+        command: Callable[[MemoryDataSource, List[str]], Awaitable[Any]],
+    ) -> List[Any]:
+        try:
+            return await super().scatter(keys, command)
+
+        except PipelineError as error:
+            if not any(
+                isinstance(e, ReplyError) and parse_redirection(e)
+                for e in error.args[1]
+            ):
+                raise
+
+            await self.refresh_slots()
+            return await super().scatter(keys, command)
+
+    async def refresh_slots(self, *uris: str) -> None:
+        slots = None
+        error: Optional[BaseException] = None
+
+        for uri in uris:
+            try:
+                connection = await create_redis(uri, **self.pool_options)
+            except (OSError, RedisError) as connection_error:
+                error = connection_error
+                continue
+
+            try:
+                slots = await connection.execute(b'CLUSTER', b'SLOTS')
+                break
+            except (OSError, RedisError) as slots_error:
+                error = slots_error
+            finally:
+                connection.close()
+                await connection.wait_closed()
+
+        else:
+            for node in self.hashring.nodes:
+                try:
+                    slots = await Redis.execute(node, b'CLUSTER', b'SLOTS')
+                    break
+                except (OSError, RedisError) as slots_error:
+                    error = slots_error
+
+        if slots is None:
+            raise error or RedisError('no cluster nodes to refresh the slots')
+
+        for start, end, master, *_ in slots:
+            index = await self.get_node_index(
+                f'{decode(master[0]) or "127.0.0.1"}:{master[1]}'
+            )
+            self.hashring.slots[start : end + 1] = [index] * (  # noqa
+                end - start + 1
+            )
+
+    def schedule_refresh(self) -> None:
+        if self.refresh_task is None or self.refresh_task.done():
+            self.refresh_task = asyncio.ensure_future(self.refresh_slots())
+            self.refresh_task.add_done_callback(self.log_refresh_error)
+
+    def log_refresh_error(self, task: 'asyncio.Future[None]') -> None:
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.warning(
+                'cluster slots refresh failed', exc_info=task.exception()
+            )
+
+    async def get_node_index(self, address: str) -> int:
+        if address in self.hashring.names:
+            return self.hashring.names.index(address)
+
+        client: ClusterNodeAioRedisDataSource = await create_redis_pool(  # type: ignore
+            f'redis://{address}',
+            commands_factory=self.commands_factory,
+            **self.pool_options,
+        )
+
+        if address in self.hashring.names:
+            client.close()
+            await client.wait_closed()
+            return self.hashring.names.index(address)
+
+        client.cluster = self
+        return self.hashring.add_node(client, address)
+
+    def close(self) -> None:
+        if self.refresh_task is not None:
+            self.refresh_task.cancel()
+
+        super().close()
+
+    def multi_exec(self) -> MemoryMultiExec:
+        return ClusterAioRedisMultiExec(self.hashring)  # type: ignore
+
+
+async def make(
+    *uris: str,
+    max_redirections: int = 5,
+    commands_factory: Type[
+        ClusterNodeAioRedisDataSource
+    ] = ClusterNodeAioRedisDataSource,
+    **pool_options: Any,
+) -> ClusterAioRedisDataSource:
+    if len(uris) == 0:
+        uris = ('redis://',)
+
+    data_source = ClusterAioRedisDataSource(
+        ClusterHashRing([]),
+        max_redirections=max_redirections,
+        commands_factory=commands_factory,
+        pool_options=pool_options,
+    )
+    await data_source.refresh_slots(*uris)
+    return data_source
+
+
+def make_crc16_table() -> List[int]:
+    table = []
+
+    for byte in range(256):
+        crc = byte << 8
+
+        for _ in range(8):
+            crc = (crc << 1) ^ 0x1021 if crc & 0x8000 else crc << 1
+
+        table.append(crc & 0xFFFF)
+
+    return table
+
+
+CRC16_TABLE = make_crc16_table()
+
+
+def crc16(data: bytes) -> int:
+    crc = 0
+
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFF) ^ CRC16_TABLE[(crc >> 8) ^ byte]
+
+    return crc
+
+
+def key_slot(key: Union[str, bytes]) -> int:
+    if isinstance(key, bytes):
+        key = key.decode('utf-8', 'surrogateescape')
+
+    elif not isinstance(key, str):
+        key = str(key)
+
+    return (
+        crc16(hash_tag(key).encode('utf-8', 'surrogateescape')) % CLUSTER_SLOTS
+    )
+
+
+def parse_redirection(error: ReplyError) -> Optional[Tuple[str, int, str]]:
+    message = str(error.args[0]) if error.args else ''
+
+    if message.startswith('MOVED ') or message.startswith('ASK '):
+        kind, slot, address = message.split(' ', 2)
+        return kind, int(slot), address
+
+    return None
+
+
+def decode(value: Union[str, bytes]) -> str:
+    return value.decode() if isinstance(value, bytes) else value
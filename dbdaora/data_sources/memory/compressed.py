@@ -0,0 +1,416 @@
+import dataclasses
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from dbdaora.compression import Compression
+
+from . import (
+    GeoMember,
+    GeoPoint,
+    GeoRadiusOutput,
+    MemoryDataSource,
+    MemoryMultiExec,
+    RangeOutput,
+)
+
+
+@dataclasses.dataclass
+class CompressedMemoryMultiExec(MemoryMultiExec):
+    multi_exec: MemoryMultiExec
+    compression: Compression
+
+    def delete(self, key: str) -> Any:
+        return self.multi_exec.delete(key)
+
+    def hmset(
+        self,
+        key: str,
+        field: Union[str, bytes],
+        value: Union[str, bytes],
+        *pairs: Union[str, bytes],
+    ) -> Any:
+        return self.multi_exec.hmset(
+            key, *encode_pairs(self.compression, field, value, *pairs)
+        )
+
+    def zadd(
+        self, key: str, score: float, member: str, *pairs: Union[float, str]
+    ) -> Any:
+        return self.multi_exec.zadd(
+            key, *encode_pairs(self.compression, score, member, *pairs)
+        )
+
+    async def execute(self, *, return_exceptions: bool = False) -> Any:
+        return await self.multi_exec.execute(
+            return_exceptions=return_exceptions
+        )
+
+
+@dataclasses.dataclass
+class CompressedMemoryDataSource(MemoryDataSource):
+    """Compresses values above the compression size on the wrapped source.
+
+    Values are string values, hash values and sorted set members. Keys,
+    hash fields and geospatial members are not changed.
+    """
+
+    data_source: MemoryDataSource
+    compression: Compression = dataclasses.field(default_factory=Compression)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == 'data_source':
+            raise AttributeError(name)
+
+        return getattr(self.data_source, name)
+
+    @property
+    def geopoint_cls(self) -> Type[GeoPoint]:  # type: ignore
+        return self.data_source.geopoint_cls
+
+    @property
+    def geomember_cls(self) -> Type[GeoMember]:  # type: ignore
+        return self.data_source.geomember_cls
+
+    def make_key(self, *key_parts: str) -> str:
+        return self.data_source.make_key(*key_parts)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.compression.decode(  # type: ignore
+            await self.data_source.get(key)
+        )
+
+    async def set(self, key: str, data: Union[str, bytes]) -> None:
+        await self.data_source.set(key, self.compression.encode(data))
+
+    async def delete(self, key: str) -> None:
+        await self.data_source.delete(key)
+
+    async def expire(self, key: str, time: int) -> None:
+        await self.data_source.expire(key, time)
+
+    async def exists(self, key: str) -> int:
+        return await self.data_source.exists(key)
+
+    async def zrevrange(
+        self, key: str, start: int, stop: int, withscores: bool = False
+    ) -> Optional[RangeOutput]:
+        return self.decode_range(
+            await self.data_source.zrevrange(
+                key, start=start, stop=stop, withscores=withscores
+            )
+        )
+
+    async def zrange(
+        self,
+        key: str,
+        start: int = 0,
+        stop: int = -1,
+        withscores: bool = False,
+    ) -> Optional[RangeOutput]:
+        return self.decode_range(
+            await self.data_source.zrange(
+                key, start=start, stop=stop, withscores=withscores
+            )
+        )
+
+    async def zrevrangebyscore(
+        self,
+        key: str,
+        max: float = float('inf'),
+        min: float = float('-inf'),
+        withscores: bool = False,
+        offset: Optional[int] = None,
+        count: Optional[int] = None,
+    ) -> Optional[RangeOutput]:
+        return self.decode_range(
+            await self.data_source.zrevrangebyscore(
+                key,
+                max=max,
+                min=min,
+                withscores=withscores,
+                offset=offset,
+                count=count,
+            )
+        )
+
+    async def zrangebyscore(
+        self,
+        key: str,
+        min: float = float('-inf'),
+        max: float = float('inf'),
+        withscores: bool = False,
+        offset: Optional[int] = None,
+        count: Optional[int] = None,
+    ) -> Optional[RangeOutput]:
+        return self.decode_range(
+            await self.data_source.zrangebyscore(
+                key,
+                min=min,
+                max=max,
+                withscores=withscores,
+                offset=offset,
+                count=count,
+            )
+        )
+
+    async def zadd(
+        self, key: str, score: float, member: str, *pairs: Union[float, str]
+    ) -> None:
+        await self.data_source.zadd(
+            key, *encode_pairs(self.compression, score, member, *pairs)
+        )
+
+    async def zcard(self, key: str) -> int:
+        return await self.data_source.zcard(key)
+
+    async def zincrby(
+        self, key: str, increment: float, member: Union[str, bytes]
+    ) -> float:
+        return await self.data_source.zincrby(
+            key, increment, self.compression.encode(member)
+        )
+
+    async def zadd_if_exists(
+        self, key: str, score: float, member: Union[str, bytes]
+    ) -> bool:
+        return await self.data_source.zadd_if_exists(
+            key, score, self.compression.encode(member)
+        )
+
+    async def zincrby_if_exists(
+        self, key: str, increment: float, member: Union[str, bytes]
+    ) -> Optional[float]:
+        return await self.data_source.zincrby_if_exists(
+            key, increment, self.compression.encode(member)
+        )
+
+    async def zrem(
+        self, key: str, member: Union[str, bytes], *members: Union[str, bytes],
+    ) -> int:
+        return await self.data_source.zrem(
+            key,
+            self.compression.encode(member),
+            *(self.compression.encode(m) for m in members),
+        )
+
+    async def hmset(
+        self,
+        key: str,
+        field: Union[str, bytes],
+        value: Union[str, bytes],
+        *pairs: Union[str, bytes],
+    ) -> None:
+        await self.data_source.hmset(
+            key, *encode_pairs(self.compression, field, value, *pairs)
+        )
+
+    async def hmget(
+        self, key: str, field: Union[str, bytes], *fields: Union[str, bytes]
+    ) -> Sequence[Optional[bytes]]:
+        return [
+            self.compression.decode(value)
+            for value in await self.data_source.hmget(key, field, *fields)
+        ]
+
+    async def hgetall(self, key: str) -> Dict[bytes, bytes]:
+        return {
+            field: self.compression.decode(value)
+            for field, value in (await self.data_source.hgetall(key)).items()
+        }
+
+    async def mget(self, key: str, *keys: str) -> Sequence[Optional[bytes]]:
+        return [
+            self.compression.decode(value)
+            for value in await self.data_source.mget(key, *keys)
+        ]
+
+    async def hgetall_many(
+        self, keys: Sequence[str]
+    ) -> Sequence[Dict[bytes, bytes]]:
+        decode = self.compression.decode
+        return [
+            {field: decode(value) for field, value in data.items()}
+            for data in await self.data_source.hgetall_many(keys)
+        ]
+
+    async def exists_many(self, keys: Sequence[str]) -> Sequence[int]:
+        return await self.data_source.exists_many(keys)
+
+    async def expire_many(self, keys: Sequence[str], time: int) -> None:
+        await self.data_source.expire_many(keys, time)
+
+    def scan_keys(
+        self, match: str, count: int = 1000
+    ) -> AsyncIterator[Sequence[bytes]]:
+        return self.data_source.scan_keys(match, count)
+
+    async def dump_many(
+        self, keys: Sequence[Union[str, bytes]]
+    ) -> Sequence[Tuple[Optional[bytes], int]]:
+        return await self.data_source.dump_many(keys)
+
+    async def restore_many(
+        self, entries: Sequence[Tuple[str, int, bytes]], replace: bool = False
+    ) -> int:
+        return await self.data_source.restore_many(entries, replace)
+
+    def close(self) -> None:
+        self.data_source.close()
+
+    async def wait_closed(self) -> None:
+        await self.data_source.wait_closed()
+
+    def primary_data_source(self) -> MemoryDataSource:
+        primary = self.data_source.primary_data_source()
+
+        if primary is self.data_source:
+            return self
+
+        return dataclasses.replace(self, data_source=primary)
+
+    def multi_exec(self) -> MemoryMultiExec:
+        return CompressedMemoryMultiExec(
+            self.data_source.multi_exec(), self.compression
+        )
+
+    async def georadius(
+        self,
+        key: str,
+        longitude: float,
+        latitude: float,
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        return await self.data_source.georadius(
+            key,
+            longitude,
+            latitude,
+            radius,
+            unit,
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
+        )
+
+    async def georadiusbymember(
+        self,
+        key: str,
+        member: Union[str, bytes],
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        return await self.data_source.georadiusbymember(
+            key,
+            member,
+            radius,
+            unit,
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
+        )
+
+    async def geosearchbox(
+        self,
+        key: str,
+        longitude: float,
+        latitude: float,
+        width: float,
+        height: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        return await self.data_source.geosearchbox(
+            key,
+            longitude,
+            latitude,
+            width,
+            height,
+            unit,
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
+        )
+
+    async def georadius_many(
+        self,
+        key: str,
+        centers: Sequence[Tuple[float, float]],
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> Sequence[GeoRadiusOutput]:
+        return await self.data_source.georadius_many(
+            key,
+            centers,
+            radius,
+            unit,
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
+        )
+
+    async def geoadd(
+        self,
+        key: str,
+        longitude: float,
+        latitude: float,
+        member: Union[str, bytes],
+        *args: Any,
+        **kwargs: Any,
+    ) -> int:
+        return await self.data_source.geoadd(
+            key, longitude, latitude, member, *args, **kwargs
+        )
+
+    def decode_range(
+        self, data: Optional[RangeOutput]
+    ) -> Optional[RangeOutput]:
+        if not data:
+            return data
+
+        decode = self.compression.decode
+
+        return [
+            (decode(item[0]), item[1])
+            if isinstance(item, tuple)
+            else decode(item)
+            for item in data
+        ]
+
+
+def encode_pairs(compression: Compression, *pairs: Any) -> List[Any]:
+    return [
+        compression.encode(value) if i % 2 else value
+        for i, value in enumerate(pairs)
+    ]
@@ -1,15 +1,46 @@
 import dataclasses
-from typing import Any, Dict, Optional, Sequence, Union
+from bisect import bisect_left, bisect_right
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
-from . import MemoryDataSource, RangeOutput
+from . import GeoRadiusOutput, MemoryDataSource, RangeOutput
+from .geoindex import GeoIndex
+
+
+class DictGeoPoint(NamedTuple):
+    longitude: float
+    latitude: float
+
+
+class DictGeoMember(NamedTuple):
+    member: bytes
+    dist: Optional[float]
+    hash: Optional[int]
+    coord: Optional[DictGeoPoint]
 
 
 @dataclasses.dataclass
 class DictMemoryDataSource(MemoryDataSource):
     db: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    geopoint_cls: ClassVar[Type[DictGeoPoint]] = DictGeoPoint  # type: ignore
+    geomember_cls: ClassVar[Type[DictGeoMember]] = DictGeoMember  # type: ignore
+
+    async def get(self, key: str) -> Optional[bytes]:
+        data = self.db.get(key)
+        return data if data is None or isinstance(data, bytes) else None
 
-    async def set(self, key: str, data: str) -> None:
-        self.db[key] = data.encode()
+    async def set(self, key: str, data: Union[str, bytes]) -> None:
+        self.db[key] = data.encode() if isinstance(data, str) else data
 
     async def delete(self, key: str) -> None:
         self.db.pop(key, None)
@@ -34,20 +65,123 @@ class DictMemoryDataSource(MemoryDataSource):
 
         return [i[0] for i in self.db[key]]
 
+    async def zrangebyscore(
+        self,
+        key: str,
+        min: float = float('-inf'),
+        max: float = float('inf'),
+        withscores: bool = False,
+        offset: Optional[int] = None,
+        count: Optional[int] = None,
+    ) -> Optional[RangeOutput]:
+        data = self.range_by_score(key, min, max)
+
+        if data is None:
+            return None
+
+        return self.make_range_by_score(data, withscores, offset, count)
+
+    async def zrevrangebyscore(
+        self,
+        key: str,
+        max: float = float('inf'),
+        min: float = float('-inf'),
+        withscores: bool = False,
+        offset: Optional[int] = None,
+        count: Optional[int] = None,
+    ) -> Optional[RangeOutput]:
+        data = self.range_by_score(key, min, max)
+
+        if data is None:
+            return None
+
+        data.reverse()
+
+        return self.make_range_by_score(data, withscores, offset, count)
+
+    def range_by_score(
+        self, key: str, min: float, max: float
+    ) -> Optional[List[Tuple[bytes, float]]]:
+        data: Optional[List[Tuple[bytes, float]]] = self.db.get(key)
+
+        if data is None:
+            return None
+
+        scores = [score for _, score in data]
+        start = bisect_left(scores, min)
+        stop = bisect_right(scores, max)
+
+        return data[start:stop]
+
+    def make_range_by_score(
+        self,
+        data: List[Tuple[bytes, float]],
+        withscores: bool,
+        offset: Optional[int],
+        count: Optional[int],
+    ) -> RangeOutput:
+        if offset is not None:
+            stop = None if count is None or count < 0 else offset + count
+            data = data[offset:stop]
+
+        if withscores:
+            return data
+
+        return [member for member, _ in data]
+
     async def zadd(
         self, key: str, score: float, member: str, *pairs: Union[float, str]
     ) -> None:
         data = [score, member] + list(pairs)
-        self.db[key] = sorted(
-            [
-                (
-                    data[i].encode() if isinstance(data[i], str) else data[i],  # type: ignore
-                    data[i - 1],
-                )
-                for i in range(1, len(data), 2)
-            ],
-            key=lambda d: d[1],
+        members = dict(self.db.get(key, ()))
+        members.update(
+            (
+                data[i].encode() if isinstance(data[i], str) else data[i],  # type: ignore
+                data[i - 1],
+            )
+            for i in range(1, len(data), 2)
         )
+        self.db[key] = sorted(members.items(), key=lambda d: (d[1], d[0]))
+
+    async def zincrby(
+        self, key: str, increment: float, member: Union[str, bytes]
+    ) -> float:
+        member = member.encode() if isinstance(member, str) else member
+        score: float = dict(self.db.get(key, ())).get(member, 0) + increment
+        await self.zadd(key, score, member)  # type: ignore
+        return score
+
+    async def zadd_if_exists(
+        self, key: str, score: float, member: Union[str, bytes]
+    ) -> bool:
+        if key not in self.db:
+            return False
+
+        await self.zadd(key, score, member)  # type: ignore
+        return True
+
+    async def zincrby_if_exists(
+        self, key: str, increment: float, member: Union[str, bytes]
+    ) -> Optional[float]:
+        if key not in self.db:
+            return None
+
+        return await self.zincrby(key, increment, member)
+
+    async def zrem(
+        self, key: str, member: Union[str, bytes], *members: Union[str, bytes],
+    ) -> int:
+        removed = {
+            m.encode() if isinstance(m, str) else m
+            for m in (member,) + members
+        }
+        data = self.db.get(key, [])
+        self.db[key] = [d for d in data if d[0] not in removed]
+
+        if not self.db[key]:
+            self.db.pop(key)
+
+        return len(data) - len(self.db.get(key, ()))
 
     async def hmset(
         self,
@@ -94,3 +228,159 @@ class DictMemoryDataSource(MemoryDataSource):
             )
             for f, d in self.db.get(key, {}).items()
         }
+
+    async def mget(self, key: str, *keys: str) -> Sequence[Optional[bytes]]:
+        return [await self.get(k) for k in (key,) + keys]
+
+    async def hgetall_many(
+        self, keys: Sequence[str]
+    ) -> Sequence[Dict[bytes, bytes]]:
+        return [await self.hgetall(key) for key in keys]
+
+    async def exists_many(self, keys: Sequence[str]) -> Sequence[int]:
+        return [int(key in self.db) for key in keys]
+
+    async def expire_many(self, keys: Sequence[str], time: int) -> None:
+        ...
+
+    async def geoadd(
+        self,
+        key: str,
+        longitude: float,
+        latitude: float,
+        member: Union[str, bytes],
+        *args: Any,
+        **kwargs: Any,
+    ) -> int:
+        index = self.db.get(key)
+
+        if not isinstance(index, GeoIndex):
+            index = self.db[key] = GeoIndex()
+
+        return index.extend(
+            [(longitude, latitude, member)]
+            + [
+                (args[i], args[i + 1], args[i + 2])
+                for i in range(0, len(args), 3)
+            ]
+        )
+
+    async def georadius(
+        self,
+        key: str,
+        longitude: float,
+        latitude: float,
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        index = self.db.get(key)
+
+        if not isinstance(index, GeoIndex):
+            return []
+
+        return index.radius(
+            longitude,
+            latitude,
+            radius,
+            unit,
+            self.geomember_cls,  # type: ignore
+            self.geopoint_cls,  # type: ignore
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
+        )
+
+    async def georadiusbymember(
+        self,
+        key: str,
+        member: Union[str, bytes],
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        index = self.db.get(key)
+
+        if not isinstance(index, GeoIndex):
+            return []
+
+        return index.radius_by_member(
+            member,
+            radius,
+            unit,
+            self.geomember_cls,  # type: ignore
+            self.geopoint_cls,  # type: ignore
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
+        )
+
+    async def geosearchbox(
+        self,
+        key: str,
+        longitude: float,
+        latitude: float,
+        width: float,
+        height: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        index = self.db.get(key)
+
+        if not isinstance(index, GeoIndex):
+            return []
+
+        return index.box(
+            longitude,
+            latitude,
+            width,
+            height,
+            unit,
+            self.geomember_cls,  # type: ignore
+            self.geopoint_cls,  # type: ignore
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
+        )
+
+    async def georadius_many(
+        self,
+        key: str,
+        centers: Sequence[Tuple[float, float]],
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> Sequence[GeoRadiusOutput]:
+        return [
+            await self.georadius(
+                key,
+                longitude,
+                latitude,
+                radius,
+                unit,
+                with_dist=with_dist,
+                with_coord=with_coord,
+                count=count,
+                sort=sort,
+            )
+            for longitude, latitude in centers
+        ]
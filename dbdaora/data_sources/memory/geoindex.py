@@ -0,0 +1,517 @@
+import math
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from dbdaora.exceptions import InvalidGeoSpatialDataError
+
+from . import GeoMember, GeoPoint, GeoRadiusOutput
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+
+EARTH_RADIUS_IN_METERS = 6372797.560856
+DEG_TO_RAD = math.pi / 180.0
+GEO_STEP = 26
+GEO_STEP_SIZE = 1 << GEO_STEP
+GEO_LONG_MIN = -180.0
+GEO_LONG_MAX = 180.0
+GEO_LAT_MIN = -85.05112878
+GEO_LAT_MAX = 85.05112878
+GEO_LONG_SCALE = GEO_LONG_MAX - GEO_LONG_MIN
+GEO_LAT_SCALE = GEO_LAT_MAX - GEO_LAT_MIN
+UNITS_TO_METERS = {'m': 1.0, 'km': 1000.0, 'ft': 0.3048, 'mi': 1609.34}
+
+
+class GeoIndex:
+    """In-process geospatial index with the same semantics as Redis GEO.
+
+    Coordinates are quantized to the 52 bits geohash cell center used by
+    Redis and distances use the same haversine formula and earth radius,
+    so the results match the ones returned by GEORADIUS.
+    """
+
+    def __init__(self) -> None:
+        self.members: List[bytes] = []
+        self.positions: Dict[bytes, int] = {}
+        self.longitudes = array('d')
+        self.latitudes = array('d')
+        self.longitudes_rad = array('d')
+        self.latitudes_rad = array('d')
+        self.latitudes_cos = array('d')
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def add(
+        self, longitude: float, latitude: float, member: Union[str, bytes]
+    ) -> int:
+        member = member.encode() if isinstance(member, str) else member
+        longitude, latitude = quantize(longitude, latitude)
+        latitude_rad = latitude * DEG_TO_RAD
+        position = self.positions.get(member)
+
+        if position is None:
+            self.positions[member] = len(self.members)
+            self.members.append(member)
+            self.longitudes.append(longitude)
+            self.latitudes.append(latitude)
+            self.longitudes_rad.append(longitude * DEG_TO_RAD)
+            self.latitudes_rad.append(latitude_rad)
+            self.latitudes_cos.append(math.cos(latitude_rad))
+            return 1
+
+        self.longitudes[position] = longitude
+        self.latitudes[position] = latitude
+        self.longitudes_rad[position] = longitude * DEG_TO_RAD
+        self.latitudes_rad[position] = latitude_rad
+        self.latitudes_cos[position] = math.cos(latitude_rad)
+        return 0
+
+    def extend(
+        self, points: Iterable[Tuple[float, float, Union[str, bytes]]]
+    ) -> int:
+        if np is None:
+            return sum(
+                self.add(longitude, latitude, member)
+                for longitude, latitude, member in points
+            )
+
+        points = list(points)
+        longitudes, latitudes = quantize_many(
+            np.array([point[0] for point in points], dtype=float),
+            np.array([point[1] for point in points], dtype=float),
+        )
+        latitudes_rad = latitudes * DEG_TO_RAD
+        longitudes_rad = longitudes * DEG_TO_RAD
+        latitudes_cos = np.cos(latitudes_rad)
+        new_positions = []
+        updated_positions = []
+
+        for i, (_, _, member) in enumerate(points):
+            member = member.encode() if isinstance(member, str) else member
+            position = self.positions.get(member)
+
+            if position is None:
+                self.positions[member] = len(self.members)
+                self.members.append(member)
+                new_positions.append(i)
+            else:
+                updated_positions.append((position, i))
+
+        for array_, values in (
+            (self.longitudes, longitudes),
+            (self.latitudes, latitudes),
+            (self.longitudes_rad, longitudes_rad),
+            (self.latitudes_rad, latitudes_rad),
+            (self.latitudes_cos, latitudes_cos),
+        ):
+            array_.frombytes(values[new_positions].tobytes())
+
+            for position, i in updated_positions:
+                array_[position] = values[i]
+
+        return len(new_positions)
+
+    def position(
+        self, member: Union[str, bytes]
+    ) -> Optional[Tuple[float, float]]:
+        member = member.encode() if isinstance(member, str) else member
+        position = self.positions.get(member)
+
+        if position is None:
+            return None
+
+        return self.longitudes[position], self.latitudes[position]
+
+    def radius(
+        self,
+        longitude: float,
+        latitude: float,
+        radius: float,
+        unit: str,
+        geomember_cls: Type[GeoMember],
+        geopoint_cls: Type[GeoPoint],
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        conversion = unit_to_meters(unit)
+        radius_meters = radius * conversion
+
+        if not self.members:
+            return []
+
+        if np is None:
+            found = self.radius_python(longitude, latitude, radius_meters)
+        else:
+            found = self.radius_numpy(longitude, latitude, radius_meters)
+
+        return self.make_output(
+            found,
+            conversion,
+            geomember_cls,
+            geopoint_cls,
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
+        )
+
+    def radius_by_member(
+        self,
+        member: Union[str, bytes],
+        radius: float,
+        unit: str,
+        geomember_cls: Type[GeoMember],
+        geopoint_cls: Type[GeoPoint],
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        position = self.position(member)
+
+        if position is None:
+            return []
+
+        return self.radius(
+            *position,
+            radius,
+            unit,
+            geomember_cls,
+            geopoint_cls,
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
+        )
+
+    def box(
+        self,
+        longitude: float,
+        latitude: float,
+        width: float,
+        height: float,
+        unit: str,
+        geomember_cls: Type[GeoMember],
+        geopoint_cls: Type[GeoPoint],
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        conversion = unit_to_meters(unit)
+        half_width_meters = width * conversion / 2
+        half_height_meters = height * conversion / 2
+
+        if not self.members:
+            return []
+
+        if np is None:
+            found = self.box_python(
+                longitude, latitude, half_width_meters, half_height_meters
+            )
+        else:
+            found = self.box_numpy(
+                longitude, latitude, half_width_meters, half_height_meters
+            )
+
+        return self.make_output(
+            found,
+            conversion,
+            geomember_cls,
+            geopoint_cls,
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
+        )
+
+    def make_output(
+        self,
+        found: List[Tuple[int, float]],
+        conversion: float,
+        geomember_cls: Type[GeoMember],
+        geopoint_cls: Type[GeoPoint],
+        *,
+        with_dist: bool,
+        with_coord: bool,
+        count: Optional[int],
+        sort: Optional[str],
+    ) -> GeoRadiusOutput:
+        if count is not None and sort is None:
+            sort = 'ASC'
+
+        if sort == 'ASC':
+            found.sort(key=lambda position_distance: position_distance[1])
+        elif sort == 'DESC':
+            found.sort(
+                key=lambda position_distance: position_distance[1],
+                reverse=True,
+            )
+        elif sort is not None:
+            raise ValueError("sort argument must be equal 'ASC' or 'DESC'")
+
+        if count is not None:
+            found = found[:count]
+
+        if not with_dist and not with_coord:
+            return [self.members[position] for position, _ in found]
+
+        return [
+            geomember_cls(
+                member=self.members[position],
+                dist=float(f'{distance / conversion:.4f}')
+                if with_dist
+                else None,
+                hash=None,
+                coord=geopoint_cls(
+                    longitude=self.longitudes[position],
+                    latitude=self.latitudes[position],
+                )
+                if with_coord
+                else None,
+            )
+            for position, distance in found
+        ]
+
+    def radius_python(
+        self, longitude: float, latitude: float, radius_meters: float
+    ) -> List[Tuple[int, float]]:
+        longitude_rad = longitude * DEG_TO_RAD
+        latitude_rad = latitude * DEG_TO_RAD
+        latitude_cos = math.cos(latitude_rad)
+        found = []
+
+        for position in range(len(self.members)):
+            u = math.sin((self.latitudes_rad[position] - latitude_rad) / 2)
+            v = math.sin((self.longitudes_rad[position] - longitude_rad) / 2)
+            distance = (
+                2.0
+                * EARTH_RADIUS_IN_METERS
+                * math.asin(
+                    math.sqrt(
+                        u * u
+                        + latitude_cos * self.latitudes_cos[position] * v * v
+                    )
+                )
+            )
+
+            if distance <= radius_meters:
+                found.append((position, distance))
+
+        return found
+
+    def radius_numpy(
+        self, longitude: float, latitude: float, radius_meters: float
+    ) -> List[Tuple[int, float]]:
+        longitude_rad = longitude * DEG_TO_RAD
+        latitude_rad = latitude * DEG_TO_RAD
+        u = np.sin((np.frombuffer(self.latitudes_rad) - latitude_rad) / 2)
+        v = np.sin((np.frombuffer(self.longitudes_rad) - longitude_rad) / 2)
+        haversine = (
+            u * u
+            + math.cos(latitude_rad)
+            * np.frombuffer(self.latitudes_cos)
+            * v
+            * v
+        )
+
+        # pre-filter by the haversine term to compute the exact distance
+        # only for the candidates, keeping a margin for rounding errors
+        max_haversine = math.sin(
+            min(radius_meters / (2.0 * EARTH_RADIUS_IN_METERS), math.pi / 2)
+        )
+        candidates = np.flatnonzero(
+            haversine <= max_haversine * max_haversine * (1 + 1e-9) + 1e-18
+        )
+        distances = (
+            2.0
+            * EARTH_RADIUS_IN_METERS
+            * np.arcsin(np.sqrt(haversine[candidates]))
+        )
+        in_radius = distances <= radius_meters
+
+        return list(
+            zip(candidates[in_radius].tolist(), distances[in_radius].tolist(),)
+        )
+
+    def box_python(
+        self,
+        longitude: float,
+        latitude: float,
+        half_width_meters: float,
+        half_height_meters: float,
+    ) -> List[Tuple[int, float]]:
+        longitude_rad = longitude * DEG_TO_RAD
+        latitude_rad = latitude * DEG_TO_RAD
+        latitude_cos = math.cos(latitude_rad)
+        found = []
+
+        for position in range(len(self.members)):
+            latitude_distance = EARTH_RADIUS_IN_METERS * abs(
+                self.latitudes_rad[position] - latitude_rad
+            )
+
+            if latitude_distance > half_height_meters:
+                continue
+
+            v = math.sin((self.longitudes_rad[position] - longitude_rad) / 2)
+            longitude_distance = (
+                2.0
+                * EARTH_RADIUS_IN_METERS
+                * math.asin(abs(self.latitudes_cos[position] * v))
+            )
+
+            if longitude_distance > half_width_meters:
+                continue
+
+            u = math.sin((self.latitudes_rad[position] - latitude_rad) / 2)
+            distance = (
+                2.0
+                * EARTH_RADIUS_IN_METERS
+                * math.asin(
+                    math.sqrt(
+                        u * u
+                        + latitude_cos * self.latitudes_cos[position] * v * v
+                    )
+                )
+            )
+            found.append((position, distance))
+
+        return found
+
+    def box_numpy(
+        self,
+        longitude: float,
+        latitude: float,
+        half_width_meters: float,
+        half_height_meters: float,
+    ) -> List[Tuple[int, float]]:
+        longitude_rad = longitude * DEG_TO_RAD
+        latitude_rad = latitude * DEG_TO_RAD
+        latitudes_rad = np.frombuffer(self.latitudes_rad)
+        latitudes_cos = np.frombuffer(self.latitudes_cos)
+        v = np.sin((np.frombuffer(self.longitudes_rad) - longitude_rad) / 2)
+        in_box = (
+            EARTH_RADIUS_IN_METERS * np.abs(latitudes_rad - latitude_rad)
+            <= half_height_meters
+        ) & (
+            2.0 * EARTH_RADIUS_IN_METERS * np.arcsin(np.abs(latitudes_cos * v))
+            <= half_width_meters
+        )
+        candidates = np.flatnonzero(in_box)
+        u = np.sin((latitudes_rad[candidates] - latitude_rad) / 2)
+        v = v[candidates]
+        distances = (
+            2.0
+            * EARTH_RADIUS_IN_METERS
+            * np.arcsin(
+                np.sqrt(
+                    u * u
+                    + math.cos(latitude_rad)
+                    * latitudes_cos[candidates]
+                    * v
+                    * v
+                )
+            )
+        )
+
+        return list(zip(candidates.tolist(), distances.tolist()))
+
+
+def unit_to_meters(unit: str) -> float:
+    try:
+        return UNITS_TO_METERS[unit]
+    except KeyError:
+        raise ValueError(f'unsupported distance unit: {unit}')
+
+
+def quantize(longitude: float, latitude: float) -> Tuple[float, float]:
+    if not (
+        GEO_LONG_MIN <= longitude <= GEO_LONG_MAX
+        and GEO_LAT_MIN <= latitude <= GEO_LAT_MAX
+    ):
+        raise InvalidGeoSpatialDataError(longitude, latitude)
+
+    longitude_cell = min(
+        int((longitude - GEO_LONG_MIN) / GEO_LONG_SCALE * GEO_STEP_SIZE),
+        GEO_STEP_SIZE - 1,
+    )
+    latitude_cell = min(
+        int((latitude - GEO_LAT_MIN) / GEO_LAT_SCALE * GEO_STEP_SIZE),
+        GEO_STEP_SIZE - 1,
+    )
+
+    return (
+        min(
+            cell_center(longitude_cell, GEO_LONG_MIN, GEO_LONG_SCALE),
+            GEO_LONG_MAX,
+        ),
+        max(
+            min(
+                cell_center(latitude_cell, GEO_LAT_MIN, GEO_LAT_SCALE),
+                GEO_LAT_MAX,
+            ),
+            GEO_LAT_MIN,
+        ),
+    )
+
+
+def quantize_many(
+    longitudes: 'np.ndarray', latitudes: 'np.ndarray'
+) -> Tuple['np.ndarray', 'np.ndarray']:
+    if not (
+        np.all((longitudes >= GEO_LONG_MIN) & (longitudes <= GEO_LONG_MAX))
+        and np.all((latitudes >= GEO_LAT_MIN) & (latitudes <= GEO_LAT_MAX))
+    ):
+        raise InvalidGeoSpatialDataError(longitudes, latitudes)
+
+    longitudes_cells = np.minimum(
+        ((longitudes - GEO_LONG_MIN) / GEO_LONG_SCALE * GEO_STEP_SIZE).astype(
+            np.int64
+        ),
+        GEO_STEP_SIZE - 1,
+    )
+    latitudes_cells = np.minimum(
+        ((latitudes - GEO_LAT_MIN) / GEO_LAT_SCALE * GEO_STEP_SIZE).astype(
+            np.int64
+        ),
+        GEO_STEP_SIZE - 1,
+    )
+
+    return (
+        np.minimum(
+            cell_center(longitudes_cells, GEO_LONG_MIN, GEO_LONG_SCALE),
+            GEO_LONG_MAX,
+        ),
+        np.maximum(
+            np.minimum(
+                cell_center(latitudes_cells, GEO_LAT_MIN, GEO_LAT_SCALE),
+                GEO_LAT_MAX,
+            ),
+            GEO_LAT_MIN,
+        ),
+    )
+
+
+def cell_center(cell: Any, range_min: float, range_scale: float) -> Any:
+    cell_min = range_min + (cell * 1.0 / GEO_STEP_SIZE) * range_scale
+    cell_max = range_min + ((cell + 1) * 1.0 / GEO_STEP_SIZE) * range_scale
+    return (cell_min + cell_max) / 2
+
+
+def make_index(
+    points: Iterable[Tuple[float, float, Union[str, bytes]]]
+) -> GeoIndex:
+    index = GeoIndex()
+    index.extend(points)
+    return index
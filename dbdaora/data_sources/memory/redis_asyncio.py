@@ -0,0 +1,670 @@
+import asyncio
+import dataclasses
+import functools
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import ConnectionError, ResponseError, TimeoutError
+
+from dbdaora.hashring import HashRing
+
+from . import (
+    ZADD_IF_EXISTS_SCRIPT,
+    ZINCRBY_IF_EXISTS_SCRIPT,
+    GeoRadiusOutput,
+    MemoryDataSource,
+    MemoryMultiExec,
+    RangeOutput,
+)
+from .shards import ShardsMemoryDataSource
+
+
+class RedisGeoPoint(NamedTuple):
+    longitude: float
+    latitude: float
+
+
+class RedisGeoMember(NamedTuple):
+    member: bytes
+    dist: Optional[float]
+    hash: Optional[int]
+    coord: Optional[RedisGeoPoint]
+
+
+@dataclasses.dataclass(eq=False)
+class RedisAsyncioMultiExec(MemoryMultiExec):
+    pipeline: Pipeline
+    futures: List['asyncio.Future[Any]'] = dataclasses.field(
+        default_factory=list
+    )
+
+    def delete(self, key: str) -> Any:
+        self.pipeline.delete(key)
+        return self.make_future()
+
+    def hmset(
+        self,
+        key: str,
+        field: Union[str, bytes],
+        value: Union[str, bytes],
+        *pairs: Union[str, bytes],
+    ) -> Any:
+        self.pipeline.hset(key, mapping=make_mapping(field, value, *pairs))
+        return self.make_future()
+
+    def zadd(
+        self, key: str, score: float, member: str, *pairs: Union[float, str]
+    ) -> Any:
+        self.pipeline.zadd(key, make_mapping(member, score, *pairs[::-1]))
+        return self.make_future()
+
+    def make_future(self) -> 'asyncio.Future[Any]':
+        future = asyncio.get_event_loop().create_future()
+        self.futures.append(future)
+        return future
+
+    async def execute(self, *, return_exceptions: bool = False) -> Any:
+        try:
+            results = await self.pipeline.execute(
+                raise_on_error=not return_exceptions
+            )
+        except BaseException:
+            for future in self.futures:
+                future.cancel()
+
+            self.futures.clear()
+            raise
+
+        for future, result in zip(self.futures, results):
+            future.set_result(result)
+
+        self.futures.clear()
+        return results
+
+
+@dataclasses.dataclass(eq=False)
+class RedisAsyncioDataSource(MemoryDataSource):
+    client: Redis
+    primary_of: Optional['ReplicasRedisAsyncioDataSource'] = None
+    geopoint_cls: ClassVar[Type[RedisGeoPoint]] = RedisGeoPoint  # type: ignore
+    geomember_cls: ClassVar[Type[RedisGeoMember]] = RedisGeoMember  # type: ignore
+
+    def pipeline(self, transaction: bool = False) -> Pipeline:
+        return self.client.pipeline(transaction=transaction)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(key)  # type: ignore
+
+    async def set(self, key: str, data: Union[str, bytes]) -> None:
+        await self.client.set(key, data)
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(key)
+
+    async def expire(self, key: str, time: int) -> None:
+        await self.client.expire(key, time)
+
+    async def exists(self, key: str) -> int:
+        return await self.client.exists(key)  # type: ignore
+
+    async def zrevrange(
+        self, key: str, start: int, stop: int, withscores: bool = False
+    ) -> Optional[RangeOutput]:
+        return make_range(
+            await self.client.zrevrange(
+                key, start, stop, withscores=withscores
+            ),
+            withscores,
+        )
+
+    async def zrange(
+        self,
+        key: str,
+        start: int = 0,
+        stop: int = -1,
+        withscores: bool = False,
+    ) -> Optional[RangeOutput]:
+        return make_range(
+            await self.client.zrange(key, start, stop, withscores=withscores),
+            withscores,
+        )
+
+    async def zrevrangebyscore(
+        self,
+        key: str,
+        max: float = float('inf'),
+        min: float = float('-inf'),
+        withscores: bool = False,
+        offset: Optional[int] = None,
+        count: Optional[int] = None,
+    ) -> Optional[RangeOutput]:
+        return make_range(
+            await self.client.zrevrangebyscore(
+                key,
+                make_score(max),
+                make_score(min),
+                *make_limit(offset, count),
+                withscores=withscores,
+            ),
+            withscores,
+        )
+
+    async def zrangebyscore(
+        self,
+        key: str,
+        min: float = float('-inf'),
+        max: float = float('inf'),
+        withscores: bool = False,
+        offset: Optional[int] = None,
+        count: Optional[int] = None,
+    ) -> Optional[RangeOutput]:
+        return make_range(
+            await self.client.zrangebyscore(
+                key,
+                make_score(min),
+                make_score(max),
+                *make_limit(offset, count),
+                withscores=withscores,
+            ),
+            withscores,
+        )
+
+    async def zadd(
+        self, key: str, score: float, member: str, *pairs: Union[float, str]
+    ) -> None:
+        await self.client.zadd(key, make_mapping(member, score, *pairs[::-1]))
+
+    async def zcard(self, key: str) -> int:
+        return await self.client.zcard(key)  # type: ignore
+
+    async def zincrby(
+        self, key: str, increment: float, member: Union[str, bytes]
+    ) -> float:
+        return await self.client.zincrby(key, increment, member)  # type: ignore
+
+    async def zrem(
+        self, key: str, member: Union[str, bytes], *members: Union[str, bytes],
+    ) -> int:
+        return await self.client.zrem(key, member, *members)  # type: ignore
+
+    async def zadd_if_exists(
+        self, key: str, score: float, member: Union[str, bytes]
+    ) -> bool:
+        return (
+            await self.client.eval(
+                ZADD_IF_EXISTS_SCRIPT, 1, key, score, member
+            )
+            is not None
+        )
+
+    async def zincrby_if_exists(
+        self, key: str, increment: float, member: Union[str, bytes]
+    ) -> Optional[float]:
+        score = await self.client.eval(
+            ZINCRBY_IF_EXISTS_SCRIPT, 1, key, increment, member
+        )
+        return None if score is None else float(score)
+
+    async def hmset(
+        self,
+        key: str,
+        field: Union[str, bytes],
+        value: Union[str, bytes],
+        *pairs: Union[str, bytes],
+    ) -> None:
+        await self.client.hset(key, mapping=make_mapping(field, value, *pairs))
+
+    async def hmget(
+        self, key: str, field: Union[str, bytes], *fields: Union[str, bytes]
+    ) -> Sequence[Optional[bytes]]:
+        return await self.client.hmget(key, field, *fields)  # type: ignore
+
+    async def hgetall(self, key: str) -> Dict[bytes, bytes]:
+        return await self.client.hgetall(key)  # type: ignore
+
+    async def mget(self, key: str, *keys: str) -> Sequence[Optional[bytes]]:
+        return await self.client.mget(key, *keys)  # type: ignore
+
+    async def hgetall_many(
+        self, keys: Sequence[str]
+    ) -> Sequence[Dict[bytes, bytes]]:
+        pipeline = self.pipeline()
+
+        for key in keys:
+            pipeline.hgetall(key)
+
+        return await pipeline.execute()
+
+    async def exists_many(self, keys: Sequence[str]) -> Sequence[int]:
+        pipeline = self.pipeline()
+
+        for key in keys:
+            pipeline.exists(key)
+
+        return await pipeline.execute()
+
+    async def expire_many(self, keys: Sequence[str], time: int) -> None:
+        pipeline = self.pipeline()
+
+        for key in keys:
+            pipeline.expire(key, time)
+
+        await pipeline.execute()
+
+    def close(self) -> None:
+        ...
+
+    async def wait_closed(self) -> None:
+        if self.primary_of is not None:
+            await self.primary_of.wait_closed()
+            return
+
+        await self.client.aclose()
+        await self.client.connection_pool.disconnect()
+
+    def multi_exec(self) -> MemoryMultiExec:
+        return RedisAsyncioMultiExec(self.pipeline(transaction=True))
+
+    async def georadius(
+        self,
+        key: str,
+        longitude: float,
+        latitude: float,
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        return self.make_geomembers(
+            await self.client.georadius(
+                key,
+                longitude,
+                latitude,
+                radius,
+                unit=unit,
+                withdist=with_dist,
+                withcoord=with_coord,
+                count=count,
+                sort=sort,
+            ),
+            with_dist,
+            with_coord,
+        )
+
+    async def georadiusbymember(
+        self,
+        key: str,
+        member: Union[str, bytes],
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        try:
+            members = await self.client.georadiusbymember(
+                key,
+                member,
+                radius,
+                unit=unit,
+                withdist=with_dist,
+                withcoord=with_coord,
+                count=count,
+                sort=sort,
+            )
+        except ResponseError as error:
+            if 'could not decode requested zset member' in str(error):
+                return []
+
+            raise
+
+        return self.make_geomembers(members, with_dist, with_coord)
+
+    async def geosearchbox(
+        self,
+        key: str,
+        longitude: float,
+        latitude: float,
+        width: float,
+        height: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        return self.make_geomembers(
+            await self.client.geosearch(
+                key,
+                longitude=longitude,
+                latitude=latitude,
+                width=width,
+                height=height,
+                unit=unit,
+                withdist=with_dist,
+                withcoord=with_coord,
+                count=count,
+                sort=sort,
+            ),
+            with_dist,
+            with_coord,
+        )
+
+    async def georadius_many(
+        self,
+        key: str,
+        centers: Sequence[Tuple[float, float]],
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> Sequence[GeoRadiusOutput]:
+        pipeline = self.pipeline()
+
+        for longitude, latitude in centers:
+            pipeline.georadius(
+                key,
+                longitude,
+                latitude,
+                radius,
+                unit=unit,
+                withdist=with_dist,
+                withcoord=with_coord,
+                count=count,
+                sort=sort,
+            )
+
+        return [
+            self.make_geomembers(members, with_dist, with_coord)
+            for members in await pipeline.execute()
+        ]
+
+    async def geoadd(
+        self,
+        key: str,
+        longitude: float,
+        latitude: float,
+        member: Union[str, bytes],
+        *args: Any,
+        **kwargs: Any,
+    ) -> int:
+        return await self.client.geoadd(  # type: ignore
+            key, (longitude, latitude, member, *args), **kwargs
+        )
+
+    def make_geomembers(
+        self, members: List[Any], with_dist: bool, with_coord: bool
+    ) -> GeoRadiusOutput:
+        if not with_dist and not with_coord:
+            return members
+
+        geomembers = []
+
+        for data in members:
+            dist = data[1] if with_dist else None
+            coord = self.geopoint_cls(*data[-1]) if with_coord else None
+            geomembers.append(self.geomember_cls(data[0], dist, None, coord))
+
+        return geomembers  # type: ignore
+
+
+@dataclasses.dataclass(eq=False)
+class ReplicasRedisAsyncioDataSource(RedisAsyncioDataSource):
+    """Sends the read commands to the replicas and the writes to the primary.
+
+    Works like the aioredis ``ReplicasAioRedisDataSource``.
+    """
+
+    replicas: Sequence[RedisAsyncioDataSource] = ()
+    replicas_balance: str = 'round_robin'
+    primary_commands_factory: Type[
+        RedisAsyncioDataSource
+    ] = RedisAsyncioDataSource
+
+    def __post_init__(self) -> None:
+        self.set_replicas(self.replicas, self.replicas_balance)
+
+    def set_replicas(
+        self,
+        replicas: Sequence[RedisAsyncioDataSource],
+        balance: str = 'round_robin',
+    ) -> None:
+        self.replicas = replicas
+        self.replicas_balance = balance
+        self.replicas_pending = [0] * len(replicas)
+        self.replicas_position = 0
+
+    def get_replica_index(self) -> int:
+        if self.replicas_balance == 'least_loaded':
+            return min(
+                range(len(self.replicas)),
+                key=self.replicas_pending.__getitem__,
+            )
+
+        self.replicas_position = (self.replicas_position + 1) % len(
+            self.replicas
+        )
+        return self.replicas_position
+
+    async def read(
+        self, command: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        if not self.replicas:
+            return await command(self, *args, **kwargs)
+
+        index = self.get_replica_index()
+        self.replicas_pending[index] += 1
+
+        try:
+            return await command(self.replicas[index], *args, **kwargs)
+
+        except (ConnectionError, TimeoutError, OSError):
+            return await command(self, *args, **kwargs)
+
+        finally:
+            self.replicas_pending[index] -= 1
+
+    async def wait_closed(self) -> None:
+        await super().wait_closed()
+
+        for replica in self.replicas:
+            await replica.wait_closed()
+
+    def primary_data_source(self) -> MemoryDataSource:
+        return self.primary_commands_factory(self.client, primary_of=self)
+
+
+REPLICAS_READ_COMMANDS = (
+    'get',
+    'exists',
+    'zrevrange',
+    'zrange',
+    'zrevrangebyscore',
+    'zrangebyscore',
+    'zcard',
+    'hmget',
+    'hgetall',
+    'mget',
+    'hgetall_many',
+    'exists_many',
+    'georadius',
+    'georadiusbymember',
+    'geosearchbox',
+    'georadius_many',
+)
+
+
+def make_read_command(name: str) -> Callable[..., Awaitable[Any]]:
+    command = getattr(RedisAsyncioDataSource, name)
+
+    @functools.wraps(command)
+    async def read_command(
+        self: ReplicasRedisAsyncioDataSource, *args: Any, **kwargs: Any
+    ) -> Any:
+        return await self.read(command, *args, **kwargs)
+
+    return read_command
+
+
+for name in REPLICAS_READ_COMMANDS:
+    setattr(ReplicasRedisAsyncioDataSource, name, make_read_command(name))
+
+
+@dataclasses.dataclass
+class ShardsRedisAsyncioDataSource(ShardsMemoryDataSource):
+    hashring: HashRing[RedisAsyncioDataSource]  # type: ignore
+    geopoint_cls: ClassVar[Type[RedisGeoPoint]] = RedisGeoPoint  # type: ignore
+    geomember_cls: ClassVar[Type[RedisGeoMember]] = RedisGeoMember  # type: ignore
+
+    def get_client(self, key: str) -> RedisAsyncioDataSource:
+        return self.hashring.get_node(key)
+
+
+async def make(
+    *uris: str,
+    hashring_cls: Type[HashRing[RedisAsyncioDataSource]] = HashRing,
+    hashring_nodes_size: Optional[int] = None,
+    sharded_commands_factory: Type[
+        ShardsRedisAsyncioDataSource
+    ] = ShardsRedisAsyncioDataSource,
+    single_commands_factory: Type[
+        RedisAsyncioDataSource
+    ] = RedisAsyncioDataSource,
+    replicas: Optional[Sequence[Sequence[str]]] = None,
+    replicas_balance: str = 'round_robin',
+    replicas_commands_factory: Type[
+        ReplicasRedisAsyncioDataSource
+    ] = ReplicasRedisAsyncioDataSource,
+    pool_minsize: int = 1,
+    pool_maxsize: int = 10,
+    pool_timeout: Optional[float] = None,
+    protocol: int = 3,
+    hiredis: Optional[bool] = None,
+    health_check_interval: int = 0,
+    **connection_kwargs: Any,
+) -> Union[RedisAsyncioDataSource, ShardsRedisAsyncioDataSource]:
+    if len(uris) == 0:
+        uris = ('redis://',)
+
+    if hiredis is not None:
+        connection_kwargs['parser_class'] = get_parser_class(hiredis, protocol)
+
+    async def make_client(uri: str) -> Redis:
+        pool = BlockingConnectionPool.from_url(
+            uri,
+            max_connections=pool_maxsize,
+            timeout=pool_timeout,
+            protocol=protocol,
+            health_check_interval=health_check_interval,
+            **connection_kwargs,
+        )
+        await fill_pool(pool, pool_minsize)
+        return Redis(connection_pool=pool)
+
+    clients: List[RedisAsyncioDataSource] = []
+
+    for i, uri in enumerate(uris):
+        uri_replicas = replicas[i] if replicas and i < len(replicas) else ()
+
+        if uri_replicas:
+            clients.append(
+                replicas_commands_factory(
+                    await make_client(uri),
+                    replicas=[
+                        single_commands_factory(await make_client(replica))
+                        for replica in uri_replicas
+                    ],
+                    replicas_balance=replicas_balance,
+                    primary_commands_factory=single_commands_factory,
+                )
+            )
+        else:
+            clients.append(single_commands_factory(await make_client(uri)))
+
+    if len(clients) > 1:
+        hashring = hashring_cls(clients, hashring_nodes_size, uris)
+        return sharded_commands_factory(hashring)
+
+    return clients[0]
+
+
+async def fill_pool(pool: BlockingConnectionPool, size: int) -> None:
+    connections = await asyncio.gather(
+        *(pool.get_connection() for _ in range(size))
+    )
+
+    for connection in connections:
+        await pool.release(connection)
+
+
+def get_parser_class(hiredis: bool, protocol: int) -> Any:
+    if hiredis:
+        from redis._parsers import _AsyncHiredisParser
+        from redis.utils import HIREDIS_AVAILABLE
+
+        if not HIREDIS_AVAILABLE:
+            raise ImportError('hiredis')
+
+        return _AsyncHiredisParser
+
+    if protocol == 3:
+        from redis._parsers import _AsyncRESP3Parser
+
+        return _AsyncRESP3Parser
+
+    from redis._parsers import _AsyncRESP2Parser
+
+    return _AsyncRESP2Parser
+
+
+def make_mapping(*pairs: Any) -> Dict[Any, Any]:
+    return dict(zip(pairs[::2], pairs[1::2]))
+
+
+def make_range(data: Any, withscores: bool) -> Optional[RangeOutput]:
+    if withscores and data:
+        return [(member, float(score)) for member, score in data]
+
+    return data  # type: ignore
+
+
+def make_limit(
+    offset: Optional[int], count: Optional[int]
+) -> Tuple[Optional[int], Optional[int]]:
+    if offset is None and count is None:
+        return None, None
+
+    return offset or 0, -1 if count is None else count
+
+
+def make_score(score: float) -> Union[float, str]:
+    if score == float('inf'):
+        return '+inf'
+
+    if score == float('-inf'):
+        return '-inf'
+
+    return score
@@ -0,0 +1,425 @@
+import asyncio
+import dataclasses
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from dbdaora.hashring import HashRing
+
+from . import GeoRadiusOutput, MemoryDataSource, MemoryMultiExec, RangeOutput
+
+
+@dataclasses.dataclass
+class ShardsMemoryMultiExec(MemoryMultiExec):
+    hashring: HashRing[MemoryMultiExec]
+    futures: List[Any] = dataclasses.field(default_factory=list)
+    clients_to_execute: Set[MemoryMultiExec] = dataclasses.field(
+        default_factory=set
+    )
+
+    def get_client(self, key: str) -> MemoryMultiExec:
+        return self.hashring.get_node(key)
+
+    def delete(self, key: str) -> Any:
+        client = self.get_client(key)
+        future = client.delete(key)
+        self.clients_to_execute.add(client)
+        self.futures.append(future)
+        return future
+
+    def hmset(
+        self,
+        key: str,
+        field: Union[str, bytes],
+        value: Union[str, bytes],
+        *pairs: Union[str, bytes],
+    ) -> Any:
+        client = self.get_client(key)
+        future = client.hmset(key, field, value, *pairs)
+        self.clients_to_execute.add(client)
+        self.futures.append(future)
+        return future
+
+    def zadd(
+        self, key: str, score: float, member: str, *pairs: Union[float, str]
+    ) -> Any:
+        client = self.get_client(key)
+        future = client.zadd(key, score, member, *pairs)
+        self.clients_to_execute.add(client)
+        self.futures.append(future)
+        return future
+
+    async def execute(self, *, return_exceptions: bool = False) -> Any:
+        await asyncio.gather(
+            *[
+                client.execute(return_exceptions=return_exceptions)
+                for client in self.clients_to_execute
+            ]
+        )
+        self.clients_to_execute.clear()
+
+        results = await asyncio.gather(*self.futures)
+        self.futures.clear()
+        return results
+
+
+@dataclasses.dataclass
+class ShardsMemoryDataSource(MemoryDataSource):
+    hashring: HashRing[MemoryDataSource]
+
+    def get_client(self, key: str) -> MemoryDataSource:
+        return self.hashring.get_node(key)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.get_client(key).get(key)
+
+    async def set(self, key: str, data: Union[str, bytes]) -> None:
+        await self.get_client(key).set(key, data)
+
+    async def delete(self, key: str) -> None:
+        await self.get_client(key).delete(key)
+
+    async def expire(self, key: str, time: int) -> None:
+        await self.get_client(key).expire(key, time)
+
+    async def exists(self, key: str) -> int:
+        return await self.get_client(key).exists(key)
+
+    async def zrevrange(
+        self, key: str, start: int, stop: int, withscores: bool = False
+    ) -> Optional[RangeOutput]:
+        return await self.get_client(key).zrevrange(
+            key, start=start, stop=stop, withscores=withscores
+        )
+
+    async def zrange(
+        self,
+        key: str,
+        start: int = 0,
+        stop: int = -1,
+        withscores: bool = False,
+    ) -> Optional[RangeOutput]:
+        return await self.get_client(key).zrange(
+            key, start=start, stop=stop, withscores=withscores
+        )
+
+    async def zadd(
+        self, key: str, score: float, member: str, *pairs: Union[float, str]
+    ) -> None:
+        await self.get_client(key).zadd(key, score, member, *pairs)
+
+    async def zcard(self, key: str) -> int:
+        return await self.get_client(key).zcard(key)
+
+    async def zincrby(
+        self, key: str, increment: float, member: Union[str, bytes]
+    ) -> float:
+        return await self.get_client(key).zincrby(key, increment, member)
+
+    async def zrem(
+        self, key: str, member: Union[str, bytes], *members: Union[str, bytes],
+    ) -> int:
+        return await self.get_client(key).zrem(key, member, *members)
+
+    async def zadd_if_exists(
+        self, key: str, score: float, member: Union[str, bytes]
+    ) -> bool:
+        return await self.get_client(key).zadd_if_exists(key, score, member)
+
+    async def zincrby_if_exists(
+        self, key: str, increment: float, member: Union[str, bytes]
+    ) -> Optional[float]:
+        return await self.get_client(key).zincrby_if_exists(
+            key, increment, member
+        )
+
+    async def zrevrangebyscore(
+        self,
+        key: str,
+        max: float = float('inf'),
+        min: float = float('-inf'),
+        withscores: bool = False,
+        offset: Optional[int] = None,
+        count: Optional[int] = None,
+    ) -> Optional[RangeOutput]:
+        return await self.get_client(key).zrevrangebyscore(
+            key,
+            max=max,
+            min=min,
+            withscores=withscores,
+            offset=offset,
+            count=count,
+        )
+
+    async def zrangebyscore(
+        self,
+        key: str,
+        min: float = float('-inf'),
+        max: float = float('inf'),
+        withscores: bool = False,
+        offset: Optional[int] = None,
+        count: Optional[int] = None,
+    ) -> Optional[RangeOutput]:
+        return await self.get_client(key).zrangebyscore(
+            key,
+            min=min,
+            max=max,
+            withscores=withscores,
+            offset=offset,
+            count=count,
+        )
+
+    async def hmset(
+        self,
+        key: str,
+        field: Union[str, bytes],
+        value: Union[str, bytes],
+        *pairs: Union[str, bytes],
+    ) -> None:
+        await self.get_client(key).hmset(key, field, value, *pairs)
+
+    async def hmget(
+        self, key: str, field: Union[str, bytes], *fields: Union[str, bytes]
+    ) -> Sequence[Optional[bytes]]:
+        return await self.get_client(key).hmget(key, field, *fields)
+
+    async def hgetall(self, key: str) -> Dict[bytes, bytes]:
+        return await self.get_client(key).hgetall(key)
+
+    async def mget(self, key: str, *keys: str) -> Sequence[Optional[bytes]]:
+        return await self.scatter(
+            (key,) + keys, lambda client, keys: client.mget(*keys)
+        )
+
+    async def hgetall_many(
+        self, keys: Sequence[str]
+    ) -> Sequence[Dict[bytes, bytes]]:
+        return await self.scatter(
+            keys, lambda client, keys: client.hgetall_many(keys)
+        )
+
+    async def exists_many(self, keys: Sequence[str]) -> Sequence[int]:
+        return await self.scatter(
+            keys, lambda client, keys: client.exists_many(keys)
+        )
+
+    async def expire_many(self, keys: Sequence[str], time: int) -> None:
+        await self.scatter(
+            keys, lambda client, keys: client.expire_many(keys, time)
+        )
+
+    async def scan_keys(
+        self, match: str, count: int = 1000
+    ) -> AsyncIterator[Sequence[bytes]]:
+        for client in self.hashring.nodes:
+            async for keys in client.scan_keys(match, count):
+                yield keys
+
+    async def dump_many(
+        self, keys: Sequence[Union[str, bytes]]
+    ) -> Sequence[Tuple[Optional[bytes], int]]:
+        return await self.scatter(
+            [key.decode() if isinstance(key, bytes) else key for key in keys],
+            lambda client, keys: client.dump_many(keys),
+        )
+
+    async def restore_many(
+        self, entries: Sequence[Tuple[str, int, bytes]], replace: bool = False
+    ) -> int:
+        clients_entries: Dict[
+            MemoryDataSource, List[Tuple[str, int, bytes]]
+        ] = {}
+
+        for entry in entries:
+            clients_entries.setdefault(self.get_client(entry[0]), []).append(
+                entry
+            )
+
+        return sum(
+            await asyncio.gather(
+                *(
+                    client.restore_many(client_entries, replace)
+                    for client, client_entries in clients_entries.items()
+                )
+            )
+        )
+
+    async def scatter(
+        self,
+        keys: Sequence[str],
+        command: Callable[[MemoryDataSource, List[str]], Awaitable[Any]],
+    ) -> List[Any]:
+        positions: Dict[MemoryDataSource, List[int]] = {}
+
+        for position, key in enumerate(keys):
+            positions.setdefault(self.get_client(key), []).append(position)
+
+        results: List[Any] = [None] * len(keys)
+        clients_results = await asyncio.gather(
+            *(
+                command(client, [keys[p] for p in client_positions])
+                for client, client_positions in positions.items()
+            )
+        )
+
+        for client_positions, client_results in zip(
+            positions.values(), clients_results
+        ):
+            if client_results is None:
+                continue
+
+            for position, result in zip(client_positions, client_results):
+                results[position] = result
+
+        return results
+
+    async def georadius(
+        self,
+        key: str,
+        longitude: float,
+        latitude: float,
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        return await self.get_client(key).georadius(
+            key=key,
+            longitude=longitude,
+            latitude=latitude,
+            radius=radius,
+            unit=unit,
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
+        )
+
+    async def georadiusbymember(
+        self,
+        key: str,
+        member: Union[str, bytes],
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        return await self.get_client(key).georadiusbymember(
+            key,
+            member,
+            radius,
+            unit,
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
+        )
+
+    async def geosearchbox(
+        self,
+        key: str,
+        longitude: float,
+        latitude: float,
+        width: float,
+        height: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> GeoRadiusOutput:
+        return await self.get_client(key).geosearchbox(
+            key,
+            longitude,
+            latitude,
+            width,
+            height,
+            unit,
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
+        )
+
+    async def georadius_many(
+        self,
+        key: str,
+        centers: Sequence[Tuple[float, float]],
+        radius: float,
+        unit: str = 'm',
+        *,
+        with_dist: bool = False,
+        with_coord: bool = False,
+        count: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> Sequence[GeoRadiusOutput]:
+        return await self.get_client(key).georadius_many(
+            key,
+            centers,
+            radius,
+            unit,
+            with_dist=with_dist,
+            with_coord=with_coord,
+            count=count,
+            sort=sort,
+        )
+
+    async def geoadd(
+        self,
+        key: str,
+        longitude: float,
+        latitude: float,
+        member: Union[str, bytes],
+        *args: Any,
+        **kwargs: Any,
+    ) -> int:
+        return await self.get_client(key).geoadd(
+            key, longitude, latitude, member, *args, **kwargs,
+        )
+
+    def close(self) -> None:
+        for client in self.hashring.nodes:
+            client.close()
+
+    async def wait_closed(self) -> None:
+        for client in self.hashring.nodes:
+            await client.wait_closed()
+
+    def primary_data_source(self) -> MemoryDataSource:
+        nodes = [node.primary_data_source() for node in self.hashring.nodes]
+
+        if all(
+            node is primary
+            for node, primary in zip(self.hashring.nodes, nodes)
+        ):
+            return self
+
+        hashring = type(self.hashring)(
+            nodes, self.hashring.nodes_size, self.hashring.names
+        )
+        return dataclasses.replace(self, hashring=hashring)
+
+    def multi_exec(self) -> MemoryMultiExec:
+        hashring = type(self.hashring)(
+            [node.multi_exec() for node in self.hashring.nodes],  # type: ignore
+            self.hashring.nodes_size,
+            self.hashring.names,
+        )
+        return ShardsMemoryMultiExec(hashring)  # type: ignore
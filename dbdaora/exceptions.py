@@ -40,3 +40,23 @@ class InvalidGeoSpatialDataError(DBDaoraError):
 
 class CacheNotAvailableError(DBDaoraError):
     ...
+
+
+class InvalidCompressionError(DBDaoraError):
+    ...
+
+
+class InvalidSnapshotError(DBDaoraError):
+    ...
+
+
+class InvalidJournalError(DBDaoraError):
+    ...
+
+
+class WarmupNotSupportedError(DBDaoraError):
+    ...
+
+
+class WriteBehindNotSupportedError(DBDaoraError):
+    ...
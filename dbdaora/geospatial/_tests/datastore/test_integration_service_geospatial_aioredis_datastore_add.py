@@ -2,8 +2,6 @@ import asynctest
 import pytest
 from aioredis import RedisError
 
-from dbdaora import EntityNotFoundError
-
 
 @pytest.fixture
 def has_add_cb():
@@ -39,13 +37,13 @@ async def test_should_add_to_fallback_after_open_circuit_breaker(
     await fake_service.add(fake_entity_add)
     await fake_service.add(fake_entity_add2)
 
-    with pytest.raises(EntityNotFoundError):
-        await fake_service.get_one(
-            fake_id=fake_entity.fake_id,
-            fake2_id=fake_entity.fake2_id,
-            latitude=5,
-            longitude=6,
-            max_distance=1,
-        )
+    entity = await fake_service.get_one(
+        fake_id=fake_entity.fake_id,
+        fake2_id=fake_entity.fake2_id,
+        latitude=5,
+        longitude=6,
+        max_distance=1,
+    )
 
+    assert entity == fake_entity
     assert fake_service.logger.warning.call_count == 3
@@ -0,0 +1,152 @@
+import itertools
+import random
+
+import pytest
+
+from dbdaora import DictMemoryDataSource, make_aioredis_data_source
+from dbdaora.data_sources.memory import geoindex
+
+
+@pytest.fixture
+async def aioredis_data_source():
+    memory_data_source = await make_aioredis_data_source('redis://')
+    yield memory_data_source
+    await memory_data_source.delete('fake:geoindex')
+    memory_data_source.close()
+    await memory_data_source.wait_closed()
+
+
+@pytest.fixture
+def points():
+    random_ = random.Random(0)
+    return [
+        (
+            random_.uniform(-46.8, -46.4),
+            random_.uniform(-23.8, -23.4),
+            f'member{i}'.encode(),
+        )
+        for i in range(2000)
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('use_numpy', [True, False])
+async def test_should_get_same_members_as_redis(
+    aioredis_data_source, points, mocker, use_numpy
+):
+    if not use_numpy:
+        mocker.patch.object(geoindex, 'np', None)
+
+    dict_data_source = DictMemoryDataSource()
+    await aioredis_data_source.geoadd(
+        'fake:geoindex', *itertools.chain(*points)
+    )
+    await dict_data_source.geoadd('fake:geoindex', *itertools.chain(*points))
+
+    for unit, radius in (('m', 1500), ('km', 5), ('mi', 3), ('ft', 9000)):
+        expected = await aioredis_data_source.georadius(
+            'fake:geoindex',
+            -46.6,
+            -23.6,
+            radius,
+            unit,
+            with_dist=True,
+            with_coord=True,
+            sort='ASC',
+        )
+        members = await dict_data_source.georadius(
+            'fake:geoindex',
+            -46.6,
+            -23.6,
+            radius,
+            unit,
+            with_dist=True,
+            with_coord=True,
+            sort='ASC',
+        )
+
+        assert expected
+        assert [(m.member, m.dist, tuple(m.coord)) for m in members] == [
+            (m.member, m.dist, tuple(m.coord)) for m in expected
+        ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('use_numpy', [True, False])
+async def test_should_get_same_members_by_member_as_redis(
+    aioredis_data_source, points, mocker, use_numpy
+):
+    if not use_numpy:
+        mocker.patch.object(geoindex, 'np', None)
+
+    dict_data_source = DictMemoryDataSource()
+    await aioredis_data_source.geoadd(
+        'fake:geoindex', *itertools.chain(*points)
+    )
+    await dict_data_source.geoadd('fake:geoindex', *itertools.chain(*points))
+
+    for member in (b'member0', b'member1000', b'member1999'):
+        expected = await aioredis_data_source.georadiusbymember(
+            'fake:geoindex',
+            member,
+            3,
+            'km',
+            with_dist=True,
+            with_coord=True,
+            sort='DESC',
+        )
+        members = await dict_data_source.georadiusbymember(
+            'fake:geoindex',
+            member,
+            3,
+            'km',
+            with_dist=True,
+            with_coord=True,
+            sort='DESC',
+        )
+
+        assert expected
+        assert [(m.member, m.dist, tuple(m.coord)) for m in members] == [
+            (m.member, m.dist, tuple(m.coord)) for m in expected
+        ]
+
+
+@pytest.mark.asyncio
+async def test_should_get_same_members_for_many_centers_as_redis(
+    aioredis_data_source, points
+):
+    dict_data_source = DictMemoryDataSource()
+    await aioredis_data_source.geoadd(
+        'fake:geoindex', *itertools.chain(*points)
+    )
+    await dict_data_source.geoadd('fake:geoindex', *itertools.chain(*points))
+    centers = [(-46.7, -23.7), (-46.5, -23.5), (0, 0)]
+
+    expected = await aioredis_data_source.georadius_many(
+        'fake:geoindex', centers, 2, 'km', with_dist=True, count=10
+    )
+    members = await dict_data_source.georadius_many(
+        'fake:geoindex', centers, 2, 'km', with_dist=True, count=10
+    )
+
+    assert len(expected) == 3
+    assert expected[2] == []
+    assert [[(m.member, m.dist) for m in c] for c in members] == [
+        [(m.member, m.dist) for m in c] for c in expected
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_not_get_members_by_missing_member_in_redis(
+    aioredis_data_source, points
+):
+    await aioredis_data_source.geoadd(
+        'fake:geoindex', *itertools.chain(*points)
+    )
+
+    assert (
+        await aioredis_data_source.georadiusbymember(
+            'fake:geoindex', 'missing', 3, 'km'
+        )
+        == []
+    )
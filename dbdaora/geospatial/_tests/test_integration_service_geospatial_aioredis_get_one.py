@@ -2,6 +2,9 @@ import itertools
 
 import pytest
 
+from dbdaora import GeoSpatialQueryType
+from dbdaora.exceptions import InvalidQueryError
+
 
 @pytest.mark.asyncio
 async def test_should_get_one(
@@ -19,3 +22,135 @@ async def test_should_get_one(
     ).entity
 
     assert entity == fake_entity
+
+
+@pytest.mark.asyncio
+async def test_should_get_one_from_fallback(
+    fake_service,
+    fake_entity,
+    repository,
+    fake_fallback_data_entity,
+    fake_fallback_data_entity2,
+):
+    repository.fallback_data_source.db[
+        'fake:fake2:fake:m1'
+    ] = fake_fallback_data_entity
+    repository.fallback_data_source.db[
+        'fake:fake2:fake:m2'
+    ] = fake_fallback_data_entity2
+    entity = await repository.query(
+        fake_id=fake_entity.fake_id,
+        fake2_id=fake_entity.fake2_id,
+        latitude=5,
+        longitude=6,
+        max_distance=1,
+        memory=False,
+    ).entity
+
+    assert entity == fake_entity
+
+
+@pytest.mark.asyncio
+async def test_should_get_one_by_member(
+    fake_service, serialized_fake_entity, fake_entity, repository
+):
+    await repository.memory_data_source.geoadd(
+        'fake:fake2:fake', *itertools.chain(*serialized_fake_entity)
+    )
+    entity = await repository.query(
+        fake_id=fake_entity.fake_id,
+        fake2_id=fake_entity.fake2_id,
+        type=GeoSpatialQueryType.BYMEMBER,
+        member='m1',
+        max_distance=1,
+    ).entity
+
+    assert [(m.member, m.coord) for m in entity.data] == [
+        (m.member, m.coord) for m in fake_entity.data
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_get_one_with_many_centers(
+    fake_service, serialized_fake_entity, fake_entity, repository
+):
+    await repository.memory_data_source.geoadd(
+        'fake:fake2:fake', *itertools.chain(*serialized_fake_entity)
+    )
+    entity = await repository.query(
+        fake_id=fake_entity.fake_id,
+        fake2_id=fake_entity.fake2_id,
+        type=GeoSpatialQueryType.MULTI_RADIUS,
+        centers=[(6, 5), (60, 50)],
+        max_distance=1,
+    ).entity
+
+    assert entity.data == [fake_entity.data, []]
+
+
+@pytest.mark.asyncio
+async def test_should_get_one_with_many_centers_from_fallback(
+    fake_service,
+    fake_entity,
+    repository,
+    fake_fallback_data_entity,
+    fake_fallback_data_entity2,
+):
+    repository.fallback_data_source.db[
+        'fake:fake2:fake:m1'
+    ] = fake_fallback_data_entity
+    repository.fallback_data_source.db[
+        'fake:fake2:fake:m2'
+    ] = fake_fallback_data_entity2
+    entity = await repository.query(
+        fake_id=fake_entity.fake_id,
+        fake2_id=fake_entity.fake2_id,
+        type=GeoSpatialQueryType.MULTI_RADIUS,
+        centers=[(6, 5), (60, 50)],
+        max_distance=1,
+        memory=False,
+    ).entity
+
+    assert entity.data == [fake_entity.data, []]
+
+
+@pytest.mark.asyncio
+async def test_should_get_one_in_box_from_fallback(
+    fake_service,
+    fake_entity,
+    repository,
+    fake_fallback_data_entity,
+    fake_fallback_data_entity2,
+):
+    repository.fallback_data_source.db[
+        'fake:fake2:fake:m1'
+    ] = fake_fallback_data_entity
+    repository.fallback_data_source.db[
+        'fake:fake2:fake:m2'
+    ] = fake_fallback_data_entity2
+    entity = await repository.query(
+        fake_id=fake_entity.fake_id,
+        fake2_id=fake_entity.fake2_id,
+        type=GeoSpatialQueryType.BOX,
+        latitude=5,
+        longitude=6,
+        width=2,
+        height=2,
+        memory=False,
+    ).entity
+
+    assert entity == fake_entity
+
+
+@pytest.mark.asyncio
+async def test_should_raise_invalid_query_error_for_box_without_size(
+    fake_service, fake_entity, repository
+):
+    with pytest.raises(InvalidQueryError):
+        await repository.query(
+            fake_id=fake_entity.fake_id,
+            fake2_id=fake_entity.fake2_id,
+            type=GeoSpatialQueryType.BOX,
+            latitude=5,
+            longitude=6,
+        ).entity
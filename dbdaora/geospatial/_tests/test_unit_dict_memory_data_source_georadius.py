@@ -0,0 +1,160 @@
+import pytest
+
+from dbdaora import DictMemoryDataSource, InvalidGeoSpatialDataError
+from dbdaora.data_sources.memory import geoindex
+from dbdaora.data_sources.memory.dict import DictGeoMember, DictGeoPoint
+
+
+@pytest.fixture
+async def memory_data_source():
+    memory_data_source = DictMemoryDataSource()
+    await memory_data_source.geoadd(
+        'fake',
+        13.361389,
+        38.115556,
+        'Palermo',
+        15.087269,
+        37.502669,
+        'Catania',
+    )
+    return memory_data_source
+
+
+@pytest.mark.asyncio
+async def test_should_get_members(memory_data_source):
+    members = await memory_data_source.georadius('fake', 15, 37, 200, 'km')
+
+    assert sorted(members) == [b'Catania', b'Palermo']
+
+
+@pytest.mark.asyncio
+async def test_should_get_members_with_dist_and_coord(memory_data_source):
+    members = await memory_data_source.georadius(
+        'fake', 15, 37, 200, 'km', with_dist=True, with_coord=True, sort='ASC',
+    )
+
+    assert members == [
+        DictGeoMember(
+            member=b'Catania',
+            dist=56.4413,
+            hash=None,
+            coord=DictGeoPoint(15.087267458438873, 37.50266842333162),
+        ),
+        DictGeoMember(
+            member=b'Palermo',
+            dist=190.4424,
+            hash=None,
+            coord=DictGeoPoint(13.361389338970184, 38.1155563954963),
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_get_members_sorted_desc_in_miles(memory_data_source):
+    members = await memory_data_source.georadius(
+        'fake', 15, 37, 200, 'mi', with_dist=True, sort='DESC'
+    )
+
+    assert [(m.member, m.dist) for m in members] == [
+        (b'Palermo', 118.3357),
+        (b'Catania', 35.0711),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_get_closest_members_when_count_is_set(
+    memory_data_source,
+):
+    members = await memory_data_source.georadius(
+        'fake', 15, 37, 200, 'km', count=1
+    )
+
+    assert members == [b'Catania']
+
+
+@pytest.mark.asyncio
+async def test_should_not_get_members_out_of_radius(memory_data_source):
+    members = await memory_data_source.georadius('fake', 15, 37, 100000, 'ft')
+
+    assert members == []
+
+
+@pytest.mark.asyncio
+async def test_should_update_existing_member(memory_data_source):
+    added = await memory_data_source.geoadd(
+        'fake', 15, 37, 'Palermo', 15, 37.01, 'Siracusa'
+    )
+    members = await memory_data_source.georadius(
+        'fake', 15, 37, 10, 'km', sort='ASC'
+    )
+
+    assert added == 1
+    assert members == [b'Palermo', b'Siracusa']
+
+
+@pytest.mark.asyncio
+async def test_should_not_get_members_for_missing_key(memory_data_source):
+    assert await memory_data_source.georadius('missing', 15, 37, 200) == []
+
+
+@pytest.mark.asyncio
+async def test_should_raise_invalid_data_error_for_invalid_coordinates(
+    memory_data_source,
+):
+    with pytest.raises(InvalidGeoSpatialDataError):
+        await memory_data_source.geoadd('fake', 15, 86, 'invalid')
+
+
+@pytest.mark.asyncio
+async def test_should_get_members_by_member(memory_data_source):
+    members = await memory_data_source.georadiusbymember(
+        'fake', 'Palermo', 200, 'km', with_dist=True, sort='ASC'
+    )
+
+    assert [(m.member, m.dist) for m in members] == [
+        (b'Palermo', 0.0),
+        (b'Catania', 166.2742),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_not_get_members_by_missing_member(memory_data_source):
+    assert (
+        await memory_data_source.georadiusbymember('fake', 'missing', 200)
+        == []
+    )
+    assert (
+        await memory_data_source.georadiusbymember('missing', 'Palermo', 200)
+        == []
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('use_numpy', [True, False])
+async def test_should_get_members_in_box(
+    memory_data_source, mocker, use_numpy
+):
+    if not use_numpy:
+        mocker.patch.object(geoindex, 'np', None)
+
+    wide_box_members = await memory_data_source.geosearchbox(
+        'fake', 15, 37, 400, 400, 'km', with_dist=True, sort='ASC'
+    )
+    narrow_box_members = await memory_data_source.geosearchbox(
+        'fake', 15, 37, 200, 400, 'km'
+    )
+
+    assert [(m.member, m.dist) for m in wide_box_members] == [
+        (b'Catania', 56.4413),
+        (b'Palermo', 190.4424),
+    ]
+    assert narrow_box_members == [b'Catania']
+
+
+@pytest.mark.asyncio
+async def test_should_get_members_for_many_centers(memory_data_source):
+    members = await memory_data_source.georadius_many(
+        'fake', [(15, 37), (13.4, 38.1), (0, 0)], 100, 'km', sort='ASC'
+    )
+
+    assert members == [[b'Catania'], [b'Palermo'], []]
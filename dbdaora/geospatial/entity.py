@@ -2,6 +2,7 @@ from typing import (  # type: ignore
     Any,
     Dict,
     Protocol,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
@@ -14,7 +15,7 @@ from dbdaora.data_sources.memory import GeoMember, GeoRadiusOutput
 from dbdaora.entity import init_subclass
 
 
-GeoSpatialData = Union[GeoMember, GeoRadiusOutput]
+GeoSpatialData = Union[GeoMember, GeoRadiusOutput, Sequence[GeoRadiusOutput]]
 
 
 class GeoSpatialEntityProtocol(Protocol):
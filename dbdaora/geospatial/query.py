@@ -1,6 +1,6 @@
 import dataclasses
 from enum import Enum
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
 from dbdaora.keys import FallbackKey
 from dbdaora.query import BaseQuery, Query
@@ -8,6 +8,9 @@ from dbdaora.query import BaseQuery, Query
 
 class GeoSpatialQueryType(Enum):
     RADIUS = 'radius'
+    BYMEMBER = 'bymember'
+    BOX = 'box'
+    MULTI_RADIUS = 'multi_radius'
 
 
 @dataclasses.dataclass(init=False)
@@ -23,6 +26,10 @@ class GeoSpatialQuery(
     with_dist: bool = True
     with_coord: bool = True
     count: Optional[int] = None
+    member: Optional[Union[str, bytes]] = None
+    width: Optional[float] = None
+    height: Optional[float] = None
+    centers: Optional[Sequence[Tuple[float, float]]] = None
 
     def __init__(
         self,
@@ -38,6 +45,10 @@ class GeoSpatialQuery(
         with_dist: bool = True,
         with_coord: bool = True,
         count: Optional[int] = None,
+        member: Optional[Union[str, bytes]] = None,
+        width: Optional[float] = None,
+        height: Optional[float] = None,
+        centers: Optional[Sequence[Tuple[float, float]]] = None,
         **kwargs: Any,
     ):
         super().__init__(
@@ -51,6 +62,10 @@ class GeoSpatialQuery(
         self.with_dist = with_dist
         self.with_coord = with_coord
         self.count = count
+        self.member = member
+        self.width = width
+        self.height = height
+        self.centers = centers
 
 
 def make(
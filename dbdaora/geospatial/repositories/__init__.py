@@ -3,11 +3,13 @@ from typing import (  # type: ignore
     Dict,
     Optional,
     Sequence,
+    Tuple,
     Union,
     _TypedDictMeta,
 )
 
-from dbdaora.data_sources.memory import GeoMember
+from dbdaora.data_sources.memory import GeoMember, MemoryDataSource
+from dbdaora.data_sources.memory.geoindex import make_index
 from dbdaora.exceptions import (
     EntityNotFoundError,
     InvalidGeoSpatialDataError,
@@ -24,56 +26,194 @@ class GeoSpatialRepository(
     MemoryRepository[GeoSpatialEntityHint, GeoSpatialData, FallbackKey]
 ):
     __skip_cls_validation__ = ('GeoSpatialRepository',)
+    memory_data_is_entity = False
 
     async def get_memory_data(  # type: ignore
         self,
         key: str,
         query: 'GeoSpatialQuery[GeoSpatialEntityHint, FallbackKey]',
     ) -> Optional[GeoSpatialData]:
-        if query.type == GeoSpatialQueryType.RADIUS:
-            if (
-                query.latitude is None
-                or query.longitude is None
-                or query.max_distance is None
-            ):
-                raise InvalidQueryError(query)
+        return await self.query_memory_data(
+            self.memory_data_source, key, query
+        )
 
-        else:
-            raise InvalidQueryError(query)
+    async def query_memory_data(
+        self,
+        memory_data_source: MemoryDataSource,
+        key: str,
+        query: 'GeoSpatialQuery[GeoSpatialEntityHint, FallbackKey]',
+    ) -> Optional[GeoSpatialData]:
+        self.validate_query(query)
+        data: GeoSpatialData
+
+        if query.type == GeoSpatialQueryType.BYMEMBER:
+            data = await memory_data_source.georadiusbymember(
+                key=key,
+                member=query.member,  # type: ignore
+                radius=query.max_distance,  # type: ignore
+                unit=query.distance_unit,
+                with_dist=query.with_dist,
+                with_coord=query.with_coord,
+                count=query.count,
+            )
 
-        data = await self.memory_data_source.georadius(
-            key=key,
-            longitude=query.longitude,
-            latitude=query.latitude,
-            radius=query.max_distance,
-            unit=query.distance_unit,
-            with_dist=query.with_dist,
-            with_coord=query.with_coord,
-            count=query.count,
-        )
+        elif query.type == GeoSpatialQueryType.BOX:
+            data = await memory_data_source.geosearchbox(
+                key=key,
+                longitude=query.longitude,  # type: ignore
+                latitude=query.latitude,  # type: ignore
+                width=query.width,  # type: ignore
+                height=query.height,  # type: ignore
+                unit=query.distance_unit,
+                with_dist=query.with_dist,
+                with_coord=query.with_coord,
+                count=query.count,
+            )
+
+        elif query.type == GeoSpatialQueryType.MULTI_RADIUS:
+            data = await memory_data_source.georadius_many(
+                key=key,
+                centers=query.centers,  # type: ignore
+                radius=query.max_distance,  # type: ignore
+                unit=query.distance_unit,
+                with_dist=query.with_dist,
+                with_coord=query.with_coord,
+                count=query.count,
+            )
+
+            if not any(data):
+                return None
+
+        else:
+            data = await memory_data_source.georadius(
+                key=key,
+                longitude=query.longitude,  # type: ignore
+                latitude=query.latitude,  # type: ignore
+                radius=query.max_distance,  # type: ignore
+                unit=query.distance_unit,
+                with_dist=query.with_dist,
+                with_coord=query.with_coord,
+                count=query.count,
+            )
 
         if not data:
             return None
 
         return data
 
+    def validate_query(
+        self, query: 'GeoSpatialQuery[GeoSpatialEntityHint, FallbackKey]',
+    ) -> None:
+        if query.type == GeoSpatialQueryType.RADIUS:
+            required: Tuple[Any, ...] = (
+                query.latitude,
+                query.longitude,
+                query.max_distance,
+            )
+
+        elif query.type == GeoSpatialQueryType.BYMEMBER:
+            required = (query.member, query.max_distance)
+
+        elif query.type == GeoSpatialQueryType.BOX:
+            required = (
+                query.latitude,
+                query.longitude,
+                query.width,
+                query.height,
+            )
+
+        elif query.type == GeoSpatialQueryType.MULTI_RADIUS:
+            required = (query.centers or None, query.max_distance)
+
+        else:
+            raise InvalidQueryError(query)
+
+        if any(value is None for value in required):
+            raise InvalidQueryError(query)
+
     async def get_fallback_data(  # type: ignore
         self,
         query: 'GeoSpatialQuery[GeoSpatialEntityHint, FallbackKey]',
         *,
         for_memory: bool = False,
     ) -> Optional[GeoSpatialData]:
-        if not for_memory:
-            return None
-
         key = self.fallback_key(query)
         data = tuple(await self.fallback_data_source.query(key))
 
         if not data:
             return None
 
+        if not for_memory:
+            return self.evaluate_fallback_data(query, data)
+
         return self.make_fallback_data_for_memory(key, query, data)
 
+    def evaluate_fallback_data(
+        self,
+        query: 'GeoSpatialQuery[GeoSpatialEntityHint, FallbackKey]',
+        data: Sequence[Dict[str, Any]],
+    ) -> Optional[GeoSpatialData]:
+        self.validate_query(query)
+        index = make_index(
+            (member['longitude'], member['latitude'], member['member'])
+            for member in data
+        )
+        options = dict(
+            geomember_cls=self.memory_data_source.geomember_cls,
+            geopoint_cls=self.memory_data_source.geopoint_cls,
+            with_dist=query.with_dist,
+            with_coord=query.with_coord,
+            count=query.count,
+        )
+        result: GeoSpatialData
+
+        if query.type == GeoSpatialQueryType.BYMEMBER:
+            result = index.radius_by_member(
+                query.member,  # type: ignore
+                query.max_distance,  # type: ignore
+                query.distance_unit,
+                **options,  # type: ignore
+            )
+
+        elif query.type == GeoSpatialQueryType.BOX:
+            result = index.box(
+                query.longitude,  # type: ignore
+                query.latitude,  # type: ignore
+                query.width,  # type: ignore
+                query.height,  # type: ignore
+                query.distance_unit,
+                **options,  # type: ignore
+            )
+
+        elif query.type == GeoSpatialQueryType.MULTI_RADIUS:
+            result = [
+                index.radius(
+                    longitude,
+                    latitude,
+                    query.max_distance,  # type: ignore
+                    query.distance_unit,
+                    **options,  # type: ignore
+                )
+                for longitude, latitude in query.centers  # type: ignore
+            ]
+
+            if not any(result):
+                return None
+
+        else:
+            result = index.radius(
+                query.longitude,  # type: ignore
+                query.latitude,  # type: ignore
+                query.max_distance,  # type: ignore
+                query.distance_unit,
+                **options,  # type: ignore
+            )
+
+        if not result:
+            return None
+
+        return result
+
     def make_fallback_data_for_memory(
         self,
         key: FallbackKey,
@@ -154,7 +294,9 @@ class GeoSpatialRepository(
                 raise InvalidGeoSpatialDataError(i, geomember)
 
         if isinstance(query, GeoSpatialQuery):
-            memory_data = await self.get_memory_data(key, query)
+            memory_data = await self.query_memory_data(
+                self.primary_memory_data_source, key, query
+            )
         else:
             memory_data = data
 
@@ -250,7 +392,9 @@ class GeoSpatialRepository(
         ],
     ) -> bool:
         return bool(
-            await self.memory_data_source.exists(self.memory_key(query))
+            await self.primary_memory_data_source.exists(
+                self.memory_key(query)
+            )
         )
 
     async def delete_fallback_not_found(
@@ -3,7 +3,7 @@ import itertools
 import asynctest
 import pytest
 
-from dbdaora import GeoSpatialQuery
+from dbdaora import GeoSpatialQuery, make_aioredis_data_source
 from dbdaora.exceptions import EntityNotFoundError
 
 
@@ -225,3 +225,41 @@ async def test_should_set_memory_after_got_fallback(
         ),
     ]
     assert entity == fake_entity
+
+
+@pytest.mark.asyncio
+async def test_should_get_from_fallback_with_replicas_behind(
+    fake_repository_cls,
+    fallback_data_source,
+    fake_entity,
+    fake_fallback_data_entity,
+    fake_fallback_data_entity2,
+):
+    memory_data_source = await make_aioredis_data_source(
+        'redis://localhost/0', replicas=[['redis://localhost/1']]
+    )
+    repository = fake_repository_cls(
+        memory_data_source=memory_data_source,
+        fallback_data_source=fallback_data_source,
+        expire_time=1,
+    )
+    primary = memory_data_source.primary_data_source()
+    await primary.delete('fake:fake2:fake')
+    await memory_data_source.replicas[0].delete('fake:fake2:fake')
+    fallback_data_source.db['fake:fake2:m1'] = fake_fallback_data_entity
+    fallback_data_source.db['fake:fake2:m2'] = fake_fallback_data_entity2
+
+    entity = await repository.query(
+        fake_id=fake_entity.fake_id,
+        fake2_id=fake_entity.fake2_id,
+        latitude=5,
+        longitude=6,
+        max_distance=1,
+    ).entity
+
+    assert entity == fake_entity
+    assert await primary.exists('fake:fake2:fake')
+    assert not await memory_data_source.replicas[0].exists('fake:fake2:fake')
+
+    memory_data_source.close()
+    await memory_data_source.wait_closed()
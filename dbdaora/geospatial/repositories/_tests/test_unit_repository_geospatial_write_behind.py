@@ -0,0 +1,55 @@
+import dataclasses
+from typing import List
+
+import pytest
+
+from dbdaora import (
+    DictFallbackDataSource,
+    DictMemoryDataSource,
+    GeoSpatialRepository,
+    WriteBehindQueue,
+)
+from dbdaora.data_sources.memory.dict import DictGeoMember, DictGeoPoint
+
+
+@dataclasses.dataclass
+class FakeEntity:
+    id: str
+    data: List[DictGeoMember]
+
+
+class FakeGeoSpatialRepository(GeoSpatialRepository[FakeEntity, str]):
+    name = 'fake'
+    entity_cls = FakeEntity
+
+
+def make_member(member):
+    return DictGeoMember(
+        member=member, dist=None, hash=None, coord=DictGeoPoint(6, 5)
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_not_add_a_single_member_to_an_uncached_key():
+    repository = FakeGeoSpatialRepository(
+        memory_data_source=DictMemoryDataSource(),
+        fallback_data_source=DictFallbackDataSource(),
+        expire_time=60,
+        write_behind=WriteBehindQueue(flush_interval=10),
+    )
+    await repository.add_fallback(FakeEntity('fake', make_member(b'm1')))
+    await repository.add_fallback(FakeEntity('fake', make_member(b'm2')))
+    await repository.add(FakeEntity('fake', make_member(b'm3')))
+
+    assert repository.memory_data_source.db == {}
+
+    await repository.write_behind.close()
+    entity = await repository.query(
+        'fake', latitude=5, longitude=6, max_distance=1
+    ).entity
+
+    assert sorted(member.member for member in entity.data) == [
+        b'm1',
+        b'm2',
+        b'm3',
+    ]
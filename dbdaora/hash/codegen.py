@@ -0,0 +1,209 @@
+import dataclasses
+from enum import Enum
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+    Type,
+    Union,
+    get_type_hints,
+)
+
+from jsondaora import dataclasses as jdataclasses
+from jsondaora.deserializers import deserialize_field
+from jsondaora.exceptions import DeserializationError
+from jsondaora.fields import DeserializeFields, SerializeFields
+from jsondaora.serializers import dataclass_asjson
+
+
+HashDecoder = Callable[[Dict[bytes, Any]], Any]
+
+HashEncoder = Callable[[Any], List[Any]]
+
+HashFallbackEncoder = Callable[[Dict[str, Any]], Dict[bytes, Any]]
+
+TRUE_VALUES = frozenset((b'1', 1, '1', 't', 'true', 'y', 'yes', True))
+
+DECODE_EXPRESSIONS = {
+    str: '(value.decode() if value.__class__ is bytes else value)',
+    bytes: '(value if value.__class__ is bytes else value.encode())',
+    int: '(value if value.__class__ is int else int(value))',
+    float: '(value if value.__class__ is float else float(value))',
+    bool: '(value in TRUE_VALUES)',
+    Any: 'value',
+}
+
+ENCODE_EXPRESSIONS = {
+    str: 'value',
+    bytes: 'value',
+    int: 'value',
+    float: 'value',
+    bool: 'int(value)',
+}
+
+
+@lru_cache(maxsize=None)
+def make_decoder(
+    entity_cls: Type[Any], has_bytes_keys: bool = True
+) -> HashDecoder:
+    """Generates a decoder of hgetall data for the entity dataclass.
+
+    Scalar fields are converted inline; other annotations fall back to
+    jsondaora per field. Values are trusted, so strings are not validated.
+    """
+    if DeserializeFields.get_fields(entity_cls):
+        return partial(
+            jdataclasses.asdataclass,
+            cls=entity_cls,
+            has_bytes_keys=has_bytes_keys,
+        )
+
+    type_hints = get_type_hints(entity_cls)
+    namespace: Dict[str, Any] = {
+        'entity_cls': entity_cls,
+        'TRUE_VALUES': TRUE_VALUES,
+        'deserialize_field': deserialize_field,
+        'DeserializationError': DeserializationError,
+    }
+    lines = ['def decode(data):', '    get = data.get', '    kwargs = {}']
+
+    for i, field in enumerate(dataclasses.fields(entity_cls)):
+        if not field.init:
+            continue
+
+        field_type, nullable = unwrap_optional(type_hints[field.name])
+        has_default = (
+            field.default is not dataclasses.MISSING
+            or field.default_factory is not dataclasses.MISSING  # type: ignore
+        )
+        expression = DECODE_EXPRESSIONS.get(field_type)
+
+        if expression is None:
+            namespace[f'field_type_{i}'] = type_hints[field.name]
+            expression = (
+                f'deserialize_field({field.name!r}, field_type_{i}, '
+                'value, entity_cls)'
+            )
+
+        key = field.name.encode() if has_bytes_keys else field.name
+        lines.append(f'    value = get({key!r})')
+        lines.append('    if value is not None:')
+        lines.append(f'        kwargs[{field.name!r}] = {expression}')
+
+        if not has_default:
+            lines.append('    else:')
+
+            if nullable:
+                lines.append(f'        kwargs[{field.name!r}] = None')
+            else:
+                lines.append(
+                    '        raise DeserializationError('
+                    f'{field.name!r}, field_type_{i}, None, None, entity_cls)'
+                )
+                namespace[f'field_type_{i}'] = type_hints[field.name]
+
+    lines.append('    return entity_cls(**kwargs)')
+    exec('\n'.join(lines), namespace)
+
+    return namespace['decode']  # type: ignore
+
+
+@lru_cache(maxsize=None)
+def make_encoder(entity_cls: Type[Any]) -> HashEncoder:
+    """Generates an encoder of the entity dataclass to HMSET arguments."""
+    if SerializeFields.get_fields(entity_cls):
+        return partial(encode_with_jsondaora, entity_cls=entity_cls)
+
+    return make_encoder_function(
+        entity_cls,
+        get_value='entity.{name}',
+        init_output='output = []',
+        add_output='output.extend(({key!r}, {expression}))',
+    )
+
+
+@lru_cache(maxsize=None)
+def make_fallback_encoder(entity_cls: Type[Any]) -> HashFallbackEncoder:
+    """Generates an encoder of fallback data to hgetall like data."""
+    if SerializeFields.get_fields(entity_cls):
+        return partial(encode_fallback_with_jsondaora, entity_cls=entity_cls)
+
+    return make_encoder_function(
+        entity_cls,
+        get_value='entity.get({name!r})',
+        init_output='output = {{}}',
+        add_output='output[{key!r}] = {expression}',
+    )
+
+
+def make_encoder_function(
+    entity_cls: Type[Any], get_value: str, init_output: str, add_output: str,
+) -> Callable[[Any], Any]:
+    type_hints = get_type_hints(entity_cls)
+    namespace: Dict[str, Any] = {'encode_value': encode_value}
+    lines = ['def encode(entity):', f'    {init_output.format()}']
+
+    for field in dataclasses.fields(entity_cls):
+        field_type, _ = unwrap_optional(type_hints[field.name])
+        expression = ENCODE_EXPRESSIONS.get(field_type, 'encode_value(value)')
+        lines.append(f'    value = {get_value.format(name=field.name)}')
+        lines.append('    if value is not None:')
+        lines.append(
+            '        '
+            + add_output.format(key=field.name.encode(), expression=expression)
+        )
+
+    lines.append('    return output')
+    exec('\n'.join(lines), namespace)
+
+    return namespace['encode']  # type: ignore
+
+
+def encode_value(value: Any) -> Any:
+    if isinstance(value, bool):
+        return int(value)
+
+    if isinstance(value, Enum):
+        return encode_value(value.value)
+
+    if dataclasses.is_dataclass(value) or isinstance(
+        value, (list, tuple, dict)
+    ):
+        return dataclass_asjson(value)
+
+    return value
+
+
+def encode_with_jsondaora(entity: Any, entity_cls: Type[Any]) -> List[Any]:
+    output: List[Any] = []
+
+    for key, value in jdataclasses.asdict(entity, dumps_value=True).items():
+        if value is not None:
+            output.extend((key.encode(), encode_value(value)))
+
+    return output
+
+
+def encode_fallback_with_jsondaora(
+    data: Dict[str, Any], entity_cls: Type[Any]
+) -> Dict[bytes, Any]:
+    return {
+        key.encode(): encode_value(value)
+        for key, value in jdataclasses.asdict(data, dumps_value=True).items()
+        if value is not None
+    }
+
+
+def unwrap_optional(annotation: Any) -> Tuple[Any, bool]:
+    if getattr(annotation, '__origin__', None) is Union:
+        args: List[Any] = [
+            arg for arg in annotation.__args__ if arg is not type(None)
+        ]
+
+        if len(args) < len(annotation.__args__):
+            return args[0] if len(args) == 1 else annotation, True
+
+    return annotation, False
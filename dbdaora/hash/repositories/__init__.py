@@ -1,6 +1,15 @@
 import dataclasses
 import itertools
-from typing import Any, Dict, Optional, Sequence, TypeVar, Union
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
 
 from jsondaora import dataclasses as jdataclasses
 
@@ -9,6 +18,8 @@ from dbdaora.keys import FallbackKey
 from dbdaora.query import BaseQuery
 from dbdaora.repository import MemoryRepository
 
+from ..codegen import make_decoder, make_encoder, make_fallback_encoder
+
 
 HashData = Union[
     Dict[str, Any], Dict[bytes, Any],
@@ -18,6 +29,20 @@ HashEntity = TypeVar('HashEntity')
 
 class HashRepository(MemoryRepository[HashEntity, HashData, FallbackKey]):
     __skip_cls_validation__ = ('HashRepository',)
+    compiled_decoder: ClassVar[bool] = False
+    compiled_encoder: ClassVar[bool] = False
+
+    def __init_subclass__(cls, *args: Any, **kwargs: Any) -> None:
+        super().__init_subclass__(*args, **kwargs)
+        entity_cls = getattr(cls, 'entity_cls', None)
+
+        if entity_cls is not None and dataclasses.is_dataclass(entity_cls):
+            if cls.compiled_decoder:
+                make_decoder(entity_cls)
+
+            if cls.compiled_encoder:
+                make_encoder(entity_cls)
+                make_fallback_encoder(entity_cls)
 
     async def get_memory_data(  # type: ignore
         self, key: str, query: 'HashQuery[HashEntity, FallbackKey]',
@@ -86,9 +111,14 @@ class HashRepository(MemoryRepository[HashEntity, HashData, FallbackKey]):
         data: HashData,
         query: BaseQuery[HashEntity, HashData, FallbackKey],
     ) -> Any:
-        if dataclasses.is_dataclass(self.get_entity_type(query)):
+        entity_type = self.get_entity_type(query)
+
+        if dataclasses.is_dataclass(entity_type):
+            if self.compiled_decoder:
+                return make_decoder(entity_type)(data)  # type: ignore
+
             return jdataclasses.asdataclass(
-                data, self.get_entity_type(query), has_bytes_keys=True
+                data, entity_type, has_bytes_keys=True
             )
 
         raise InvalidEntityTypeError(self.get_entity_type(query))
@@ -101,11 +131,19 @@ class HashRepository(MemoryRepository[HashEntity, HashData, FallbackKey]):
         return jdataclasses.asdataclass(data, self.get_entity_type(query))
 
     async def add_memory_data(
-        self, key: str, data: HashData, from_fallback: bool = False
+        self,
+        key: str,
+        data: Union[HashData, List[Any]],
+        from_fallback: bool = False,
     ) -> None:
         delete_future = self.memory_data_source.delete(key)
         hmset_future = self.memory_data_source.hmset(
-            key, *itertools.chain(*data.items())
+            key,
+            *(
+                data
+                if isinstance(data, list)
+                else itertools.chain(*data.items())
+            ),
         )
         await delete_future
         await hmset_future
@@ -131,13 +169,23 @@ class HashRepository(MemoryRepository[HashEntity, HashData, FallbackKey]):
         query: Union[BaseQuery[HashEntity, HashData, FallbackKey], Any],
         data: Dict[str, Any],
     ) -> Dict[bytes, Any]:
+        entity_type = self.get_entity_type(query)
+
+        if self.compiled_encoder and dataclasses.is_dataclass(entity_type):
+            return make_fallback_encoder(entity_type)(data)  # type: ignore
+
         return {
             k.encode(): int(v) if isinstance(v, bool) else v
             for k, v in jdataclasses.asdict(data, dumps_value=True).items()
             if v is not None
         }
 
-    def make_memory_data_from_entity(self, entity: Any) -> HashData:
+    def make_memory_data_from_entity(  # type: ignore
+        self, entity: Any
+    ) -> Union[HashData, List[Any]]:
+        if self.compiled_encoder and dataclasses.is_dataclass(entity):
+            return make_encoder(type(entity))(entity)  # type: ignore
+
         return {
             k: int(v) if isinstance(v, bool) else v
             for k, v in jdataclasses.asdict(entity, dumps_value=True).items()
@@ -0,0 +1,60 @@
+import pytest
+
+from dbdaora import (
+    CompressedMemoryDataSource,
+    Compression,
+    DictFallbackDataSource,
+    make_aioredis_data_source,
+)
+from dbdaora.hash.conftest import (
+    FakeEntity,
+    FakeHashRepository,
+    FakeInnerEntity,
+)
+
+
+@pytest.mark.asyncio
+@pytest.fixture
+async def repository(mocker):
+    memory_data_source = await make_aioredis_data_source(
+        'redis://', 'redis://localhost/1', 'redis://localhost/2'
+    )
+    yield FakeHashRepository(
+        memory_data_source=CompressedMemoryDataSource(
+            memory_data_source, Compression(min_size=64)
+        ),
+        fallback_data_source=DictFallbackDataSource(),
+        expire_time=1,
+    )
+    memory_data_source.close()
+    await memory_data_source.wait_closed()
+
+
+@pytest.fixture
+def large_fake_entity():
+    return FakeEntity(
+        id='fake',
+        integer=1,
+        inner_entities=[FakeInnerEntity(f'inner{i}') for i in range(20)],
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_add_and_get_compressed_values(
+    repository, large_fake_entity
+):
+    await repository.memory_data_source.delete('fake:fake')
+    await repository.add(large_fake_entity, memory_always=True)
+
+    raw_data = await repository.memory_data_source.data_source.hgetall(
+        'fake:fake'
+    )
+    entity = await repository.query('fake').entity
+    fields_entity = await repository.query(
+        'fake', fields=['id', 'integer', 'inner_entities']
+    ).entity
+
+    assert raw_data[b'id'] == b'fake'
+    assert raw_data[b'inner_entities'][0] == 0xF9
+    assert entity == large_fake_entity
+    assert fields_entity == large_fake_entity
@@ -0,0 +1,103 @@
+import dataclasses
+
+import pytest
+
+from dbdaora import (
+    DictFallbackDataSource,
+    EntityNotFoundError,
+    HashRepository,
+    HashRing,
+    make_aioredis_data_source,
+)
+
+
+@dataclasses.dataclass
+class FakeEntity:
+    other_id: str
+    id: str
+    integer: int
+
+
+class TaggedHashRing(HashRing):
+    hash_tags = True
+
+
+class FakeHashRepository(HashRepository[FakeEntity, str]):
+    name = 'fake'
+    key_attrs = ('other_id', 'id')
+    hash_tag_key_parts = 1
+
+
+@pytest.mark.asyncio
+@pytest.fixture
+async def repository(mocker):
+    memory_data_source = await make_aioredis_data_source(
+        'redis://',
+        'redis://localhost/1',
+        'redis://localhost/2',
+        hashring_cls=TaggedHashRing,
+    )
+    yield FakeHashRepository(
+        memory_data_source=memory_data_source,
+        fallback_data_source=DictFallbackDataSource(),
+        expire_time=1,
+    )
+    memory_data_source.close()
+    await memory_data_source.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_should_make_tagged_keys(repository):
+    entity = FakeEntity('other', 'fake', 1)
+    query = repository.query('other', 'fake')
+
+    assert repository.memory_key(entity) == 'fake:{other}:fake'
+    assert repository.memory_key(query) == 'fake:{other}:fake'
+    assert repository.fallback_not_found_key(query) == (
+        'fake:not-found:{other}:fake'
+    )
+    assert repository.fallback_key(query) == 'fake:other:fake'
+
+
+@pytest.mark.asyncio
+async def test_should_route_related_keys_to_the_same_node(repository):
+    memory_data_source = repository.memory_data_source
+    keys = [
+        'fake:{other}:fake',
+        'fake:{other}:fake2',
+        'fake:not-found:{other}:fake',
+    ]
+
+    assert len({id(memory_data_source.get_client(key)) for key in keys}) == 1
+
+
+@pytest.mark.asyncio
+async def test_should_add_and_get_entities(repository):
+    entity = FakeEntity('other', 'fake', 1)
+    await repository.memory_data_source.delete('fake:{other}:fake')
+    await repository.memory_data_source.delete('fake:not-found:{other}:fake')
+    await repository.add(entity, memory_always=True)
+
+    client = repository.memory_data_source.get_client('other')
+
+    assert await client.hgetall('fake:{other}:fake') == {
+        b'other_id': b'other',
+        b'id': b'fake',
+        b'integer': b'1',
+    }
+    assert await repository.query('other', 'fake').entity == entity
+
+
+@pytest.mark.asyncio
+async def test_should_set_not_found_key_on_the_same_node(repository):
+    await repository.memory_data_source.delete('fake:{other}:missing')
+    await repository.memory_data_source.delete(
+        'fake:not-found:{other}:missing'
+    )
+
+    with pytest.raises(EntityNotFoundError):
+        await repository.query('other', 'missing').entity
+
+    client = repository.memory_data_source.get_client('other')
+
+    assert await client.exists('fake:not-found:{other}:missing')
@@ -0,0 +1,164 @@
+import zlib
+
+import orjson
+import pytest
+
+from dbdaora import HashBlobRepository
+from dbdaora.hash.conftest import FakeEntity
+from dbdaora.hash.repositories import blob
+
+
+@pytest.fixture
+def blob_format():
+    return 'orjson'
+
+
+@pytest.fixture
+def blob_compression_level():
+    return None
+
+
+@pytest.fixture
+def compiled_decoder():
+    return False
+
+
+@pytest.fixture
+def dict_repository_cls(blob_format, blob_compression_level, compiled_decoder):
+    class FakeHashBlobRepository(HashBlobRepository[FakeEntity, str]):
+        name = 'fake'
+
+    FakeHashBlobRepository.blob_format = blob_format
+    FakeHashBlobRepository.blob_compression_level = blob_compression_level
+    FakeHashBlobRepository.compiled_decoder = compiled_decoder
+
+    return FakeHashBlobRepository
+
+
+@pytest.fixture
+def repository(dict_repository):
+    return dict_repository
+
+
+@pytest.mark.asyncio
+async def test_should_add_entity_as_single_value(repository, fake_entity):
+    await repository.add(fake_entity, memory_always=True)
+
+    blob_data = repository.memory_data_source.db['fake:fake']
+
+    assert isinstance(blob_data, bytes)
+    assert orjson.loads(blob_data) == {
+        'id': 'fake',
+        'integer': 1,
+        'inner_entities': [{'id': 'inner1'}, {'id': 'inner2'}],
+        'number': 0.1,
+        'boolean': True,
+    }
+    assert repository.fallback_data_source.db['fake:fake'] == {
+        'id': 'fake',
+        'integer': 1,
+        'inner_entities': [{'id': 'inner1'}, {'id': 'inner2'}],
+        'number': 0.1,
+        'boolean': True,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('compiled_decoder', [False, True])
+async def test_should_get_from_memory(repository, fake_entity):
+    await repository.add(fake_entity, memory_always=True)
+
+    entity = await repository.query('fake').entity
+
+    assert entity == fake_entity
+
+
+@pytest.mark.asyncio
+async def test_should_get_from_fallback(repository, fake_entity):
+    await repository.add(fake_entity, memory_always=True)
+    repository.memory_data_source.db.clear()
+
+    entity = await repository.query('fake').entity
+
+    assert entity == fake_entity
+    assert orjson.loads(repository.memory_data_source.db['fake:fake']) == {
+        'id': 'fake',
+        'integer': 1,
+        'inner_entities': [{'id': 'inner1'}, {'id': 'inner2'}],
+        'number': 0.1,
+        'boolean': True,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('compiled_decoder', [False, True])
+async def test_should_get_fields_from_memory(repository, fake_entity):
+    await repository.add(fake_entity, memory_always=True)
+
+    fake_entity.number = None
+    fake_entity.boolean = None
+
+    entity = await repository.query(
+        'fake', fields=['id', 'integer', 'inner_entities']
+    ).entity
+
+    assert entity == fake_entity
+
+
+@pytest.mark.asyncio
+async def test_should_get_fields_from_fallback(repository, fake_entity):
+    await repository.add(fake_entity, memory_always=True)
+    repository.memory_data_source.db.clear()
+
+    fake_entity.boolean = None
+
+    entity = await repository.query(
+        'fake', fields=['id', 'integer', 'inner_entities', 'number']
+    ).entity
+
+    assert entity == fake_entity
+    assert (
+        orjson.loads(repository.memory_data_source.db['fake:fake'])['integer']
+        == 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_get_many(repository, fake_entity, fake_entity2):
+    await repository.add(fake_entity, memory_always=True)
+    await repository.add(fake_entity2, memory_always=True)
+    repository.memory_data_source.db.pop('fake:fake2')
+
+    entities = [
+        entity
+        async for entity in repository.query(many=['fake', 'fake2']).entities
+    ]
+
+    assert entities == [fake_entity, fake_entity2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('blob_compression_level', [6])
+async def test_should_compress_blob(repository, fake_entity):
+    await repository.add(fake_entity, memory_always=True)
+
+    blob_data = repository.memory_data_source.db['fake:fake']
+    entity = await repository.query('fake').entity
+
+    assert orjson.loads(zlib.decompress(blob_data))['id'] == 'fake'
+    assert entity == fake_entity
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('blob_format', ['msgpack'])
+async def test_should_use_msgpack(repository, fake_entity):
+    if blob.msgpack is None:
+        pytest.skip('msgpack is not installed')
+
+    await repository.add(fake_entity, memory_always=True)
+
+    blob_data = repository.memory_data_source.db['fake:fake']
+    entity = await repository.query('fake').entity
+
+    assert blob.msgpack.unpackb(blob_data)['id'] == 'fake'
+    assert entity == fake_entity
@@ -0,0 +1,191 @@
+import dataclasses
+import itertools
+from typing import Any, Dict, List, Optional
+
+import pytest
+from jsondaora import dataclasses as jdataclasses
+from jsondaora.exceptions import DeserializationError
+
+from dbdaora import HashRepository
+from dbdaora.hash.codegen import (
+    make_decoder,
+    make_encoder,
+    make_fallback_encoder,
+)
+
+
+@dataclasses.dataclass
+class FakeInnerEntity:
+    id: str
+
+
+@dataclasses.dataclass
+class FakeEntity:
+    id: str
+    integer: int
+    inner_entities: List[FakeInnerEntity]
+    raw: bytes = b''
+    number: Optional[float] = None
+    boolean: Optional[bool] = None
+    mapping: Optional[Dict[str, int]] = None
+    anything: Any = None
+    optional_inner: Optional[FakeInnerEntity] = None
+
+
+@pytest.fixture
+def dict_repository_cls():
+    class FakeHashRepository(HashRepository[FakeEntity, str]):
+        name = 'fake'
+        compiled_decoder = True
+        compiled_encoder = True
+
+    return FakeHashRepository
+
+
+@pytest.fixture
+def repository(dict_repository):
+    return dict_repository
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        {
+            b'id': b'fake',
+            b'integer': b'1',
+            b'inner_entities': b'[{"id":"inner1"},{"id":"inner2"}]',
+        },
+        {
+            b'id': b'fake',
+            b'integer': b'-10',
+            b'inner_entities': b'[]',
+            b'raw': b'\x00\xff',
+            b'number': b'0.1',
+            b'boolean': b'0',
+            b'mapping': b'{"a":1}',
+            b'anything': b'any',
+            b'optional_inner': b'{"id":"inner"}',
+        },
+        {
+            b'id': b'fake',
+            b'integer': b'1',
+            b'inner_entities': b'[]',
+            b'boolean': b'1',
+        },
+    ],
+)
+def test_should_decode_like_jsondaora(data):
+    assert make_decoder(FakeEntity)(data) == jdataclasses.asdataclass(
+        data, FakeEntity, has_bytes_keys=True
+    )
+
+
+def test_should_raise_deserialization_error_for_missing_required_field():
+    with pytest.raises(DeserializationError):
+        make_decoder(FakeEntity)({b'id': b'fake', b'inner_entities': b'[]'})
+
+
+def test_should_generate_decoder_once(dict_repository_cls):
+    assert make_decoder(FakeEntity) is make_decoder(FakeEntity)
+
+
+@pytest.mark.asyncio
+async def test_should_get_from_memory_with_compiled_decoder(repository):
+    await repository.memory_data_source.hmset(
+        'fake:fake',
+        *itertools.chain(
+            *{
+                b'id': b'fake',
+                b'integer': b'1',
+                b'number': b'0.5',
+                b'inner_entities': b'[{"id":"inner1"}]',
+            }.items()
+        ),
+    )
+
+    entity = await repository.query('fake').entity
+
+    assert entity == FakeEntity(
+        id='fake',
+        integer=1,
+        number=0.5,
+        inner_entities=[FakeInnerEntity('inner1')],
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_get_fields_with_compiled_decoder(repository):
+    await repository.memory_data_source.hmset(
+        'fake:fake',
+        b'id',
+        b'fake',
+        b'integer',
+        b'1',
+        b'number',
+        b'0.5',
+        b'inner_entities',
+        b'[]',
+    )
+
+    entity = await repository.query(
+        'fake', fields=['id', 'integer', 'inner_entities']
+    ).entity
+
+    assert entity.integer == 1
+    assert entity.number is None
+
+
+@pytest.fixture
+def fake_entity():
+    return FakeEntity(
+        id='fake',
+        integer=1,
+        inner_entities=[FakeInnerEntity('inner1')],
+        raw=b'\x00',
+        boolean=False,
+        mapping={'a': 1},
+        optional_inner=FakeInnerEntity('inner2'),
+    )
+
+
+def test_should_encode_like_jsondaora(fake_entity):
+    data = make_encoder(FakeEntity)(fake_entity)
+
+    assert dict(zip(data[::2], data[1::2])) == {
+        k.encode(): int(v) if isinstance(v, bool) else v
+        for k, v in jdataclasses.asdict(fake_entity, dumps_value=True).items()
+        if v is not None
+    }
+
+
+def test_should_encode_fallback_data_like_jsondaora(fake_entity):
+    fallback_data = jdataclasses.asdict(fake_entity)
+
+    assert make_fallback_encoder(FakeEntity)(fallback_data) == {
+        k.encode(): int(v) if isinstance(v, bool) else v
+        for k, v in jdataclasses.asdict(
+            fallback_data, dumps_value=True
+        ).items()
+        if v is not None
+    }
+
+
+@pytest.mark.asyncio
+async def test_should_add_and_get_with_compiled_encoder(
+    repository, fake_entity
+):
+    await repository.add(fake_entity, memory_always=True)
+
+    assert repository.memory_data_source.db['fake:fake'][b'boolean'] == b'0'
+    assert await repository.query('fake').entity == fake_entity
+    assert await repository.query('fake', memory=False).entity == fake_entity
+
+
+@pytest.mark.asyncio
+async def test_should_get_from_fallback_with_compiled_encoder(
+    repository, fake_entity
+):
+    await repository.add(fake_entity, memory=False)
+
+    assert await repository.query('fake').entity == fake_entity
+    assert repository.memory_data_source.db['fake:fake'][b'raw'] == b'\x00'
@@ -0,0 +1,92 @@
+import zlib
+
+import pytest
+
+from dbdaora import (
+    CompressedFallbackDataSource,
+    CompressedMemoryDataSource,
+    Compression,
+    HashRepository,
+)
+from dbdaora.hash.conftest import FakeEntity, FakeInnerEntity
+
+
+@pytest.fixture
+def dict_repository_cls():
+    class FakeHashRepository(HashRepository[FakeEntity, str]):
+        name = 'fake'
+        memory_compression = Compression(min_size=64)
+        fallback_compression = Compression(min_size=64)
+
+    return FakeHashRepository
+
+
+@pytest.fixture
+def repository(dict_repository):
+    return dict_repository
+
+
+@pytest.fixture
+def large_fake_entity():
+    return FakeEntity(
+        id='fake',
+        integer=1,
+        inner_entities=[FakeInnerEntity(f'inner{i}') for i in range(20)],
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_wrap_data_sources(repository):
+    assert isinstance(
+        repository.memory_data_source, CompressedMemoryDataSource
+    )
+    assert isinstance(
+        repository.fallback_data_source, CompressedFallbackDataSource
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_compress_large_values(repository, large_fake_entity):
+    await repository.add(large_fake_entity, memory_always=True)
+
+    memory_data = repository.memory_data_source.db['fake:fake']
+    fallback_data = repository.fallback_data_source.db['fake:fake']
+
+    assert memory_data[b'id'] == b'fake'
+    assert memory_data[b'inner_entities'][0] == 0xF9
+    assert zlib.decompress(memory_data[b'inner_entities'][1:]).startswith(
+        b'[{"id":"inner0"}'
+    )
+    assert fallback_data['id'] == 'fake'
+    assert fallback_data['inner_entities'] == [
+        {'id': f'inner{i}'} for i in range(20)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_get_from_memory(repository, large_fake_entity):
+    await repository.add(large_fake_entity, memory_always=True)
+
+    assert await repository.query('fake').entity == large_fake_entity
+
+
+@pytest.mark.asyncio
+async def test_should_get_fields_from_memory(repository, large_fake_entity):
+    await repository.add(large_fake_entity, memory_always=True)
+
+    entity = await repository.query(
+        'fake', fields=['id', 'integer', 'inner_entities']
+    ).entity
+
+    assert entity == large_fake_entity
+
+
+@pytest.mark.asyncio
+async def test_should_get_from_fallback(repository, large_fake_entity):
+    await repository.add(large_fake_entity, memory=False)
+
+    assert await repository.query('fake').entity == large_fake_entity
+    assert (
+        repository.memory_data_source.db['fake:fake'][b'inner_entities'][0]
+        == 0xF9
+    )
@@ -0,0 +1,118 @@
+import zlib
+from typing import Any, ClassVar, Dict, Optional, Union
+
+import orjson
+from jsondaora import dataclasses as jdataclasses
+from jsondaora.serializers import dataclass_asjson
+
+from dbdaora.keys import FallbackKey
+from dbdaora.query import BaseQuery
+
+from ..codegen import make_decoder
+from ..query import HashQuery
+from . import HashData, HashEntity, HashRepository
+
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None  # type: ignore
+
+
+class HashBlobRepository(HashRepository[HashEntity, FallbackKey]):
+    """Stores the whole entity as one memory value instead of a hash.
+
+    Values are encoded with orjson or msgpack (``blob_format``) and
+    optionally zlib compressed. ``fields`` projection is done client-side.
+    """
+
+    __skip_cls_validation__ = ('HashBlobRepository',)
+    blob_format: ClassVar[str] = 'orjson'
+    blob_compression_level: ClassVar[Optional[int]] = None
+
+    async def get_memory_data(  # type: ignore
+        self, key: str, query: HashQuery[HashEntity, FallbackKey],
+    ) -> Optional[HashData]:
+        blob = await self.memory_data_source.get(key)
+
+        if blob is None:
+            return None
+
+        data = self.loads(blob)
+
+        if query.fields:
+            return self.make_fallback_data_fields(query, data)
+
+        return data
+
+    async def get_fallback_data(  # type: ignore
+        self,
+        query: HashQuery[HashEntity, FallbackKey],
+        *,
+        for_memory: bool = False,
+    ) -> Optional[HashData]:
+        data = await self.fallback_data_source.get(self.fallback_key(query))
+
+        if data is None:
+            return None
+
+        if not for_memory and query.fields:
+            return self.make_fallback_data_fields(query, data)
+
+        return data
+
+    def make_entity(
+        self,
+        data: HashData,
+        query: BaseQuery[HashEntity, HashData, FallbackKey],
+    ) -> Any:
+        entity_type = self.get_entity_type(query)
+
+        if self.compiled_decoder:
+            decoder = make_decoder(
+                entity_type, has_bytes_keys=False  # type: ignore
+            )
+            return decoder(data)  # type: ignore
+
+        return jdataclasses.asdataclass(data, entity_type)
+
+    async def add_memory_data(  # type: ignore
+        self, key: str, data: bytes, from_fallback: bool = False
+    ) -> None:
+        await self.memory_data_source.set(key, data)
+
+    async def add_memory_data_from_fallback(
+        self,
+        key: str,
+        query: Union[BaseQuery[HashEntity, HashData, FallbackKey], Any],
+        data: HashData,
+    ) -> HashData:
+        await self.memory_data_source.set(key, self.dumps(data))
+
+        if isinstance(query, HashQuery) and query.fields:
+            return self.make_fallback_data_fields(query, data)
+
+        return data
+
+    def make_memory_data_from_entity(self, entity: Any) -> bytes:  # type: ignore
+        return self.dumps(entity)
+
+    def dumps(self, data: Any) -> bytes:
+        if self.blob_format == 'msgpack':
+            blob: bytes = msgpack.packb(jdataclasses.asdict(data))
+        else:
+            blob = dataclass_asjson(data)
+
+        if self.blob_compression_level is not None:
+            return zlib.compress(blob, self.blob_compression_level)
+
+        return blob
+
+    def loads(self, blob: bytes) -> Dict[str, Any]:
+        if self.blob_compression_level is not None:
+            blob = zlib.decompress(blob)
+
+        if self.blob_format == 'msgpack':
+            return msgpack.unpackb(blob)  # type: ignore
+
+        return orjson.loads(blob)  # type: ignore
@@ -1,13 +1,50 @@
+from bisect import bisect
+from functools import lru_cache
 from hashlib import md5
-from typing import Generic, Optional, Sequence, TypeVar
+from typing import ClassVar, Generic, List, Optional, Sequence, TypeVar
+from zlib import crc32
+
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None  # type: ignore
 
 
 DataSource = TypeVar('DataSource')
 
 
+def md5_hash(data: bytes) -> int:
+    return int.from_bytes(md5(data).digest(), 'big')
+
+
+def crc32_hash(data: bytes) -> int:
+    return crc32(data)
+
+
+def xxhash_hash(data: bytes) -> int:
+    return xxhash.xxh64_intdigest(data)
+
+
 class HashRing(Generic[DataSource]):
+    """Routes keys to nodes by ``hash_function(key) % nodes_size``.
+
+    ``hash_function`` defaults to md5 to keep the keys placement; set
+    ``cache_size`` to memoize the node of the most used keys. With
+    ``hash_tags``, only the ``{...}`` hash tag of a key is hashed when
+    present, like redis cluster. It is off here to keep the placement of
+    the existing tagged keys.
+    """
+
+    hash_function = staticmethod(md5_hash)
+    cache_size: ClassVar[Optional[int]] = None
+    hash_tags: ClassVar[bool] = False
+
     def __init__(
-        self, nodes: Sequence[DataSource], nodes_size: Optional[int] = None
+        self,
+        nodes: Sequence[DataSource],
+        nodes_size: Optional[int] = None,
+        names: Optional[Sequence[str]] = None,
     ):
         self.nodes = nodes
 
@@ -16,11 +53,112 @@ class HashRing(Generic[DataSource]):
 
         self.nodes_size = nodes_size
 
+        if names is None:
+            names = [str(i) for i in range(nodes_size)]
+
+        self.names = names
+
+        if self.cache_size:
+            cached_get_node = lru_cache(maxsize=self.cache_size)(self.get_node)
+            self.get_node = cached_get_node  # type: ignore
+
+    def hash_key(self, key: str) -> int:
+        if not isinstance(key, str):
+            key = str(key)
+
+        if self.hash_tags:
+            key = hash_tag(key)
+
+        return self.hash_function(key.encode('utf-8'))  # type: ignore
+
     def get_index(self, key: str) -> int:
-        return (
-            int(md5(str(key).encode('utf-8')).hexdigest(), 16)
-            % self.nodes_size
-        )
+        return self.hash_key(key) % self.nodes_size
 
     def get_node(self, key: str) -> DataSource:
         return self.nodes[self.get_index(key)]
+
+
+class ConsistentHashRing(HashRing[DataSource]):
+    """Ketama like ring with virtual nodes placed by the nodes names.
+
+    Adding or removing a node only remaps the keys of its virtual nodes,
+    about 1/N of the keys.
+    """
+
+    virtual_nodes_size: int = 160
+    hash_tags: ClassVar[bool] = True
+
+    def __init__(
+        self,
+        nodes: Sequence[DataSource],
+        nodes_size: Optional[int] = None,
+        names: Optional[Sequence[str]] = None,
+    ):
+        super().__init__(nodes, nodes_size, names)
+        points = sorted(
+            (point, index)
+            for index in range(self.nodes_size)
+            for point in make_points(
+                self.names[index], self.virtual_nodes_size
+            )
+        )
+        self.points = [point for point, _ in points]
+        self.points_indexes = [index for _, index in points]
+
+    def get_index(self, key: str) -> int:
+        position = bisect(self.points, self.hash_key(key) & 0xFFFFFFFF)
+
+        if position == len(self.points):
+            position = 0
+
+        return self.points_indexes[position]
+
+
+class JumpHashRing(HashRing[DataSource]):
+    """Jump consistent hash ring.
+
+    It has no memory cost and an even distribution, but nodes can only be
+    added or removed at the end of the nodes sequence.
+    """
+
+    hash_tags: ClassVar[bool] = True
+
+    def get_index(self, key: str) -> int:
+        return jump_hash(self.hash_key(key), self.nodes_size)
+
+
+def hash_tag(key: str) -> str:
+    start = key.find('{')
+
+    if start != -1:
+        stop = key.find('}', start + 1)
+
+        if stop > start + 1:
+            return key[start + 1 : stop]  # noqa
+
+    return key
+
+
+def make_points(name: str, virtual_nodes_size: int) -> List[int]:
+    points: List[int] = []
+
+    for i in range(0, virtual_nodes_size, 4):
+        digest = md5(f'{name}-{i // 4}'.encode('utf-8')).digest()
+        points.extend(
+            int.from_bytes(digest[j * 4 : j * 4 + 4], 'little')  # noqa
+            for j in range(min(4, virtual_nodes_size - i))
+        )
+
+    return points
+
+
+def jump_hash(key: int, buckets_size: int) -> int:
+    key &= 0xFFFFFFFFFFFFFFFF
+    bucket, next_bucket = -1, 0
+
+    while next_bucket < buckets_size:
+        bucket = next_bucket
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        next_bucket = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+
+    return bucket
@@ -17,14 +17,24 @@ from typing import (  # type: ignore
 )
 
 from dbdaora import FallbackDataSource, MemoryDataSource
+from dbdaora.compression import Compression
+from dbdaora.data_sources.fallback.compressed import (
+    CompressedFallbackDataSource,
+)
+from dbdaora.data_sources.fallback.write_behind import (
+    WriteBehindFallbackDataSource,
+)
+from dbdaora.data_sources.memory.compressed import CompressedMemoryDataSource
 from dbdaora.entity import EntityData
 from dbdaora.exceptions import (
     EntityNotFoundError,
     InvalidKeyAttributeError,
     InvalidQueryError,
     RequiredClassAttributeError,
+    WriteBehindNotSupportedError,
 )
 from dbdaora.keys import FallbackKey
+from dbdaora.write_behind import WriteBehindQueue
 
 from ..entity import Entity
 
@@ -41,8 +51,51 @@ class MemoryRepository(Generic[Entity, EntityData, FallbackKey]):
     key_attrs: ClassVar[Sequence[str]]
     many_key_attrs: ClassVar[Sequence[str]]
     __skip_cls_validation__: ClassVar[Sequence[str]] = ()
+    memory_compression: ClassVar[Optional[Compression]] = None
+    fallback_compression: ClassVar[Optional[Compression]] = None
+    hash_tag_key_parts: ClassVar[int] = 0
+    read_from_replicas: ClassVar[bool] = True
+    memory_data_is_entity: ClassVar[bool] = True
+    fallback_write_behind: ClassVar[bool] = True
     timeout: int = 1
     logger: Logger = getLogger(__name__)
+    write_behind: Optional[WriteBehindQueue] = None
+
+    def __post_init__(self) -> None:
+        if not self.read_from_replicas:
+            self.memory_data_source = (
+                self.memory_data_source.primary_data_source()
+            )
+
+        if self.memory_compression is not None and not isinstance(
+            self.memory_data_source, CompressedMemoryDataSource
+        ):
+            self.memory_data_source = CompressedMemoryDataSource(
+                self.memory_data_source, self.memory_compression
+            )
+
+        if self.fallback_compression is not None and not isinstance(
+            self.fallback_data_source,
+            (CompressedFallbackDataSource, WriteBehindFallbackDataSource),
+        ):
+            self.fallback_data_source = CompressedFallbackDataSource(
+                self.fallback_data_source, self.fallback_compression
+            )
+
+        if self.write_behind is not None and not self.fallback_write_behind:
+            raise WriteBehindNotSupportedError(self)
+
+        if self.write_behind is not None and not isinstance(
+            self.fallback_data_source, WriteBehindFallbackDataSource
+        ):
+            self.fallback_data_source = WriteBehindFallbackDataSource(
+                self.fallback_data_source, self.write_behind
+            )
+
+    @property
+    def primary_memory_data_source(self) -> MemoryDataSource:
+        """Used to read right after writing, the replicas may be behind."""
+        return self.memory_data_source.primary_data_source()
 
     def __init_subclass__(
         cls,
@@ -313,7 +366,11 @@ class MemoryRepository(Generic[Entity, EntityData, FallbackKey]):
     ) -> None:
         memory_key = self.memory_key(entity)
 
-        if memory_always or await self.memory_data_source.exists(memory_key):
+        if (
+            memory_always
+            or (self.write_behind is not None and self.memory_data_is_entity)
+            or await self.primary_memory_data_source.exists(memory_key)
+        ):
             memory_data = self.make_memory_data_from_entity(entity)
             await self.add_memory_data(memory_key, memory_data)
             await self.set_expire_time(memory_key)
@@ -321,6 +378,14 @@ class MemoryRepository(Generic[Entity, EntityData, FallbackKey]):
         await self.add_fallback(entity, fallback_ttl=fallback_ttl)
         await self.delete_fallback_not_found(entity)
 
+    async def replay_fallback_writes(self) -> int:
+        if isinstance(
+            self.fallback_data_source, WriteBehindFallbackDataSource
+        ):
+            return await self.fallback_data_source.replay()
+
+        return 0
+
     async def set_expire_time(self, key: str) -> None:
         await self.memory_data_source.expire(key, self.expire_time)
 
@@ -378,7 +443,7 @@ class MemoryRepository(Generic[Entity, EntityData, FallbackKey]):
         try:
             return bool(
                 await asyncio.wait_for(
-                    self.memory_data_source.exists(key), self.timeout,
+                    self.primary_memory_data_source.exists(key), self.timeout,
                 )
             )
         except asyncio.TimeoutError:
@@ -407,17 +472,17 @@ class MemoryRepository(Generic[Entity, EntityData, FallbackKey]):
     ) -> str:
         if isinstance(query, Query):
             return self.memory_data_source.make_key(
-                self.name, *query.key_parts
+                self.name, *self.hash_tag(query.key_parts)
             )
 
         elif isinstance(self.get_entity_type(query), _TypedDictMeta):
             return self.memory_data_source.make_key(
-                self.name, *self.key_parts(query)
+                self.name, *self.hash_tag(self.key_parts(query))
             )
 
         elif isinstance(query, self.get_entity_type(query)):
             return self.memory_data_source.make_key(
-                self.name, *self.key_parts(query)
+                self.name, *self.hash_tag(self.key_parts(query))
             )
 
         raise InvalidQueryError(query)
@@ -470,21 +535,31 @@ class MemoryRepository(Generic[Entity, EntityData, FallbackKey]):
     ) -> str:
         if isinstance(query, Query):
             return self.memory_data_source.make_key(
-                self.name, 'not-found', *query.key_parts
+                self.name, 'not-found', *self.hash_tag(query.key_parts)
             )
 
         elif isinstance(self.get_entity_type(query), _TypedDictMeta):
             return self.memory_data_source.make_key(
-                self.name, 'not-found', *self.key_parts(query)
+                self.name, 'not-found', *self.hash_tag(self.key_parts(query))
             )
 
         elif isinstance(query, self.get_entity_type(query)):
             return self.memory_data_source.make_key(
-                self.name, 'not-found', *self.key_parts(query)
+                self.name, 'not-found', *self.hash_tag(self.key_parts(query))
             )
 
         raise InvalidQueryError(query)
 
+    def hash_tag(self, key_parts: Sequence[Any]) -> Sequence[Any]:
+        if not self.hash_tag_key_parts:
+            return key_parts
+
+        tag_size = self.hash_tag_key_parts
+        tag = self.memory_data_source.make_key(
+            *(str(part) for part in key_parts[:tag_size])
+        )
+        return [f'{{{tag}}}', *key_parts[tag_size:]]
+
     def get_entity_type(
         self,
         query: 'Union[BaseQuery[Entity, EntityData, FallbackKey], Entity, EntityData]',
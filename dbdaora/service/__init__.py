@@ -493,6 +493,9 @@ class Service(Generic[Entity, EntityData, FallbackKey]):
         return True
 
     async def shutdown(self) -> None:
+        if self.repository.write_behind is not None:
+            await self.repository.write_behind.close()
+
         self.repository.memory_data_source.close()
         await self.repository.memory_data_source.wait_closed()
 
@@ -8,6 +8,7 @@ from ..circuitbreaker import AsyncCircuitBreaker
 from ..entity import Entity, EntityData
 from ..keys import FallbackKey
 from ..repository import MemoryRepository
+from ..write_behind import WriteBehindQueue
 from . import Service
 
 
@@ -33,6 +34,7 @@ async def build(
     repository_timeout: Optional[int] = None,
     has_add_circuit_breaker: bool = False,
     has_delete_circuit_breaker: bool = False,
+    write_behind: Optional[WriteBehindQueue] = None,
 ) -> Service[Entity, EntityData, FallbackKey]:
     repository = await build_repository(
         repository_cls,
@@ -41,6 +43,7 @@ async def build(
         repository_expire_time,
         repository_timeout,
         logger,
+        write_behind,
     )
 
     if cb_expected_exception and cb_expected_fallback_exception:
@@ -96,18 +99,25 @@ async def build_repository(
     expire_time: int,
     timeout: Optional[int],
     logger: Optional[Logger],
+    write_behind: Optional[WriteBehindQueue] = None,
 ) -> MemoryRepository[Entity, EntityData, FallbackKey]:
     optional_args = {
         k: v
-        for k, v in zip(['timeout', 'logger'], [timeout, logger])
+        for k, v in zip(
+            ['timeout', 'logger', 'write_behind'],
+            [timeout, logger, write_behind],
+        )
         if v is not None
     }
-    return cls(
+    repository = cls(
         memory_data_source=await memory_data_source_factory(),
         fallback_data_source=await fallback_data_source_factory(),
         expire_time=expire_time,
         **optional_args,  # type: ignore
     )
+    await repository.replay_fallback_writes()
+
+    return repository
 
 
 def build_cache(
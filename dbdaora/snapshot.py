@@ -0,0 +1,181 @@
+"""Dumps and restores the memory keys of a repository.
+
+Usage: python -m dbdaora.snapshot {dump,restore} module:repository_factory FILE
+"""
+import argparse
+import asyncio
+import gzip
+import struct
+import sys
+import time
+from io import BufferedIOBase
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+from dbdaora.exceptions import InvalidSnapshotError
+from dbdaora.repository import MemoryRepository
+from dbdaora.warmup import import_factory, make_repository
+
+
+SNAPSHOT_MAGIC = b'DBDAORA-SNAPSHOT\x01'
+SNAPSHOT_HEADER = struct.Struct('>q')
+ENTRY_HEADER = struct.Struct('>IqI')
+
+
+async def dump(
+    repository: MemoryRepository[Any, Any, Any],
+    path: str,
+    *,
+    count: int = 1000,
+) -> int:
+    """Writes the DUMP of every ``name:`` key with its time to live.
+
+    Sharded data sources are scanned shard by shard.
+    """
+    data_source = repository.memory_data_source
+    match = data_source.make_key(repository.name, '*')
+    entries = 0
+
+    with gzip.open(path, 'wb', compresslevel=1) as file:
+        file.write(SNAPSHOT_MAGIC)
+        file.write(SNAPSHOT_HEADER.pack(now()))
+
+        async for keys in data_source.scan_keys(match, count):
+            for key, (value, ttl) in zip(
+                keys, await data_source.dump_many(keys)
+            ):
+                if value is None:
+                    continue
+
+                file.write(
+                    ENTRY_HEADER.pack(len(key), max(ttl, 0), len(value))
+                )
+                file.write(key)
+                file.write(value)
+                entries += 1
+
+    return entries
+
+
+async def restore(
+    repository: MemoryRepository[Any, Any, Any],
+    path: str,
+    *,
+    batch_size: int = 1000,
+    replace: bool = False,
+) -> int:
+    """RESTOREs the snapshot keys, skipping the expired ones.
+
+    The existing keys are skipped, or replaced with ``replace``.
+    Returns the number of restored keys.
+
+    Keys are routed by the current data source, so a snapshot can seed
+    a different number of shards.
+    """
+    data_source = repository.memory_data_source
+    entries = 0
+
+    with gzip.open(path, 'rb') as file:
+        if file.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+            raise InvalidSnapshotError(path)
+
+        (dumped_at,) = SNAPSHOT_HEADER.unpack(file.read(SNAPSHOT_HEADER.size))
+        elapsed = now() - dumped_at
+        batch: List[Tuple[str, int, bytes]] = []
+
+        for key, ttl, value in read_entries(file, path):
+            if ttl:
+                ttl -= elapsed
+
+                if ttl <= 0:
+                    continue
+
+            batch.append((key.decode(), ttl, value))
+
+            if len(batch) >= batch_size:
+                entries += await data_source.restore_many(batch, replace)
+                batch = []
+
+        if batch:
+            entries += await data_source.restore_many(batch, replace)
+
+    return entries
+
+
+def read_entries(
+    file: BufferedIOBase, path: str
+) -> Iterator[Tuple[bytes, int, bytes]]:
+    while True:
+        header = file.read(ENTRY_HEADER.size)
+
+        if not header:
+            return
+
+        if len(header) != ENTRY_HEADER.size:
+            raise InvalidSnapshotError(path)
+
+        key_size, ttl, value_size = ENTRY_HEADER.unpack(header)
+        key = file.read(key_size)
+        value = file.read(value_size)
+
+        if len(key) != key_size or len(value) != value_size:
+            raise InvalidSnapshotError(path)
+
+        yield key, ttl, value
+
+
+def now() -> int:
+    return int(time.time() * 1000)
+
+
+async def run(
+    command: Callable[..., Any],
+    factory: Callable[[], Any],
+    path: str,
+    **kwargs: Any,
+) -> int:
+    repository = await make_repository(factory)
+
+    try:
+        return await command(repository, path, **kwargs)  # type: ignore
+
+    finally:
+        repository.memory_data_source.close()
+        await repository.memory_data_source.wait_closed()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m dbdaora.snapshot',
+        description='Dumps and restores the memory keys of a repository.',
+    )
+    parser.add_argument('command', choices=['dump', 'restore'])
+    parser.add_argument(
+        'factory',
+        help='module:callable returning the repository, it can be async',
+    )
+    parser.add_argument('file')
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--replace', action='store_true')
+    args = parser.parse_args(argv)
+
+    factory = import_factory(args.factory)
+
+    if args.command == 'dump':
+        entries = asyncio.run(run(dump, factory, args.file, count=args.count))
+    else:
+        entries = asyncio.run(
+            run(
+                restore,
+                factory,
+                args.file,
+                batch_size=args.batch_size,
+                replace=args.replace,
+            )
+        )
+
+    print(f'{entries} keys', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+from array import array
+from itertools import accumulate
+from typing import Any, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+
+SortedSetItem = Union[bytes, Tuple[bytes, float]]
+
+
+class CompactSortedSetData(Sequence[SortedSetItem]):
+    """Read-only sorted set data backed by a members buffer and arrays.
+
+    Members are stored in a single bytes buffer indexed by an offsets
+    array and scores (when present) in an ``array('d')``, so a cached
+    entity costs a few bytes per member instead of one tuple, one bytes
+    and one float object per member.
+    """
+
+    __slots__ = ('buffer', 'offsets', 'scores')
+
+    def __init__(
+        self,
+        buffer: bytes,
+        offsets: 'array[int]',
+        scores: Optional['array[float]'] = None,
+    ):
+        self.buffer = buffer
+        self.offsets = offsets
+        self.scores = scores
+
+    @classmethod
+    def from_data(cls, data: Iterable[Any]) -> 'CompactSortedSetData':
+        members = []
+        scores: Optional['array[float]'] = None
+
+        for item in data:
+            if isinstance(item, tuple):
+                if scores is None:
+                    scores = array('d')
+
+                item, score = item
+                scores.append(score)
+
+            members.append(item.encode() if isinstance(item, str) else item)
+
+        offsets = array(offsets_typecode(sum(map(len, members))), [0])
+        offsets.extend(accumulate(len(member) for member in members))
+
+        return cls(b''.join(members), offsets, scores)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+
+            if step != 1:
+                return type(self).from_data(
+                    self[i] for i in range(start, stop, step)
+                )
+
+            stop = max(start, stop)
+            offsets = self.offsets[start : stop + 1]  # noqa
+            buffer_start = offsets[0]
+
+            if buffer_start:
+                offsets = array(
+                    offsets.typecode,
+                    (offset - buffer_start for offset in offsets),
+                )
+
+            buffer_stop = buffer_start + offsets[-1]
+
+            return type(self)(
+                self.buffer[buffer_start:buffer_stop],
+                offsets,
+                None if self.scores is None else self.scores[start:stop],
+            )
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('sorted set index out of range')
+
+        member = self.buffer[
+            self.offsets[index] : self.offsets[index + 1]  # noqa
+        ]
+
+        if self.scores is None:
+            return member
+
+        return member, self.scores[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        buffer = self.buffer
+        offsets = self.offsets
+        members = (
+            buffer[offsets[i] : offsets[i + 1]]  # noqa
+            for i in range(len(self))
+        )
+
+        if self.scores is None:
+            return members
+
+        return zip(members, self.scores)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CompactSortedSetData):
+            return (
+                self.buffer == other.buffer
+                and self.offsets == other.offsets
+                and self.scores == other.scores
+            )
+
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({list(self)!r})'
+
+    def __reduce__(self) -> Any:
+        return type(self), (self.buffer, self.offsets, self.scores)
+
+    @property
+    def members(self) -> 'CompactSortedSetData':
+        if self.scores is None:
+            return self
+
+        return type(self)(self.buffer, self.offsets)
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            len(self.buffer)
+            + self.offsets.itemsize * len(self.offsets)
+            + (
+                0
+                if self.scores is None
+                else self.scores.itemsize * len(self.scores)
+            )
+        )
+
+
+def offsets_typecode(buffer_size: int) -> str:
+    return 'I' if buffer_size < 2 ** 32 else 'Q'
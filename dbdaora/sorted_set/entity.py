@@ -24,12 +24,14 @@ SortedSetData = Union[RangeOutput, SortedSetInput]
 class SortedSetEntityProtocol(Protocol):
     data: SortedSetData
     max_size: Optional[int] = None
+    next_cursor: Optional[str] = None
 
     def __init__(
         self,
         *,
         data: SortedSetData,
         max_size: Optional[int] = None,
+        next_cursor: Optional[str] = None,
         **kwargs: Any,
     ):
         ...
@@ -38,6 +40,7 @@ class SortedSetEntityProtocol(Protocol):
 class SortedSetEntity(SortedSetEntityProtocol):
     data: SortedSetData
     max_size: Optional[int] = None
+    next_cursor: Optional[str] = None
 
     def __init_subclass__(cls) -> None:
         init_subclass(cls, (SortedSetEntity,))
@@ -54,6 +57,7 @@ class SortedSetDictEntityMeta(_TypedDictMeta):  # type: ignore
 class SortedSetDictEntity(TypedDict, metaclass=SortedSetDictEntityMeta):
     data: SortedSetData
     max_size: Optional[int]
+    next_cursor: Optional[str]
 
 
 SortedSetEntityHint = TypeVar(
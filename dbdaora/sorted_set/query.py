@@ -1,8 +1,9 @@
 import dataclasses
-from typing import Any, List, Optional
+from typing import Any, ClassVar, List, Optional, Sequence, Tuple, Type, Union
 
+from dbdaora.exceptions import InvalidQueryError
 from dbdaora.keys import FallbackKey
-from dbdaora.query import Query
+from dbdaora.query import BaseQuery, Query, QueryMany
 
 from .entity import SortedSetData, SortedSetEntityHint
 
@@ -17,6 +18,8 @@ class SortedSetQuery(Query[SortedSetEntityHint, SortedSetData, FallbackKey]):
     min_score: Optional[float] = None
     max_score: Optional[float] = None
     withmaxsize: bool = False
+    cursor: Optional[str] = None
+    withcursor: bool = False
 
     def __init__(
         self,
@@ -31,6 +34,8 @@ class SortedSetQuery(Query[SortedSetEntityHint, SortedSetData, FallbackKey]):
         min_score: Optional[float] = None,
         max_score: Optional[float] = None,
         withmaxsize: bool = False,
+        cursor: Optional[str] = None,
+        withcursor: bool = False,
         **kwargs: Any,
     ):
         super().__init__(
@@ -43,6 +48,71 @@ class SortedSetQuery(Query[SortedSetEntityHint, SortedSetData, FallbackKey]):
         self.min_score = min_score
         self.max_score = max_score
         self.withmaxsize = withmaxsize
+        self.cursor = cursor
+        self.withcursor = withcursor or cursor is not None
+
+
+@dataclasses.dataclass(init=False)
+class SortedSetQueryMany(
+    QueryMany[SortedSetEntityHint, SortedSetData, FallbackKey]
+):
+    query_cls: ClassVar[Type[SortedSetQuery[Any, Any]]] = SortedSetQuery[
+        Any, Any
+    ]
+    queries: Sequence[  # type: ignore
+        SortedSetQuery[SortedSetEntityHint, FallbackKey]
+    ]
+    repository: 'SortedSetRepository[SortedSetEntityHint, FallbackKey]'
+
+    def __init__(
+        self,
+        repository: 'SortedSetRepository[SortedSetEntityHint, FallbackKey]',
+        *args: Any,
+        many: List[Union[Any, Tuple[Any, ...]]],
+        memory: bool = True,
+        many_key_parts: Optional[List[List[Any]]] = None,
+        reverse: bool = False,
+        withscores: bool = False,
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        withmaxsize: bool = False,
+        cursor: Optional[str] = None,
+        withcursor: bool = False,
+        **kwargs: Any,
+    ):
+        super().__init__(
+            repository,
+            memory=memory,
+            many=many,
+            many_key_parts=many_key_parts,
+            *args,
+            **kwargs,
+        )
+
+        # a cursor holds the position of one sorted set
+        if cursor is not None:
+            raise InvalidQueryError(self)
+
+        for query in self.queries:
+            query.reverse = reverse
+            query.withscores = withscores
+            query.page = page
+            query.page_size = page_size
+            query.min_score = min_score
+            query.max_score = max_score
+            query.withmaxsize = withmaxsize
+            query.withcursor = withcursor
+
+
+def make(
+    *args: Any, **kwargs: Any
+) -> BaseQuery[SortedSetEntityHint, SortedSetData, FallbackKey]:
+    if kwargs.get('many') or kwargs.get('many_key_parts'):
+        return SortedSetQueryMany(*args, **kwargs)
+
+    return SortedSetQuery(*args, **kwargs)
 
 
 from .repositories import SortedSetRepository  # noqa isort:skip
@@ -1,22 +1,44 @@
 import asyncio
+import binascii
 import itertools
-from typing import Any, Awaitable, Optional, Sequence, Tuple, TypedDict, Union
-
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from bisect import bisect_left, bisect_right
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+    Union,
+    overload,
+)
+
+from dbdaora.exceptions import InvalidQueryError
 from dbdaora.keys import FallbackKey
+from dbdaora.query import BaseQuery
 from dbdaora.repository import MemoryRepository
 
+from ..compact import CompactSortedSetData
 from ..entity import SortedSetData, SortedSetEntityHint
-from ..query import SortedSetQuery
+from ..query import SortedSetQuery, SortedSetQueryMany
+from ..query import make as query_factory
 
 
 class FallbackSortedSetData(TypedDict):
     data: Sequence[Union[str, float]]
+    sorted: bool
 
 
 class SortedSetRepository(
     MemoryRepository[SortedSetEntityHint, SortedSetData, FallbackKey]
 ):
     __skip_cls_validation__ = ('SortedSetRepository',)
+    compact_data: ClassVar[bool] = False
 
     async def get_memory_data(  # type: ignore
         self,
@@ -29,8 +51,44 @@ class SortedSetRepository(
         if query.withmaxsize:
             size_task = make_task(self.memory_data_source.zcard(key))
 
+        if query.withcursor:
+            max_score, min_score, offset = self.parse_cursor(query)
+
+            if query.reverse:
+                data_task = self.memory_data_source.zrevrangebyscore(
+                    key,
+                    max=max_score,
+                    min=min_score,
+                    withscores=True,
+                    offset=offset,
+                    count=query.page_size,
+                )
+            else:
+                data_task = self.memory_data_source.zrangebyscore(
+                    key,
+                    min=min_score,
+                    max=max_score,
+                    withscores=True,
+                    offset=offset,
+                    count=query.page_size,
+                )
+
+            cursor_data = await data_task
+
+            if not cursor_data:
+                if size_task:
+                    size_task.cancel()
+                return None
+
+            return self.make_cursor_page(  # type: ignore
+                cursor_data,  # type: ignore
+                query,
+                await size_task if size_task else None,
+            )
+
         if query.max_score is not None or query.min_score is not None:
             max_score, min_score = self.parse_score_limits(query)
+            limit_offset, limit_count = self.parse_score_page(query)
 
             if query.reverse:
                 data_task = make_task(
@@ -39,6 +97,8 @@ class SortedSetRepository(
                         max=max_score,
                         min=min_score,
                         withscores=query.withscores,
+                        offset=limit_offset,
+                        count=limit_count,
                     )
                 )
             else:
@@ -48,6 +108,8 @@ class SortedSetRepository(
                         max=max_score,
                         min=min_score,
                         withscores=query.withscores,
+                        offset=limit_offset,
+                        count=limit_count,
                     )
                 )
 
@@ -104,6 +166,73 @@ class SortedSetRepository(
             float('-inf') if query.min_score is None else query.min_score,
         )
 
+    def parse_score_page(
+        self, query: SortedSetQuery[SortedSetEntityHint, FallbackKey]
+    ) -> Tuple[Optional[int], Optional[int]]:
+        if query.page_size:
+            return ((query.page or 1) - 1) * query.page_size, query.page_size
+
+        return None, None
+
+    def parse_cursor(
+        self, query: SortedSetQuery[SortedSetEntityHint, FallbackKey]
+    ) -> Tuple[float, float, int]:
+        if not query.page_size:
+            raise InvalidQueryError(query)
+
+        max_score, min_score = self.parse_score_limits(query)
+
+        if query.cursor is None:
+            return max_score, min_score, 0
+
+        score, offset = decode_cursor(query)
+
+        if query.reverse:
+            if score > max_score:
+                return max_score, min_score, 0
+
+            return score, min_score, offset
+
+        if score < min_score:
+            return max_score, min_score, 0
+
+        return max_score, score, offset
+
+    def make_cursor_page(
+        self,
+        data_withscores: Sequence[Tuple[bytes, float]],
+        query: SortedSetQuery[SortedSetEntityHint, FallbackKey],
+        maxsize: Optional[int],
+    ) -> Tuple[Any, Optional[int], Optional[str]]:
+        next_cursor = None
+
+        if len(data_withscores) == query.page_size:
+            last_score = data_withscores[-1][1]
+            ties = 0
+
+            for member, score in reversed(data_withscores):
+                if score != last_score:
+                    break
+
+                ties += 1
+
+            if ties == len(data_withscores) and query.cursor is not None:
+                score, offset = decode_cursor(query)
+
+                if score == last_score:
+                    ties += offset
+
+            next_cursor = encode_cursor(last_score, ties)
+
+        if query.withscores:
+            return data_withscores, maxsize, next_cursor
+
+        return (
+            [member for member, score in data_withscores],
+            maxsize,
+            next_cursor,
+        )
+
     async def get_fallback_data(  # type: ignore
         self,
         query: Union[
@@ -121,48 +250,83 @@ class SortedSetRepository(
         if data is None:
             return None
 
-        data_withscores = [
-            (
-                data['data'][i].encode()  # type: ignore
-                if isinstance(data['data'][i], str)
-                else data['data'][i],
-                data['data'][i + 1],
-            )
-            for i in range(0, len(data['data']), 2)
-        ]
+        sorted_data: Sequence[Tuple[bytes, float]] = FallbackSortedSetView(
+            data['data']
+        )
+
+        if not data.get('sorted'):
+            sorted_data = sorted(sorted_data, key=lambda v: (v[1], v[0]))
 
         if for_memory:
-            return data_withscores  # type: ignore
+            return list(sorted_data)
 
-        return self.parse_data_from_fallback(data_withscores, query)
+        return self.parse_data_from_fallback(sorted_data, query)
 
     def parse_data_from_fallback(
         self, data_withscores: Any, query: Any
     ) -> Optional[SortedSetData]:
-        sorted_data = sorted(
-            data_withscores, key=lambda v: v[1], reverse=query.reverse
-        )
-        maxsize = len(sorted_data) if query.withmaxsize else None
+        size = len(data_withscores)
+        maxsize = size if query.withmaxsize else None
+
+        if query.withcursor:
+            max_score, min_score, offset = self.parse_cursor(query)
+            scores = SortedSetScores(data_withscores)
+
+            if query.reverse:
+                stop = bisect_right(scores, max_score) - offset
+                start = max(
+                    bisect_left(scores, min_score), stop - query.page_size
+                )
+            else:
+                start = bisect_left(scores, min_score) + offset
+                stop = min(
+                    bisect_right(scores, max_score), start + query.page_size
+                )
+
+            cursor_data = list(
+                data_withscores[start:stop] if stop > start else ()
+            )
+
+            if not cursor_data:
+                return None
+
+            if query.reverse:
+                cursor_data.reverse()
+
+            return self.make_cursor_page(  # type: ignore
+                cursor_data, query, maxsize
+            )
 
         if query.max_score is not None or query.min_score is not None:
             max_score, min_score = self.parse_score_limits(query)
-
-            if max_score != float('inf') or min_score != float('-inf'):
-                sorted_data = [
-                    (member, score)
-                    for member, score in sorted_data
-                    if min_score <= score <= max_score
-                ]
+            limit_offset, limit_count = self.parse_score_page(query)
+            scores = SortedSetScores(data_withscores)
+            start = bisect_left(scores, min_score)
+            stop = bisect_right(scores, max_score)
+
+            if limit_offset is not None and limit_count is not None:
+                if query.reverse:
+                    stop = max(stop - limit_offset, start)
+                    start = max(stop - limit_count, start)
+                else:
+                    start = min(start + limit_offset, stop)
+                    stop = min(start + limit_count, stop)
 
         else:
             start, stop = self.parse_page(query)
+            stop = size if stop == -1 else stop + 1
+
+            if query.reverse:
+                start, stop = max(size - stop, 0), max(size - start, 0)
 
-            if start != 0 or stop != -1:
-                sorted_data = sorted_data[start : stop + 1]  # noqa
+        sorted_data = list(data_withscores[start:stop])
 
         if not sorted_data:
             return None
 
+        if query.reverse:
+            sorted_data.reverse()
+
         if query.withscores:
             return (sorted_data, maxsize)  # type: ignore
 
@@ -174,8 +338,15 @@ class SortedSetRepository(
         query: SortedSetQuery[SortedSetEntityHint, FallbackKey],
     ) -> Any:
         return self.get_entity_type(query)(
-            data=data[0],  # type: ignore
+            data=CompactSortedSetData.from_data(data[0])  # type: ignore
+            if self.compact_data
+            else data[0],
             max_size=data[1],  # type: ignore
+            **(
+                {'next_cursor': data[2]}  # type: ignore
+                if query.withcursor
+                else {}
+            ),
             **{
                 id_name: id_value
                 for id_name, id_value in zip(self.key_attrs, query.key_parts)
@@ -200,12 +371,14 @@ class SortedSetRepository(
     async def add_fallback(
         self, entity: Any, *entities: Any, **kwargs: Any
     ) -> None:
+        data = entity['data'] if isinstance(entity, dict) else entity.data
         await self.fallback_data_source.put(
             self.fallback_key(entity),
             {
-                'data': list(itertools.chain(*entity['data']))
-                if isinstance(entity, dict)
-                else list(itertools.chain(*entity.data))
+                'data': list(
+                    itertools.chain(*sorted(data, key=lambda v: (v[1], v[0])))
+                ),
+                'sorted': True,
             },
             **kwargs,
         )
@@ -222,10 +395,202 @@ class SortedSetRepository(
         await self.memory_data_source.zadd(key, *self.format_memory_data(data))
         return self.parse_data_from_fallback(data, query)
 
+    async def add_member(
+        self,
+        query: SortedSetQuery[SortedSetEntityHint, FallbackKey],
+        member: Union[str, bytes],
+        score: float,
+        fallback_ttl: Optional[int] = None,
+    ) -> None:
+        if query.memory:
+            await self.memory_data_source.zadd_if_exists(
+                self.memory_key(query), score, member
+            )
+            await self.delete_fallback_not_found(query)
+
+        await self.add_member_fallback(
+            query, member, score, fallback_ttl=fallback_ttl
+        )
+
+    async def increment_member(
+        self,
+        query: SortedSetQuery[SortedSetEntityHint, FallbackKey],
+        member: Union[str, bytes],
+        increment: float,
+        fallback_ttl: Optional[int] = None,
+    ) -> float:
+        if query.memory:
+            await self.memory_data_source.zincrby_if_exists(
+                self.memory_key(query), increment, member
+            )
+            await self.delete_fallback_not_found(query)
+
+        return await self.increment_member_fallback(
+            query, member, increment, fallback_ttl=fallback_ttl
+        )
+
+    async def remove_member(
+        self,
+        query: SortedSetQuery[SortedSetEntityHint, FallbackKey],
+        member: Union[str, bytes],
+    ) -> None:
+        if query.memory:
+            await self.memory_data_source.zrem(self.memory_key(query), member)
+
+        await self.remove_member_fallback(query, member)
+
+    async def add_member_fallback(
+        self,
+        query: SortedSetQuery[SortedSetEntityHint, FallbackKey],
+        member: Union[str, bytes],
+        score: float,
+        fallback_ttl: Optional[int] = None,
+    ) -> None:
+        key = self.fallback_key(query)
+        members = await self.get_fallback_members(key)
+        members[member.encode() if isinstance(member, str) else member] = score
+        await self.put_fallback_members(
+            key, members, fallback_ttl=fallback_ttl
+        )
+
+    async def increment_member_fallback(
+        self,
+        query: SortedSetQuery[SortedSetEntityHint, FallbackKey],
+        member: Union[str, bytes],
+        increment: float,
+        fallback_ttl: Optional[int] = None,
+    ) -> float:
+        key = self.fallback_key(query)
+        members = await self.get_fallback_members(key)
+        member = member.encode() if isinstance(member, str) else member
+        score = members[member] = members.get(member, 0) + increment
+        await self.put_fallback_members(
+            key, members, fallback_ttl=fallback_ttl
+        )
+        return score
+
+    async def remove_member_fallback(
+        self,
+        query: SortedSetQuery[SortedSetEntityHint, FallbackKey],
+        member: Union[str, bytes],
+    ) -> None:
+        key = self.fallback_key(query)
+        members = await self.get_fallback_members(key)
+
+        if (
+            members.pop(
+                member.encode() if isinstance(member, str) else member, None
+            )
+            is not None
+        ):
+            await self.put_fallback_members(key, members)
+
+    async def get_fallback_members(
+        self, key: FallbackKey
+    ) -> Dict[bytes, float]:
+        data: Optional[FallbackSortedSetData]
+        data = await self.fallback_data_source.get(key)  # type: ignore
+
+        if data is None:
+            return {}
+
+        return dict(FallbackSortedSetView(data['data']))
+
+    async def put_fallback_members(
+        self, key: FallbackKey, members: Dict[bytes, float], **kwargs: Any
+    ) -> None:
+        await self.fallback_data_source.put(
+            key,
+            {
+                'data': list(
+                    itertools.chain(
+                        *sorted(members.items(), key=lambda v: (v[1], v[0]))
+                    )
+                ),
+                'sorted': True,
+            },
+            **kwargs,
+        )
+
     def make_query(
         self, *args: Any, **kwargs: Any
-    ) -> SortedSetQuery[SortedSetEntityHint, FallbackKey]:
-        return SortedSetQuery(self, *args, **kwargs)
+    ) -> BaseQuery[SortedSetEntityHint, SortedSetData, FallbackKey]:
+        return query_factory(self, *args, **kwargs)
+
+    async def get_memory_many(  # type: ignore
+        self, query: SortedSetQueryMany[SortedSetEntityHint, FallbackKey],
+    ) -> AsyncGenerator[SortedSetEntityHint, None]:
+        memory_keys = [self.memory_key(query_i) for query_i in query.queries]
+        memory_data = await asyncio.gather(
+            *[
+                self.get_memory_data_timeout(memory_key, query_i)
+                for memory_key, query_i in zip(memory_keys, query.queries)
+            ]
+        )
+        missing = [i for i, data in enumerate(memory_data) if not data]
+
+        if missing:
+            fallback_data = await asyncio.gather(
+                *[
+                    self.get_memory_data_from_fallback(
+                        memory_keys[i], query.queries[i]
+                    )
+                    for i in missing
+                ]
+            )
+
+            for i, data in zip(missing, fallback_data):
+                memory_data[i] = data
+
+        for data, query_i in zip(memory_data, query.queries):
+            if data:
+                yield self.make_entity(data, query_i)
+
+    async def get_memory_data_from_fallback(
+        self,
+        memory_key: str,
+        query: SortedSetQuery[SortedSetEntityHint, FallbackKey],
+    ) -> Optional[SortedSetData]:
+        if await self.already_got_not_found(query):
+            return None
+
+        try:
+            fallback_data = await self.get_fallback_data_timeout(
+                query, for_memory=True
+            )
+        except asyncio.TimeoutError:
+            return None
+
+        if fallback_data is None:
+            await self.set_fallback_not_found(query)
+            return None
+
+        memory_data = await self.add_memory_data_from_fallback(
+            memory_key, query, fallback_data  # type: ignore
+        )
+        await self.set_expire_time(memory_key)
+        return memory_data
+
+    async def get_fallback_many(  # type: ignore
+        self, query: SortedSetQueryMany[SortedSetEntityHint, FallbackKey],
+    ) -> AsyncGenerator[SortedSetEntityHint, None]:
+        fallback_data = await asyncio.gather(
+            *[
+                self.get_fallback_data_timeout(query_i)
+                for query_i in query.queries
+            ],
+            return_exceptions=True,
+        )
+
+        for data, query_i in zip(fallback_data, query.queries):
+            if isinstance(data, asyncio.TimeoutError):
+                continue
+
+            if isinstance(data, BaseException):
+                raise data
+
+            if data is not None:
+                yield self.make_entity_from_fallback(data, query_i)
 
     def make_memory_data_from_entity(self, entity: Any) -> SortedSetData:
         if isinstance(entity, dict):
@@ -239,6 +604,56 @@ class SortedSetRepository(
         return data
 
 
+class FallbackSortedSetView(Sequence[Tuple[bytes, float]]):
+    """Sequence of (member, score) pairs over the flat fallback data."""
+
+    def __init__(self, data: Sequence[Union[str, bytes, float]]):
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.data) // 2
+
+    @overload
+    def __getitem__(self, index: int) -> Tuple[bytes, float]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Tuple[bytes, float]]:
+        ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Tuple[bytes, float], List[Tuple[bytes, float]]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        member = self.data[index * 2]
+
+        return (
+            member.encode() if isinstance(member, str) else member,  # type: ignore
+            self.data[index * 2 + 1],
+        )
+
+
+class SortedSetScores(Sequence[float]):
+    """Scores view of (member, score) pairs to be used with bisect."""
+
+    def __init__(self, data: Sequence[Tuple[bytes, float]]):
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.data[index][1]
+
+
 def task_done_callback(f: Any) -> None:
     try:
         f.result()
@@ -251,3 +666,20 @@ def make_task(coroutine: Any) -> Any:
         return asyncio.create_task(coroutine)
 
     return coroutine
+
+
+def encode_cursor(score: float, offset: int) -> str:
+    return urlsafe_b64encode(f'{score!r}:{offset}'.encode()).decode()
+
+
+def decode_cursor(query: SortedSetQuery[Any, Any]) -> Tuple[float, int]:
+    try:
+        score, offset = (
+            urlsafe_b64decode(query.cursor.encode())  # type: ignore
+            .decode()
+            .split(':')
+        )
+        return float(score), int(offset)
+
+    except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+        raise InvalidQueryError(query) from error
@@ -0,0 +1,80 @@
+import os
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from dbdaora import MongoDataSource, MongodbMembersSortedSetRepository
+
+
+@pytest.fixture
+def fallback_data_source(event_loop):
+    auth = os.environ.get('MONGO_AUTH', 'mongo:mongo')
+    client = AsyncIOMotorClient(
+        f'mongodb://{auth}@localhost:27017', io_loop=event_loop
+    )
+    MongoDataSource.collections_indexes.clear()
+    return MongoDataSource(database_name='dbdaora', client=client)
+
+
+@pytest.fixture
+def fake_repository_cls(fake_entity_cls):
+    class FakeRepository(MongodbMembersSortedSetRepository):
+        name = 'fake_members'
+        entity_cls = fake_entity_cls
+
+    return FakeRepository
+
+
+@pytest.fixture
+async def fake_entity(repository, fake_entity_cls):
+    fake_entity = fake_entity_cls(
+        id='fake', data=[(f'v{i}', i) for i in range(5)]
+    )
+    await repository.add(fake_entity, memory=False)
+    yield fake_entity
+    await repository.delete(repository.query('fake', memory=False))
+
+
+@pytest.mark.asyncio
+async def test_should_create_members_indexes(repository, fake_entity):
+    collection = repository.fallback_data_source.client.dbdaora.fake_members
+    indexes = [list(i['key']) async for i in collection.list_indexes()]
+
+    assert ['key', 'score', 'member'] in indexes
+    assert ['key', 'member'] in indexes
+
+
+@pytest.mark.asyncio
+async def test_should_get_page(repository, fake_entity):
+    entity = await repository.query(
+        'fake', memory=False, page=2, page_size=2, withmaxsize=True
+    ).entity
+
+    assert entity.data == [b'v2', b'v3']
+    assert entity.max_size == 5
+
+
+@pytest.mark.asyncio
+async def test_should_get_score_range_reversed(repository, fake_entity):
+    entity = await repository.query(
+        'fake',
+        memory=False,
+        min_score=1,
+        max_score=3,
+        reverse=True,
+        withscores=True,
+    ).entity
+
+    assert entity.data == [(b'v3', 3), (b'v2', 2), (b'v1', 1)]
+
+
+@pytest.mark.asyncio
+async def test_should_replace_members_on_add(
+    repository, fake_entity, fake_entity_cls
+):
+    await repository.add(
+        fake_entity_cls(id='fake', data=[('v9', 9)]), memory=False
+    )
+    entity = await repository.query('fake', memory=False).entity
+
+    assert entity.data == [b'v9']
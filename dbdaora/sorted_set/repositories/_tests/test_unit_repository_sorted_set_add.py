@@ -15,3 +15,33 @@ async def test_should_add_memory(
     assert repository.memory_data_source.zadd.call_args_list == [
         mocker.call('fake:fake', 1, b'2', 0, b'1')
     ]
+
+
+@pytest.mark.asyncio
+async def test_should_add_fallback_sorted_by_score(
+    repository, fake_entity_cls
+):
+    await repository.add(
+        fake_entity_cls(id='fake', data=[(b'2', 1), (b'3', 2), (b'1', 0)]),
+        memory=False,
+    )
+
+    assert repository.fallback_data_source.db['fake:fake'] == {
+        'data': [b'1', 0, b'2', 1, b'3', 2],
+        'sorted': True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_should_add_fallback_ties_sorted_by_member(
+    repository, fake_entity_cls
+):
+    await repository.add(
+        fake_entity_cls(id='fake', data=[(b'b', 1), (b'a', 1), (b'c', 1)]),
+        memory=False,
+    )
+
+    assert repository.fallback_data_source.db['fake:fake'] == {
+        'data': [b'a', 1, b'b', 1, b'c', 1],
+        'sorted': True,
+    }
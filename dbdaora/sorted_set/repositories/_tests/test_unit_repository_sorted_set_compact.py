@@ -0,0 +1,68 @@
+import pickle
+
+import pytest
+
+from dbdaora import CompactSortedSetData, SortedSetRepository
+
+
+@pytest.fixture
+def fake_repository_cls(fake_entity_cls):
+    class FakeRepository(SortedSetRepository[fake_entity_cls, str]):
+        compact_data = True
+
+    return FakeRepository
+
+
+@pytest.fixture
+def compact_data():
+    return CompactSortedSetData.from_data(
+        [(b'a', 0), ('bb', 1.5), (b'', 2), (b'dddd', 3)]
+    )
+
+
+def test_should_get_items(compact_data):
+    assert len(compact_data) == 4
+    assert compact_data[1] == (b'bb', 1.5)
+    assert compact_data[-1] == (b'dddd', 3)
+    assert compact_data[2] == (b'', 2)
+    assert list(compact_data) == [
+        (b'a', 0),
+        (b'bb', 1.5),
+        (b'', 2),
+        (b'dddd', 3),
+    ]
+
+
+def test_should_raise_index_error(compact_data):
+    with pytest.raises(IndexError):
+        compact_data[4]
+
+
+def test_should_get_slices(compact_data):
+    assert compact_data[1:3] == [(b'bb', 1.5), (b'', 2)]
+    assert compact_data[1:3][1:] == [(b'', 2)]
+    assert compact_data[::-2] == [(b'dddd', 3), (b'bb', 1.5)]
+    assert compact_data[3:1] == []
+    assert compact_data.members[1:] == [b'bb', b'', b'dddd']
+
+
+def test_should_get_members_without_scores():
+    compact_data = CompactSortedSetData.from_data([b'1', '22'])
+
+    assert compact_data == [b'1', b'22']
+    assert compact_data.scores is None
+    assert compact_data.nbytes == 3 + 3 * compact_data.offsets.itemsize
+
+
+def test_should_pickle(compact_data):
+    assert pickle.loads(pickle.dumps(compact_data)) == compact_data
+
+
+@pytest.mark.asyncio
+async def test_should_make_compact_entity(repository, fake_entity_cls):
+    await repository.memory_data_source.zadd('fake:fake', 0, '1', 1, '2')
+
+    entity = await repository.query('fake').entity
+
+    assert isinstance(entity.data, CompactSortedSetData)
+    assert entity == fake_entity_cls(id='fake', data=[b'1', b'2'])
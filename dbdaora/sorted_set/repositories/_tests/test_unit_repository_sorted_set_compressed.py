@@ -0,0 +1,67 @@
+import pytest
+
+from dbdaora import Compression, DictFallbackDataSource, SortedSetRepository
+
+
+@pytest.fixture
+def fallback_data_source():
+    return DictFallbackDataSource()
+
+
+@pytest.fixture
+def fake_repository_cls(fake_entity_cls):
+    class FakeRepository(SortedSetRepository[fake_entity_cls, str]):
+        memory_compression = Compression(min_size=32)
+
+    return FakeRepository
+
+
+@pytest.fixture
+def large_member():
+    return b'large member ' * 10
+
+
+@pytest.fixture
+def fake_entity_large(fake_entity_cls, large_member):
+    return fake_entity_cls(id='fake', data=[(b'1', 0), (large_member, 1)])
+
+
+@pytest.mark.asyncio
+async def test_should_compress_large_members(
+    repository, fake_entity_large, large_member
+):
+    await repository.add(fake_entity_large, memory_always=True)
+
+    members = [
+        member for member, _ in repository.memory_data_source.db['fake:fake']
+    ]
+
+    assert members[0] == b'1'
+    assert members[1][0] == 0xF9
+    assert len(members[1]) < len(large_member)
+
+
+@pytest.mark.asyncio
+async def test_should_get_large_members(
+    repository, fake_entity_large, fake_entity_cls, large_member
+):
+    await repository.add(fake_entity_large, memory_always=True)
+
+    entity = await repository.query('fake').entity
+
+    assert entity == fake_entity_cls(id='fake', data=[b'1', large_member])
+
+
+@pytest.mark.asyncio
+async def test_should_update_large_members(
+    repository, fake_entity_large, large_member
+):
+    await repository.add(fake_entity_large, memory_always=True)
+    query = repository.query('fake')
+
+    score = await repository.increment_member(query, large_member, 2)
+    await repository.remove_member(query, b'1')
+
+    assert score == 3
+    assert (await repository.query('fake').entity).data == [large_member]
+    assert repository.memory_data_source.db['fake:fake'][0][1] == 3
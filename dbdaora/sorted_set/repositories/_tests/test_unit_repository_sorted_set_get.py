@@ -88,3 +88,113 @@ async def test_should_set_memory_after_got_fallback(
         mocker.call('fake:fake', 1, b'2', 0, b'1')
     ]
     assert entity == fake_entity
+
+
+@pytest.fixture
+def sorted_fallback_data(repository):
+    repository.fallback_data_source.db['fake:fake'] = {
+        'data': [b'0', 0, b'1', 1, b'2', 2, b'3', 3, b'4', 4],
+        'sorted': True,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'filters,expected',
+    [
+        ({'page': 2, 'page_size': 2}, [b'2', b'3']),
+        ({'page': 3, 'page_size': 2}, [b'4']),
+        ({'page': 4, 'page_size': 2}, None),
+        ({'page': 2, 'page_size': 2, 'reverse': True}, [b'2', b'1']),
+        ({'page': 3, 'page_size': 2, 'reverse': True}, [b'0']),
+        ({'reverse': True}, [b'4', b'3', b'2', b'1', b'0']),
+        ({'min_score': 1, 'max_score': 3}, [b'1', b'2', b'3']),
+        ({'min_score': 1.5, 'reverse': True}, [b'4', b'3', b'2']),
+        ({'max_score': 0}, [b'0']),
+        ({'min_score': 5}, None),
+        ({'min_score': 1, 'page_size': 2}, [b'1', b'2']),
+        ({'min_score': 1, 'page': 2, 'page_size': 2}, [b'3', b'4']),
+        ({'min_score': 1, 'page': 3, 'page_size': 2}, None),
+        (
+            {'max_score': 3, 'page_size': 3, 'reverse': True},
+            [b'3', b'2', b'1'],
+        ),
+        (
+            {'max_score': 3, 'page': 2, 'page_size': 3, 'reverse': True},
+            [b'0'],
+        ),
+    ],
+)
+async def test_should_get_slice_from_sorted_fallback(
+    repository, sorted_fallback_data, filters, expected
+):
+    data = await repository.get_fallback_data(
+        SortedSetQuery(repository, memory=False, id='fake', **filters)
+    )
+
+    assert (data and data[0]) == expected
+
+
+@pytest.mark.asyncio
+async def test_should_sort_unsorted_fallback_data(repository):
+    repository.fallback_data_source.db['fake:fake'] = {
+        'data': ['2', 2, '0', 0, '1', 1]
+    }
+
+    data = await repository.get_fallback_data(
+        SortedSetQuery(
+            repository,
+            memory=False,
+            id='fake',
+            withscores=True,
+            withmaxsize=True,
+            page_size=2,
+        )
+    )
+
+    assert data == ([(b'0', 0), (b'1', 1)], 3)
+
+
+@pytest.mark.asyncio
+async def test_should_sort_unsorted_fallback_data_ties_by_member(repository):
+    repository.fallback_data_source.db['fake:fake'] = {
+        'data': ['b', 1, 'a', 1, 'c', 1]
+    }
+
+    data = await repository.get_fallback_data(
+        SortedSetQuery(
+            repository, memory=False, id='fake', withscores=True, page_size=2,
+        )
+    )
+
+    assert data == ([(b'a', 1), (b'b', 1)], None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'method,kwargs,expected',
+    [
+        ('zrangebyscore', {'min': 1, 'max': 3}, [b'1', b'2', b'3']),
+        ('zrangebyscore', {'min': 1, 'offset': 1, 'count': 2}, [b'2', b'3']),
+        ('zrangebyscore', {'offset': 4, 'count': -1}, [b'4']),
+        ('zrevrangebyscore', {'max': 3, 'offset': 1, 'count': 1}, [b'2']),
+        (
+            'zrevrangebyscore',
+            {'min': 3, 'withscores': True},
+            [(b'4', 4), (b'3', 3)],
+        ),
+        ('zrangebyscore', {'min': 5}, []),
+    ],
+)
+async def test_should_get_range_by_score_from_dict_memory(
+    repository, method, kwargs, expected
+):
+    await repository.memory_data_source.zadd(
+        'fake:fake', 0, b'0', 1, b'1', 2, b'2', 3, b'3', 4, b'4'
+    )
+
+    data = await getattr(repository.memory_data_source, method)(
+        'fake:fake', **kwargs
+    )
+
+    assert data == expected
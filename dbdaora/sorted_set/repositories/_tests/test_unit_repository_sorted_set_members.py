@@ -0,0 +1,321 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import asynctest
+import pytest
+
+from dbdaora import (
+    DictMemoryDataSource,
+    MongoDataSource,
+    MongodbMembersSortedSetRepository,
+    SortedSetData,
+    WriteBehindQueue,
+)
+from dbdaora.exceptions import WriteBehindNotSupportedError
+from dbdaora.sorted_set.repositories import encode_cursor
+
+
+@dataclass
+class FakeEntity:
+    id: str
+    data: SortedSetData
+    max_size: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+@pytest.fixture
+def fake_entity_cls():
+    return FakeEntity
+
+
+@pytest.fixture
+def fallback_data_source(mocker):
+    fallback_data_source = MongoDataSource(
+        database_name='dbdaora', client=mocker.MagicMock()
+    )
+    fallback_data_source.query = asynctest.CoroutineMock(
+        return_value=[
+            {'member': 'v2', 'score': 2},
+            {'member': 'v3', 'score': 3},
+        ]
+    )
+    fallback_data_source.count = asynctest.CoroutineMock(return_value=10)
+    fallback_data_source.ensure_index = asynctest.CoroutineMock()
+    fallback_data_source.delete_many = asynctest.CoroutineMock()
+    fallback_data_source.upsert_many = asynctest.CoroutineMock()
+    fallback_data_source.update_one = asynctest.CoroutineMock(
+        return_value={'member': 'v1', 'score': 3}
+    )
+    return fallback_data_source
+
+
+@pytest.fixture
+def fake_repository_cls(fake_entity_cls):
+    class FakeRepository(MongodbMembersSortedSetRepository):
+        entity_cls = fake_entity_cls
+
+    return FakeRepository
+
+
+@pytest.fixture
+def document_id(repository):
+    return repository.fallback_data_source.make_document_id('fake')
+
+
+@pytest.mark.asyncio
+async def test_should_push_page_down_to_fallback(
+    repository, document_id, mocker
+):
+    entity = await repository.query(
+        'fake', memory=False, page=2, page_size=2, withmaxsize=True
+    ).entity
+
+    assert entity.data == [b'v2', b'v3']
+    assert entity.max_size == 10
+    assert repository.fallback_data_source.query.call_args_list == [
+        mocker.call(
+            mocker.ANY,
+            filter={'key': document_id},
+            projection={'_id': False, 'member': True, 'score': True},
+            sort=[('score', 1), ('member', 1)],
+            skip=2,
+            limit=2,
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_push_score_range_down_to_fallback(
+    repository, document_id, mocker
+):
+    entity = await repository.query(
+        'fake', memory=False, min_score=2, reverse=True, withscores=True
+    ).entity
+
+    assert entity.data == [(b'v2', 2), (b'v3', 3)]
+    assert entity.max_size is None
+    assert repository.fallback_data_source.query.call_args_list == [
+        mocker.call(
+            mocker.ANY,
+            filter={
+                'key': document_id,
+                'score': {'$gte': 2, '$lte': float('inf')},
+            },
+            projection={'_id': False, 'member': True, 'score': True},
+            sort=[('score', -1), ('member', -1)],
+            skip=0,
+            limit=0,
+        )
+    ]
+    assert not repository.fallback_data_source.count.called
+
+
+@pytest.mark.asyncio
+async def test_should_load_all_members_to_memory(repository, mocker):
+    entity = await repository.query('fake', page=1, page_size=1).entity
+
+    assert entity.data == [b'v2']
+    assert (
+        repository.fallback_data_source.query.call_args_list[0][1]['limit']
+        == 0
+    )
+    assert await repository.memory_data_source.zrange('fake:fake') == [
+        b'v2',
+        b'v3',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_add_one_document_per_member(
+    repository, fake_entity_cls, document_id, mocker
+):
+    calls = []
+
+    def record(name):
+        return lambda *args, **kwargs: calls.append(name)
+
+    fallback_data_source = repository.fallback_data_source
+    fallback_data_source.upsert_many.side_effect = record('upsert_many')
+    fallback_data_source.delete_many.side_effect = record('delete_many')
+    await repository.add(
+        fake_entity_cls(id='fake', data=[('v1', 1), ('v2', 2), (b'v1', 3)]),
+        memory=False,
+        fallback_ttl=60,
+    )
+
+    assert repository.fallback_data_source.upsert_many.call_args_list == [
+        mocker.call(
+            mocker.ANY,
+            [
+                {'key': document_id, 'member': 'v1', 'score': 3},
+                {'key': document_id, 'member': 'v2', 'score': 2},
+            ],
+            ('key', 'member'),
+            fallback_ttl=60,
+        )
+    ]
+    assert repository.fallback_data_source.delete_many.call_args_list == [
+        mocker.call(
+            mocker.ANY, {'key': document_id, 'member': {'$nin': ['v1', 'v2']}},
+        )
+    ]
+    assert calls == ['upsert_many', 'delete_many']
+
+
+@pytest.mark.asyncio
+async def test_should_set_member_score_on_fallback(
+    repository, document_id, mocker
+):
+    await repository.add_member(
+        repository.query('fake', memory=False), b'v1', 2
+    )
+
+    assert repository.fallback_data_source.update_one.call_args_list == [
+        mocker.call(
+            mocker.ANY,
+            {'key': document_id, 'member': 'v1'},
+            {'$set': {'score': 2}},
+            upsert=True,
+            fallback_ttl=None,
+        )
+    ]
+    assert repository.fallback_data_source.ensure_index.call_args_list == [
+        mocker.call(mocker.ANY, repository.fallback_index),
+        mocker.call(mocker.ANY, repository.fallback_unique_index, unique=True),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_increment_member_score_on_fallback(
+    repository, document_id, mocker
+):
+    score = await repository.increment_member(
+        repository.query('fake', memory=False), 'v1', 1
+    )
+
+    assert score == 3
+    assert repository.fallback_data_source.update_one.call_args_list == [
+        mocker.call(
+            mocker.ANY,
+            {'key': document_id, 'member': 'v1'},
+            {'$inc': {'score': 1}},
+            upsert=True,
+            fallback_ttl=None,
+        )
+    ]
+    assert repository.fallback_data_source.ensure_index.call_args_list == [
+        mocker.call(mocker.ANY, repository.fallback_index),
+        mocker.call(mocker.ANY, repository.fallback_unique_index, unique=True),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_set_member_fallback_ttl(repository, document_id, mocker):
+    await repository.increment_member(
+        repository.query('fake', memory=False), 'v1', 1, fallback_ttl=60
+    )
+
+    assert repository.fallback_data_source.update_one.call_args_list == [
+        mocker.call(
+            mocker.ANY,
+            {'key': document_id, 'member': 'v1'},
+            {'$inc': {'score': 1}},
+            upsert=True,
+            fallback_ttl=60,
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_remove_member_from_fallback(
+    repository, document_id, mocker
+):
+    await repository.remove_member(
+        repository.query('fake', memory=False), 'v1'
+    )
+
+    assert repository.fallback_data_source.delete_many.call_args_list == [
+        mocker.call(mocker.ANY, {'key': document_id, 'member': 'v1'})
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_push_cursor_down_to_fallback(
+    repository, document_id, mocker
+):
+    entity = await repository.query(
+        'fake', memory=False, page_size=2, cursor=encode_cursor(2, 1)
+    ).entity
+
+    assert entity.data == [b'v2', b'v3']
+    assert entity.next_cursor == encode_cursor(3, 1)
+    assert repository.fallback_data_source.query.call_args_list == [
+        mocker.call(
+            mocker.ANY,
+            filter={
+                'key': document_id,
+                'score': {'$gte': 2, '$lte': float('inf')},
+            },
+            projection={'_id': False, 'member': True, 'score': True},
+            sort=[('score', 1), ('member', 1)],
+            skip=1,
+            limit=2,
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_push_score_range_page_down_to_fallback(
+    repository, document_id, mocker
+):
+    await repository.query(
+        'fake', memory=False, max_score=3, page=2, page_size=2
+    ).entity
+
+    assert repository.fallback_data_source.query.call_args_list == [
+        mocker.call(
+            mocker.ANY,
+            filter={
+                'key': document_id,
+                'score': {'$gte': float('-inf'), '$lte': 3},
+            },
+            projection={'_id': False, 'member': True, 'score': True},
+            sort=[('score', 1), ('member', 1)],
+            skip=2,
+            limit=2,
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_set_last_modified_on_update_with_fallback_ttl(mocker):
+    data_source = MongoDataSource(
+        database_name='dbdaora', client=mocker.MagicMock()
+    )
+    key = data_source.make_key('fake', 'fake')
+    collection = data_source.collection(key)
+    collection.find_one_and_update = asynctest.CoroutineMock()
+    data_source.ensure_ttl_index = asynctest.CoroutineMock()
+
+    await data_source.update_one(
+        key, {'key': 'fake'}, {'$inc': {'score': 1}}, fallback_ttl=60
+    )
+
+    update = collection.find_one_and_update.call_args[0][1]
+    assert update['$inc'] == {'score': 1}
+    assert list(update['$set']) == ['last_modified']
+    assert data_source.ensure_ttl_index.call_args_list == [
+        mocker.call(key, 60)
+    ]
+
+
+def test_should_raise_write_behind_not_supported_error(
+    fake_repository_cls, fallback_data_source
+):
+    with pytest.raises(WriteBehindNotSupportedError):
+        fake_repository_cls(
+            memory_data_source=DictMemoryDataSource(),
+            fallback_data_source=fallback_data_source,
+            expire_time=1,
+            write_behind=WriteBehindQueue(),
+        )
@@ -0,0 +1,124 @@
+import pytest
+
+from dbdaora import DictFallbackDataSource, SortedSetRepository
+
+
+@pytest.fixture
+def fallback_data_source():
+    return DictFallbackDataSource()
+
+
+@pytest.fixture
+def fake_repository_cls(fake_entity_cls):
+    class FakeRepository(SortedSetRepository[fake_entity_cls, str]):
+        ...
+
+    return FakeRepository
+
+
+@pytest.fixture
+async def cached_repository(repository, fake_entity_withscores):
+    await repository.add(fake_entity_withscores)
+    await repository.memory_data_source.zadd('fake:fake', 0, b'1', 1, b'2')
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_should_add_member(cached_repository):
+    await cached_repository.add_member(
+        cached_repository.query('fake'), '3', 0.5
+    )
+
+    assert cached_repository.memory_data_source.db['fake:fake'] == [
+        (b'1', 0),
+        (b'3', 0.5),
+        (b'2', 1),
+    ]
+    assert cached_repository.fallback_data_source.db['fake:fake'] == {
+        'data': [b'1', 0, b'3', 0.5, b'2', 1],
+        'sorted': True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_should_increment_member(cached_repository):
+    score = await cached_repository.increment_member(
+        cached_repository.query('fake'), b'1', 2
+    )
+
+    assert score == 2
+    assert cached_repository.memory_data_source.db['fake:fake'] == [
+        (b'2', 1),
+        (b'1', 2),
+    ]
+    assert cached_repository.fallback_data_source.db['fake:fake'] == {
+        'data': [b'2', 1, b'1', 2],
+        'sorted': True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_should_remove_member(cached_repository):
+    await cached_repository.remove_member(cached_repository.query('fake'), '1')
+
+    assert cached_repository.memory_data_source.db['fake:fake'] == [(b'2', 1)]
+    assert cached_repository.fallback_data_source.db['fake:fake'] == {
+        'data': [b'2', 1],
+        'sorted': True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_should_update_only_fallback_when_memory_is_not_cached(
+    repository, fake_entity_withscores
+):
+    await repository.add(fake_entity_withscores)
+    await repository.memory_data_source.delete('fake:fake')
+
+    score = await repository.increment_member(repository.query('fake'), '3', 4)
+
+    assert score == 4
+    assert not await repository.memory_data_source.exists('fake:fake')
+    assert repository.fallback_data_source.db['fake:fake'] == {
+        'data': [b'1', 0, b'2', 1, b'3', 4],
+        'sorted': True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_should_update_legacy_fallback_data(repository):
+    repository.fallback_data_source.db['fake:fake'] = {
+        'data': ['2', 1, '1', 0]
+    }
+
+    await repository.add_member(repository.query('fake', memory=False), '3', 2)
+
+    assert repository.fallback_data_source.db['fake:fake'] == {
+        'data': [b'1', 0, b'2', 1, b'3', 2],
+        'sorted': True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_should_delete_memory_key_when_last_member_is_removed(
+    repository,
+):
+    await repository.memory_data_source.zadd('fake:fake', 1, b'1')
+
+    assert await repository.memory_data_source.zrem('fake:fake', b'1') == 1
+    assert not await repository.memory_data_source.exists('fake:fake')
+
+
+@pytest.mark.asyncio
+async def test_should_merge_members_on_zadd(repository):
+    await repository.memory_data_source.zadd('fake:fake', 1, b'1', 2, b'2')
+    await repository.memory_data_source.zadd('fake:fake', 3, b'1')
+
+    assert (
+        await repository.memory_data_source.zincrby('fake:fake', 1, b'3') == 1
+    )
+    assert repository.memory_data_source.db['fake:fake'] == [
+        (b'3', 1),
+        (b'2', 2),
+        (b'1', 3),
+    ]
@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from google.cloud.datastore import Key
 
 from dbdaora.repository.datastore import DatastoreRepository
@@ -11,3 +13,10 @@ class DatastoreSortedSetRepository(
     SortedSetRepository[SortedSetEntityHint, Key],
 ):
     __skip_cls_validation__ = ('DatastoreSortedSetRepository',)
+
+    async def put_fallback_members(
+        self, key: Key, members: Dict[bytes, float], **kwargs: Any
+    ) -> None:
+        await super().put_fallback_members(
+            key, members, exclude_from_indexes=self.exclude_from_indexes
+        )
@@ -1,6 +1,12 @@
-from dbdaora.data_sources.fallback.mongodb import Key
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
-from ..entity import SortedSetEntityHint
+from pymongo import ASCENDING, DESCENDING
+
+from dbdaora.data_sources.fallback.mongodb import Key, MongoDataSource
+from dbdaora.query import Query
+
+from ..entity import SortedSetData, SortedSetEntityHint
+from ..query import SortedSetQuery
 from . import SortedSetRepository
 
 
@@ -9,3 +15,217 @@ class MongodbSortedSetRepository(
 ):
     __skip_cls_validation__ = ('MongodbSortedSetRepository',)
     fallback_data_source_key_cls = Key
+
+
+class MongodbMembersSortedSetRepository(
+    MongodbSortedSetRepository[SortedSetEntityHint]
+):
+    """Stores one fallback document per sorted set member.
+
+    Documents are indexed by key, score and member, so page and score
+    range queries are resolved by mongodb instead of loading the whole
+    sorted set. ``add_fallback`` upserts the members before deleting the
+    old ones, so readers never see an empty set. The members are written
+    without ``put``, so the write behind queue isn't supported.
+    """
+
+    __skip_cls_validation__ = ('MongodbMembersSortedSetRepository',)
+    fallback_write_behind = False
+    fallback_data_source: MongoDataSource
+    fallback_index: ClassVar[List[Tuple[str, int]]] = [
+        ('key', ASCENDING),
+        ('score', ASCENDING),
+        ('member', ASCENDING),
+    ]
+    fallback_unique_index: ClassVar[List[Tuple[str, int]]] = [
+        ('key', ASCENDING),
+        ('member', ASCENDING),
+    ]
+
+    async def get_fallback_data(  # type: ignore
+        self,
+        query: Union[
+            SortedSetQuery[SortedSetEntityHint, Key], SortedSetEntityHint,
+        ],
+        for_memory: bool = False,
+    ) -> Optional[SortedSetData]:
+        key = self.fallback_key(query)
+
+        if for_memory or not isinstance(query, SortedSetQuery):
+            data_withscores = await self.query_fallback_members(
+                key, {'key': key.document_id}
+            )
+
+            if not data_withscores:
+                return None
+
+            if for_memory:
+                return data_withscores
+
+            return self.parse_data_from_fallback(data_withscores, query)
+
+        filter: Dict[str, Any] = {'key': key.document_id}
+        skip = 0
+        limit = 0
+
+        if query.withcursor:
+            max_score, min_score, skip = self.parse_cursor(query)
+            limit = query.page_size  # type: ignore
+            filter['score'] = {'$gte': min_score, '$lte': max_score}
+
+        elif query.max_score is not None or query.min_score is not None:
+            max_score, min_score = self.parse_score_limits(query)
+            filter['score'] = {'$gte': min_score, '$lte': max_score}
+            offset, count = self.parse_score_page(query)
+
+            if offset is not None and count is not None:
+                skip, limit = offset, count
+
+        else:
+            start, stop = self.parse_page(query)
+
+            if stop != -1:
+                skip, limit = start, stop - start + 1
+
+        data_withscores = await self.query_fallback_members(
+            key, filter, reverse=query.reverse, skip=skip, limit=limit,
+        )
+
+        if not data_withscores:
+            return None
+
+        maxsize = (
+            await self.fallback_data_source.count(
+                key, {'key': key.document_id}
+            )
+            if query.withmaxsize
+            else None
+        )
+
+        if query.withcursor:
+            return self.make_cursor_page(  # type: ignore
+                data_withscores, query, maxsize
+            )
+
+        if query.withscores:
+            return (data_withscores, maxsize)  # type: ignore
+
+        return (  # type: ignore
+            [member for member, score in data_withscores],
+            maxsize,
+        )
+
+    async def query_fallback_members(
+        self,
+        key: Key,
+        filter: Dict[str, Any],
+        reverse: bool = False,
+        skip: int = 0,
+        limit: int = 0,
+    ) -> List[Tuple[bytes, float]]:
+        direction = DESCENDING if reverse else ASCENDING
+        documents = await self.fallback_data_source.query(
+            key,
+            filter=filter,
+            projection={'_id': False, 'member': True, 'score': True},
+            sort=[('score', direction), ('member', direction)],
+            skip=skip,
+            limit=limit,
+        )
+
+        return [
+            (
+                document['member'].encode()
+                if isinstance(document['member'], str)
+                else document['member'],
+                document['score'],
+            )
+            for document in documents
+        ]
+
+    async def add_fallback(
+        self, entity: Any, *entities: Any, **kwargs: Any
+    ) -> None:
+        key = self.fallback_key(entity)
+        data = entity['data'] if isinstance(entity, dict) else entity.data
+        members = {member_value(member): score for member, score in data}
+        await self.ensure_fallback_indexes(key)
+        await self.fallback_data_source.upsert_many(
+            key,
+            [
+                {'key': key.document_id, 'member': member, 'score': score}
+                for member, score in members.items()
+            ],
+            ('key', 'member'),
+            **kwargs,
+        )
+        await self.fallback_data_source.delete_many(
+            key, {'key': key.document_id, 'member': {'$nin': list(members)}}
+        )
+
+    async def ensure_fallback_indexes(self, key: Key) -> None:
+        await self.fallback_data_source.ensure_index(key, self.fallback_index)
+        await self.fallback_data_source.ensure_index(
+            key, self.fallback_unique_index, unique=True
+        )
+
+    async def delete(
+        self, query: Query[SortedSetEntityHint, SortedSetData, Key],
+    ) -> None:
+        if query.memory:
+            await self.memory_data_source.delete(self.memory_key(query))
+            await self.set_fallback_not_found(query)
+
+        key = self.fallback_key(query)
+        await self.fallback_data_source.delete_many(
+            key, {'key': key.document_id}
+        )
+
+    async def add_member_fallback(
+        self,
+        query: SortedSetQuery[SortedSetEntityHint, Key],
+        member: Union[str, bytes],
+        score: float,
+        fallback_ttl: Optional[int] = None,
+    ) -> None:
+        key = self.fallback_key(query)
+        await self.ensure_fallback_indexes(key)
+        await self.fallback_data_source.update_one(
+            key,
+            {'key': key.document_id, 'member': member_value(member)},
+            {'$set': {'score': score}},
+            upsert=True,
+            fallback_ttl=fallback_ttl,
+        )
+
+    async def increment_member_fallback(
+        self,
+        query: SortedSetQuery[SortedSetEntityHint, Key],
+        member: Union[str, bytes],
+        increment: float,
+        fallback_ttl: Optional[int] = None,
+    ) -> float:
+        key = self.fallback_key(query)
+        await self.ensure_fallback_indexes(key)
+        document = await self.fallback_data_source.update_one(
+            key,
+            {'key': key.document_id, 'member': member_value(member)},
+            {'$inc': {'score': increment}},
+            upsert=True,
+            fallback_ttl=fallback_ttl,
+        )
+        return document['score']  # type: ignore
+
+    async def remove_member_fallback(
+        self,
+        query: SortedSetQuery[SortedSetEntityHint, Key],
+        member: Union[str, bytes],
+    ) -> None:
+        key = self.fallback_key(query)
+        await self.fallback_data_source.delete_many(
+            key, {'key': key.document_id, 'member': member_value(member)}
+        )
+
+
+def member_value(member: Union[str, bytes]) -> str:
+    return member.decode() if isinstance(member, bytes) else member
@@ -1,36 +1,126 @@
-from typing import Any, AsyncGenerator, Optional, Sequence
+from logging import Logger, getLogger
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
 
 from cachetools import Cache
 
+from ...circuitbreaker import AsyncCircuitBreaker, DBDaoraCircuitBreakerError
 from ...keys import FallbackKey
+from ...repository import MemoryRepository
 from ...service import Service
 from ..entity import SortedSetData, SortedSetEntity
 
 
 class SortedSetService(Service[SortedSetEntity, SortedSetData, FallbackKey]):
-    def get_many(
-        self, *ids: str, **filters: Any
-    ) -> AsyncGenerator[SortedSetEntity, None]:
-        raise NotImplementedError()  # pragma: no cover
+    def __init__(
+        self,
+        repository: MemoryRepository[
+            SortedSetEntity, SortedSetData, FallbackKey
+        ],
+        circuit_breaker: AsyncCircuitBreaker,
+        fallback_circuit_breaker: AsyncCircuitBreaker,
+        cache: Optional[Cache] = None,
+        exists_cache: Optional[Cache] = None,
+        logger: Logger = getLogger(__name__),
+        has_add_circuit_breaker: bool = False,
+        has_delete_circuit_breaker: bool = False,
+    ):
+        super().__init__(
+            repository=repository,
+            circuit_breaker=circuit_breaker,
+            fallback_circuit_breaker=fallback_circuit_breaker,
+            cache=cache,
+            exists_cache=exists_cache,
+            logger=logger,
+            has_add_circuit_breaker=has_add_circuit_breaker,
+            has_delete_circuit_breaker=has_delete_circuit_breaker,
+        )
+        self.member_circuits: Dict[str, Callable[..., Awaitable[Any]]] = {}
+        self.member_fallback_circuits: Dict[
+            str, Callable[..., Awaitable[Any]]
+        ] = {}
+
+        for method_name in ('add_member', 'increment_member', 'remove_member'):
+            method = getattr(self.repository, method_name)
+
+            if has_add_circuit_breaker:
+                self.member_circuits[method_name] = self.circuit_breaker(
+                    method
+                )
+                self.member_fallback_circuits[
+                    method_name
+                ] = self.fallback_circuit_breaker(method)
+            else:
+                self.member_circuits[
+                    method_name
+                ] = self.member_fallback_circuits[method_name] = method
+
+    async def add_member(
+        self,
+        member: Union[str, bytes],
+        score: float,
+        id: Optional[str] = None,
+        fallback_ttl: Optional[int] = None,
+        **filters: Any,
+    ) -> None:
+        await self.update_member(
+            'add_member', id, filters, member, score, fallback_ttl=fallback_ttl
+        )
 
-    def get_many_cached(
+    async def increment_member(
         self,
-        ids: Sequence[str],
-        cache: Cache,
-        memory: bool = True,
+        member: Union[str, bytes],
+        increment: float,
+        id: Optional[str] = None,
+        fallback_ttl: Optional[int] = None,
         **filters: Any,
-    ) -> AsyncGenerator[SortedSetEntity, None]:
-        raise NotImplementedError()  # pragma: no cover
+    ) -> float:
+        return await self.update_member(  # type: ignore
+            'increment_member',
+            id,
+            filters,
+            member,
+            increment,
+            fallback_ttl=fallback_ttl,
+        )
 
-    async def delete(
-        self, entity_id: Optional[str] = None, **filters: Any
+    async def remove_member(
+        self,
+        member: Union[str, bytes],
+        id: Optional[str] = None,
+        **filters: Any,
     ) -> None:
-        raise NotImplementedError()  # pragma: no cover
+        await self.update_member('remove_member', id, filters, member)
+
+    async def update_member(
+        self,
+        method_name: str,
+        id: Optional[str],
+        filters: Any,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        if id is not None:
+            filters[self.repository.id_name] = id
+
+        try:
+            return await self.member_circuits[method_name](
+                self.repository.query(**filters), *args, **kwargs
+            )
+
+        except DBDaoraCircuitBreakerError as error:
+            self.logger.warning(error)
+            if self.should_raise_not_found_error_for_fallback_circuit_breaker(
+                error
+            ):
+                raise
 
-    async def exists(self, id: Optional[str] = None, **filters: Any) -> bool:
-        raise NotImplementedError()  # pragma: no cover
+            try:
+                return await self.member_fallback_circuits[method_name](
+                    self.repository.query(memory=False, **filters),
+                    *args,
+                    **kwargs,
+                )
 
-    async def exists_cached(
-        self, cache: Cache, memory: bool = True, **filters: Any,
-    ) -> bool:
-        raise NotImplementedError()  # pragma: no cover
+            except DBDaoraCircuitBreakerError as fallback_error:
+                self.logger.warning(fallback_error)
+                raise
@@ -0,0 +1,127 @@
+import pytest
+
+from dbdaora import CacheType
+
+
+@pytest.fixture(autouse=True)
+async def set_data(fake_service, fake_entity_cls):
+    for key in ('fake1', 'fake2', 'fake3'):
+        await fake_service.repository.memory_data_source.delete(f'fake:{key}')
+        await fake_service.repository.memory_data_source.delete(
+            f'fake:not-found:{key}'
+        )
+
+    await fake_service.repository.memory_data_source.zadd(
+        'fake:fake1', 0, b'1', 1, b'2', 2, b'3'
+    )
+    await fake_service.repository.add_fallback(
+        fake_entity_cls(fake_id='fake2', data=[(b'4', 0), (b'5', 1)])
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_get_many(fake_service, fake_entity_cls):
+    entities = [
+        entity
+        async for entity in fake_service.get_many(
+            'fake1', 'fake2', 'fake3', page_size=2, reverse=True
+        )
+    ]
+
+    assert entities == [
+        fake_entity_cls(fake_id='fake1', data=[b'3', b'2']),
+        fake_entity_cls(fake_id='fake2', data=[b'5', b'4']),
+    ]
+    assert await fake_service.repository.memory_data_source.exists(
+        'fake:fake2'
+    )
+    assert await fake_service.repository.memory_data_source.exists(
+        'fake:not-found:fake3'
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_get_many_from_fallback(fake_service, fake_entity_cls):
+    entities = [
+        entity
+        async for entity in fake_service.get_many(
+            'fake1', 'fake2', 'fake3', memory=False, min_score=1
+        )
+    ]
+
+    assert entities == [fake_entity_cls(fake_id='fake2', data=[b'5'])]
+
+
+@pytest.mark.asyncio
+async def test_should_get_many_with_scores_and_max_size(
+    fake_service, fake_entity_cls
+):
+    entities = [
+        entity
+        async for entity in fake_service.get_many(
+            'fake1', 'fake2', max_score=0, withscores=True, withmaxsize=True
+        )
+    ]
+
+    assert entities == [
+        fake_entity_cls(fake_id='fake1', data=[(b'1', 0)], max_size=3),
+        fake_entity_cls(fake_id='fake2', data=[(b'4', 0)], max_size=2),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_check_if_exists(fake_service):
+    assert await fake_service.exists(fake_id='fake1')
+    assert await fake_service.exists(fake_id='fake2')
+    assert not await fake_service.exists(fake_id='fake3')
+
+
+@pytest.mark.asyncio
+async def test_should_delete(fake_service):
+    await fake_service.delete(fake_id='fake2')
+
+    assert not await fake_service.repository.memory_data_source.exists(
+        'fake:fake2'
+    )
+    assert 'fake:fake2' not in fake_service.repository.fallback_data_source.db
+    assert not await fake_service.exists(fake_id='fake2')
+
+
+class TestCached:
+    @pytest.fixture
+    def cache_config(self):
+        return {
+            'cache_type': CacheType.TTL,
+            'cache_ttl': 60,
+            'cache_max_size': 10,
+        }
+
+    @pytest.mark.asyncio
+    async def test_should_get_many_cached_by_query_shape(
+        self, fake_service, fake_entity_cls
+    ):
+        [
+            entity
+            async for entity in fake_service.get_many(
+                'fake1', 'fake3', page_size=1
+            )
+        ]
+        await fake_service.repository.memory_data_source.delete('fake:fake1')
+
+        cached_entities = [
+            entity
+            async for entity in fake_service.get_many(
+                'fake1', 'fake3', page_size=1
+            )
+        ]
+        other_page_entities = [
+            entity
+            async for entity in fake_service.get_many(
+                'fake1', 'fake3', page_size=1, page=2
+            )
+        ]
+
+        assert cached_entities == [
+            fake_entity_cls(fake_id='fake1', data=[b'1'])
+        ]
+        assert other_page_entities == []
@@ -0,0 +1,179 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from dbdaora import SortedSetData
+from dbdaora.exceptions import InvalidQueryError
+
+
+@dataclass
+class FakeEntity:
+    fake_id: str
+    data: SortedSetData
+    max_size: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+@pytest.fixture
+def fake_entity_cls():
+    return FakeEntity
+
+
+@pytest.fixture
+def fake_entity_withscores(fake_entity_cls):
+    return fake_entity_cls(
+        fake_id='fake',
+        data=[(b'a', 1), (b'b', 2), (b'c', 2), (b'd', 2), (b'e', 3)],
+    )
+
+
+@pytest.fixture(autouse=True)
+async def set_data(fake_service, fake_entity_withscores):
+    await fake_service.repository.memory_data_source.delete('fake:fake')
+    await fake_service.repository.memory_data_source.delete(
+        'fake:not-found:fake'
+    )
+    await fake_service.repository.add_fallback(fake_entity_withscores)
+
+
+async def get_pages(fake_service, **filters):
+    pages = []
+    cursor = None
+
+    while True:
+        entity = await fake_service.get_one(
+            fake_id='fake',
+            page_size=2,
+            withcursor=True,
+            cursor=cursor,
+            **filters,
+        )
+        pages.append(entity.data)
+        cursor = entity.next_cursor
+
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('memory', [True, False])
+async def test_should_get_pages_by_cursor(fake_service, memory):
+    assert await get_pages(fake_service, memory=memory) == [
+        [b'a', b'b'],
+        [b'c', b'd'],
+        [b'e'],
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('memory', [True, False])
+async def test_should_get_reverse_pages_by_cursor(fake_service, memory):
+    pages = await get_pages(
+        fake_service, memory=memory, reverse=True, withscores=True
+    )
+
+    assert pages == [
+        [(b'e', 3), (b'd', 2)],
+        [(b'c', 2), (b'b', 2)],
+        [(b'a', 1)],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_get_pages_by_cursor_in_score_range(fake_service):
+    assert await get_pages(fake_service, min_score=2, max_score=2) == [
+        [b'b', b'c'],
+        [b'd'],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_get_next_page_from_fallback_with_ties(
+    fake_service, fake_entity_cls
+):
+    await fake_service.repository.add_fallback(
+        fake_entity_cls(fake_id='fake', data=[(b'b', 1), (b'a', 1), (b'c', 1)])
+    )
+
+    pages = []
+    cursor = None
+
+    for memory in (True, False, False):
+        entity = await fake_service.get_one(
+            fake_id='fake',
+            page_size=1,
+            withcursor=True,
+            cursor=cursor,
+            memory=memory,
+        )
+        pages.append(entity.data)
+        cursor = entity.next_cursor
+
+    assert pages == [[b'a'], [b'b'], [b'c']]
+
+
+@pytest.mark.asyncio
+async def test_should_not_skip_members_added_before_cursor(fake_service):
+    entity = await fake_service.get_one(
+        fake_id='fake', page_size=2, withcursor=True
+    )
+    await fake_service.add_member('0', 0, fake_id='fake')
+
+    entity = await fake_service.get_one(
+        fake_id='fake', page_size=2, cursor=entity.next_cursor
+    )
+
+    assert entity.data == [b'c', b'd']
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('memory', [True, False])
+async def test_should_get_many_first_pages_with_cursor(fake_service, memory):
+    entities = [
+        entity
+        async for entity in fake_service.get_many(
+            'fake', page_size=2, withcursor=True, memory=memory
+        )
+    ]
+
+    assert [entity.data for entity in entities] == [[b'a', b'b']]
+
+    entity = await fake_service.get_one(
+        fake_id='fake', page_size=2, cursor=entities[0].next_cursor
+    )
+
+    assert entity.data == [b'c', b'd']
+
+
+@pytest.mark.asyncio
+async def test_should_raise_invalid_query_error_for_get_many_cursor(
+    fake_service,
+):
+    cursor = (
+        await fake_service.get_one(
+            fake_id='fake', page_size=2, withcursor=True
+        )
+    ).next_cursor
+
+    with pytest.raises(InvalidQueryError):
+        async for _ in fake_service.get_many(
+            'fake', page_size=2, cursor=cursor
+        ):
+            ...
+
+
+@pytest.mark.asyncio
+async def test_should_raise_invalid_query_error_for_invalid_cursor(
+    fake_service,
+):
+    with pytest.raises(InvalidQueryError):
+        await fake_service.get_one(fake_id='fake', page_size=2, cursor='fake')
+
+
+@pytest.mark.asyncio
+async def test_should_raise_invalid_query_error_without_page_size(
+    fake_service,
+):
+    with pytest.raises(InvalidQueryError):
+        await fake_service.get_one(fake_id='fake', withcursor=True)
@@ -267,3 +267,44 @@ async def test_should_get_one_reverse_min_score_max_score_withmaxsize_and_withsc
             withmaxsize=True,
             withscores=True,
         )
+
+
+@pytest.mark.asyncio
+async def test_should_get_one_min_score_and_page_size(
+    fake_service, fake_entity, fake_entity_withscores
+):
+    entity = await fake_service.get_one(
+        fake_id=fake_entity_withscores.fake_id, min_score=0, page_size=1,
+    )
+
+    fake_entity.data = [b'1']
+    assert entity == fake_entity
+
+
+@pytest.mark.asyncio
+async def test_should_get_one_max_score_page_and_reverse(
+    fake_service, fake_entity, fake_entity_withscores
+):
+    entity = await fake_service.get_one(
+        fake_id=fake_entity_withscores.fake_id,
+        max_score=1,
+        page=2,
+        page_size=1,
+        reverse=True,
+    )
+
+    fake_entity.data = [b'1']
+    assert entity == fake_entity
+
+
+@pytest.mark.asyncio
+async def test_should_get_one_min_score_and_page_not_found(
+    fake_service, fake_entity_withscores
+):
+    with pytest.raises(EntityNotFoundError):
+        await fake_service.get_one(
+            fake_id=fake_entity_withscores.fake_id,
+            min_score=0,
+            page=3,
+            page_size=1,
+        )
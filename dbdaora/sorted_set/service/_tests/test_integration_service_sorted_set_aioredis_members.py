@@ -0,0 +1,117 @@
+import asynctest
+import pytest
+from aioredis import RedisError
+
+from dbdaora import ShardsAioRedisDataSource
+
+
+@pytest.fixture
+def has_add_cb():
+    return True
+
+
+@pytest.fixture(autouse=True)
+async def clean_memory(fake_service):
+    await fake_service.repository.memory_data_source.delete('fake:fake')
+    await fake_service.repository.memory_data_source.delete(
+        'fake:not-found:fake'
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_update_members_in_memory_and_fallback(
+    fake_service, fake_entity_withscores
+):
+    await fake_service.add(fake_entity_withscores)
+    await fake_service.get_one(fake_id='fake')
+
+    await fake_service.add_member('3', 5, fake_id='fake')
+    score = await fake_service.increment_member('1', 10, fake_id='fake')
+    await fake_service.remove_member('2', fake_id='fake')
+
+    memory_entity = await fake_service.get_one(fake_id='fake', withscores=True)
+    fallback_entity = await fake_service.get_one(
+        fake_id='fake', withscores=True, memory=False
+    )
+
+    assert score == 10
+    assert memory_entity.data == [(b'3', 5), (b'1', 10)]
+    assert fallback_entity.data == [(b'3', 5), (b'1', 10)]
+
+
+@pytest.mark.asyncio
+async def test_should_not_create_partial_set_in_memory(
+    fake_service, fake_entity_withscores
+):
+    await fake_service.add(fake_entity_withscores)
+
+    score = await fake_service.increment_member('2', 1.5, fake_id='fake')
+
+    assert score == 2.5
+    assert not await fake_service.repository.memory_data_source.exists(
+        'fake:fake'
+    )
+
+    entity = await fake_service.get_one(fake_id='fake', withscores=True)
+
+    assert entity.data == [(b'1', 0), (b'2', 2.5)]
+
+
+@pytest.mark.asyncio
+async def test_should_update_members_only_on_existing_keys(fake_service):
+    memory_data_source = fake_service.repository.memory_data_source
+
+    assert not await memory_data_source.zadd_if_exists('fake:fake', 1, '1')
+    assert (
+        await memory_data_source.zincrby_if_exists('fake:fake', 1, '1') is None
+    )
+    assert not await memory_data_source.exists('fake:fake')
+
+    await memory_data_source.zadd('fake:fake', 1, '1')
+    await memory_data_source.expire('fake:fake', 60)
+
+    assert await memory_data_source.zadd_if_exists('fake:fake', 2, '2')
+    assert (
+        await memory_data_source.zincrby_if_exists('fake:fake', 1.5, '1')
+        == 2.5
+    )
+    assert await memory_data_source.zrange('fake:fake', withscores=True) == [
+        (b'2', 2),
+        (b'1', 2.5),
+    ]
+
+    if isinstance(memory_data_source, ShardsAioRedisDataSource):
+        memory_data_source = memory_data_source.get_client('fake:fake')
+
+    assert 0 < await memory_data_source.ttl('fake:fake') <= 60
+
+
+@pytest.mark.asyncio
+async def test_should_add_member_to_new_set(fake_service):
+    await fake_service.add_member('1', 1, fake_id='fake')
+
+    entity = await fake_service.get_one(fake_id='fake')
+
+    assert entity.data == [b'1']
+
+
+@pytest.mark.asyncio
+async def test_should_update_fallback_after_open_circuit_breaker(
+    fake_service, fake_entity_withscores
+):
+    await fake_service.add(fake_entity_withscores)
+    memory_data_source = fake_service.repository.memory_data_source
+    memory_data_source.zincrby_if_exists = asynctest.CoroutineMock(
+        side_effect=RedisError
+    )
+
+    score = await fake_service.increment_member('1', 3, fake_id='fake')
+
+    assert score == 3
+    assert fake_service.logger.warning.call_count == 1
+
+    entity = await fake_service.get_one(
+        fake_id='fake', withscores=True, memory=False
+    )
+
+    assert entity.data == [(b'2', 1), (b'1', 3)]
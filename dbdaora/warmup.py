@@ -0,0 +1,256 @@
+"""Preloads the memory data source of a repository from its fallback.
+
+Usage: python -m dbdaora.warmup module:repository_factory [--ids FILE]
+"""
+import argparse
+import asyncio
+import dataclasses
+import importlib
+import inspect
+import itertools
+import sys
+import time
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+)
+
+from dbdaora.exceptions import WarmupNotSupportedError
+from dbdaora.hash.repositories import HashRepository
+from dbdaora.repository import MemoryRepository
+
+
+@dataclasses.dataclass
+class WarmupProgress:
+    written: int = 0
+    not_found: int = 0
+    chunks: int = 0
+    started_at: float = dataclasses.field(default_factory=time.perf_counter)
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.perf_counter() - self.started_at
+        return self.written / elapsed if elapsed else 0.0
+
+
+async def warmup(
+    repository: MemoryRepository[Any, Any, Any],
+    ids: Optional[Iterable[Any]] = None,
+    *,
+    chunk_size: int = 500,
+    concurrency: int = 4,
+    progress: Optional[Callable[[WarmupProgress], None]] = None,
+    **query_kwargs: Any,
+) -> WarmupProgress:
+    """Writes every fallback entity, or the ``ids`` ones, to the memory.
+
+    Composed keys ids are tuples with the ``key_attrs`` values.
+    ``query_kwargs`` are sent to the ``FallbackDataSource.query``.
+
+    Without ``ids`` only hash repositories are supported, the other
+    fallback documents don't hold the key attributes.
+    """
+    warmup_progress = WarmupProgress()
+
+    if ids is None:
+        if not isinstance(repository, HashRepository):
+            raise WarmupNotSupportedError(repository)
+
+        items: Iterable[Any] = await repository.fallback_data_source.query(
+            repository.fallback_data_source.make_key(repository.name, ''),
+            **query_kwargs,
+        )
+    else:
+        items = ids
+
+    pending: Set['asyncio.Future[None]'] = set()
+
+    try:
+        for chunk in make_chunks(items, chunk_size):
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    task.result()
+
+            pending.add(
+                asyncio.ensure_future(
+                    warmup_chunk(
+                        repository,
+                        chunk,
+                        ids is not None,
+                        warmup_progress,
+                        progress,
+                    )
+                )
+            )
+
+        if pending:
+            await asyncio.gather(*pending)
+
+    except BaseException:
+        for task in pending:
+            task.cancel()
+
+        raise
+
+    return warmup_progress
+
+
+async def warmup_chunk(
+    repository: MemoryRepository[Any, Any, Any],
+    chunk: Sequence[Any],
+    from_ids: bool,
+    warmup_progress: WarmupProgress,
+    progress: Optional[Callable[[WarmupProgress], None]],
+) -> None:
+    if from_ids:
+        queries = [
+            repository.query(
+                key_parts=list(id) if isinstance(id, tuple) else [id]
+            )
+            for id in chunk
+        ]
+        chunk = await asyncio.gather(
+            *(
+                repository.get_fallback_data(query, for_memory=True)
+                for query in queries
+            )
+        )
+
+    else:
+        # mongodb documents ids are not entity fields
+        chunk = [
+            {k: v for k, v in data.items() if k != '_id'} for data in chunk
+        ]
+        queries = [
+            repository.query(key_parts=repository.key_parts(data))
+            for data in chunk
+        ]
+
+    async def add(query: Any, data: Any) -> None:
+        key = repository.memory_key(query)
+        await repository.add_memory_data_from_fallback(key, query, data)
+        await repository.set_expire_time(key)
+
+    found = [(q, data) for q, data in zip(queries, chunk) if data is not None]
+    await asyncio.gather(*(add(query, data) for query, data in found))
+
+    warmup_progress.written += len(found)
+    warmup_progress.not_found += len(chunk) - len(found)
+    warmup_progress.chunks += 1
+
+    if progress is not None:
+        progress(warmup_progress)
+
+
+def make_chunks(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def read_ids(lines: Iterable[str]) -> Iterator[Any]:
+    for line in lines:
+        line = line.rstrip('\n')
+
+        if line:
+            id = tuple(line.split('\t'))
+            yield id if len(id) > 1 else id[0]
+
+
+def print_progress(warmup_progress: WarmupProgress) -> None:
+    print(
+        f'{warmup_progress.written} written, '
+        f'{warmup_progress.not_found} not found, '
+        f'{warmup_progress.rate:.0f} entities/s',
+        file=sys.stderr,
+    )
+
+
+async def run(
+    factory: Callable[[], Any],
+    ids: Optional[Iterable[Any]],
+    chunk_size: int,
+    concurrency: int,
+) -> WarmupProgress:
+    repository = await make_repository(factory)
+
+    try:
+        return await warmup(
+            repository,
+            ids,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            progress=print_progress,
+        )
+
+    finally:
+        repository.memory_data_source.close()
+        await repository.memory_data_source.wait_closed()
+
+
+def import_factory(path: str) -> Callable[[], Any]:
+    module_name, factory_name = path.split(':', 1)
+    return getattr(  # type: ignore
+        importlib.import_module(module_name), factory_name
+    )
+
+
+async def make_repository(
+    factory: Callable[[], Any]
+) -> MemoryRepository[Any, Any, Any]:
+    repository = factory()
+
+    if inspect.isawaitable(repository):
+        repository = await repository
+
+    return repository  # type: ignore
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m dbdaora.warmup',
+        description='Preloads the memory data source of a repository.',
+    )
+    parser.add_argument(
+        'factory',
+        help='module:callable returning the repository, it can be async',
+    )
+    parser.add_argument(
+        '--ids',
+        type=argparse.FileType(),
+        help='file with one id per line, composed keys are tab separated',
+    )
+    parser.add_argument('--chunk-size', type=int, default=500)
+    parser.add_argument('--concurrency', type=int, default=4)
+    args = parser.parse_args(argv)
+
+    ids = None if args.ids is None else read_ids(args.ids)
+
+    asyncio.run(
+        run(
+            import_factory(args.factory),
+            ids,
+            args.chunk_size,
+            args.concurrency,
+        )
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,451 @@
+import asyncio
+import dataclasses
+import itertools
+import os
+import pickle
+import struct
+import zlib
+from logging import Logger, getLogger
+from typing import (
+    Any,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from dbdaora.data_sources.fallback import FallbackDataSource
+from dbdaora.exceptions import InvalidJournalError
+
+
+Write = Tuple[Callable[..., Awaitable[Any]], Tuple[Any, ...], Dict[str, Any]]
+JournalRecord = Tuple[str, Any, Optional[Dict[str, Any]], Dict[str, Any]]
+
+JOURNAL_MAGIC = b'DBDAORA-JOURNAL\x01'
+JOURNAL_SUFFIX = '.journal'
+RECORD_HEADER = struct.Struct('>II')
+
+
+@dataclasses.dataclass
+class WriteBehindJournal:
+    """Appends the write behind puts to segment files before queueing them.
+
+    The appends waiting ``fsync_delay`` seconds share one fsync. A segment
+    is removed when it and the older ones have no unwritten puts, the
+    segments left by a crash are sent by ``replay`` on startup.
+
+    A journal belongs to one fallback data source, the write behind data
+    source replays it before its first operation.
+    """
+
+    directory: str
+    segment_size: int = 16 * 1024 * 1024
+    fsync_delay: float = 0
+    logger: Logger = getLogger(__name__)
+    file: Optional[BinaryIO] = dataclasses.field(
+        default=None, init=False, repr=False
+    )
+    segment: int = dataclasses.field(default=0, init=False)
+    segments: Dict[int, int] = dataclasses.field(
+        default_factory=dict, init=False, repr=False
+    )
+    pending: Dict[str, Tuple[int, int]] = dataclasses.field(
+        default_factory=dict, init=False, repr=False
+    )
+    recovered: List[int] = dataclasses.field(
+        default_factory=list, init=False, repr=False
+    )
+    unsynced: List[BinaryIO] = dataclasses.field(
+        default_factory=list, init=False, repr=False
+    )
+    created: bool = dataclasses.field(default=False, init=False, repr=False)
+    commit_future: Optional['asyncio.Future[None]'] = dataclasses.field(
+        default=None, init=False, repr=False
+    )
+    lock: asyncio.Lock = dataclasses.field(init=False, repr=False)
+    replay_lock: asyncio.Lock = dataclasses.field(init=False, repr=False)
+    data_source: Optional[FallbackDataSource[Any]] = dataclasses.field(
+        default=None, init=False, repr=False
+    )
+    sequence: int = dataclasses.field(default=0, init=False, repr=False)
+    opened: bool = dataclasses.field(default=False, init=False, repr=False)
+
+    def open(self) -> None:
+        if self.opened:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        self.recovered = sorted(
+            int(name[: -len(JOURNAL_SUFFIX)])
+            for name in os.listdir(self.directory)
+            if name.endswith(JOURNAL_SUFFIX)
+        )
+        self.segment = self.recovered[-1] if self.recovered else 0
+        self.lock = asyncio.Lock()
+        self.replay_lock = asyncio.Lock()
+        self.opened = True
+
+    def path(self, segment: int) -> str:
+        return os.path.join(self.directory, f'{segment:016d}{JOURNAL_SUFFIX}')
+
+    async def append_put(
+        self,
+        key: str,
+        fallback_key: Any,
+        data: Dict[str, Any],
+        kwargs: Dict[str, Any],
+    ) -> int:
+        sequence = self.append((key, fallback_key, data, kwargs))
+        previous = self.pending.get(key)
+        self.pending[key] = (sequence, self.segment)
+        self.segments[self.segment] += 1
+
+        if previous is not None:
+            self.release(previous[1])
+
+        await self.commit()
+        return sequence
+
+    async def append_delete(self, key: str) -> None:
+        self.append((key, None, None, {}))
+        previous = self.pending.pop(key, None)
+
+        if previous is not None:
+            self.release(previous[1])
+
+        await self.commit()
+
+    def done(self, key: str, sequence: int) -> None:
+        pending = self.pending.get(key)
+
+        if pending is not None and pending[0] == sequence:
+            del self.pending[key]
+            self.release(pending[1])
+
+    def append(self, record: JournalRecord) -> int:
+        self.open()
+
+        if self.file is None or self.file.tell() >= self.segment_size:
+            self.rotate()
+
+        file: BinaryIO = self.file  # type: ignore
+        payload = pickle.dumps(record, protocol=4)
+        file.write(RECORD_HEADER.pack(len(payload), zlib.crc32(payload)))
+        file.write(payload)
+        self.sequence += 1
+
+        return self.sequence
+
+    def rotate(self) -> None:
+        if self.file is not None:
+            self.unsynced.append(self.file)
+
+        self.segment += 1
+        self.segments[self.segment] = 0
+        self.file = open(self.path(self.segment), 'wb')
+        self.file.write(JOURNAL_MAGIC)
+        self.created = True
+        self.compact()
+
+    def release(self, segment: int) -> None:
+        self.segments[segment] -= 1
+        self.compact()
+
+    def compact(self) -> None:
+        # the recovered segments can have older puts of the same keys
+        if self.recovered:
+            return
+
+        for segment, pending in list(self.segments.items()):
+            if pending or (segment == self.segment and self.file is not None):
+                break
+
+            del self.segments[segment]
+            os.remove(self.path(segment))
+
+    async def commit(self) -> None:
+        if self.commit_future is None:
+            self.commit_future = asyncio.ensure_future(self.sync())
+
+        await asyncio.shield(self.commit_future)
+
+    async def sync(self) -> None:
+        await asyncio.sleep(self.fsync_delay)
+
+        async with self.lock:
+            self.commit_future = None
+            closing, self.unsynced = self.unsynced, []
+            files = closing if self.file is None else closing + [self.file]
+            directory = self.directory if self.created else None
+            self.created = False
+
+            for file in files:
+                file.flush()
+
+            await asyncio.get_running_loop().run_in_executor(
+                None, fsync, [file.fileno() for file in files], directory
+            )
+
+            for file in closing:
+                file.close()
+
+    async def replay(self, data_source: FallbackDataSource[Any]) -> int:
+        """Puts the last write of each key found in the recovered segments."""
+        self.open()
+
+        if not self.recovered:
+            return 0
+
+        async with self.replay_lock:
+            if not self.recovered:
+                return 0
+
+            writes: Dict[str, Tuple[Any, Dict[str, Any], Dict[str, Any]]] = {}
+
+            for segment in self.recovered:
+                for key, fallback_key, data, kwargs in self.read(segment):
+                    if data is None:
+                        writes.pop(key, None)
+                    else:
+                        writes[key] = (fallback_key, data, kwargs)
+
+            for fallback_key, data, kwargs in writes.values():
+                await data_source.put(fallback_key, data, **kwargs)
+
+            for segment in self.recovered:
+                os.remove(self.path(segment))
+
+            self.recovered = []
+            self.compact()
+
+            return len(writes)
+
+    def read(self, segment: int) -> Iterator[JournalRecord]:
+        path = self.path(segment)
+
+        with open(path, 'rb') as file:
+            magic = file.read(len(JOURNAL_MAGIC))
+
+            if magic != JOURNAL_MAGIC:
+                if JOURNAL_MAGIC.startswith(magic):
+                    return
+
+                raise InvalidJournalError(path)
+
+            while True:
+                header = file.read(RECORD_HEADER.size)
+
+                if not header:
+                    return
+
+                if len(header) == RECORD_HEADER.size:
+                    size, checksum = RECORD_HEADER.unpack(header)
+                    payload = file.read(size)
+
+                    if (
+                        len(payload) == size
+                        and zlib.crc32(payload) == checksum
+                    ):
+                        yield pickle.loads(payload)
+                        continue
+
+                self.logger.warning(f'discarding torn journal tail {path}')
+                return
+
+    async def close(self) -> None:
+        if self.file is not None:
+            await self.commit()
+            self.file.close()
+            self.file = None
+
+        if self.opened:
+            self.compact()
+
+
+def fsync(files: Sequence[int], directory: Optional[str]) -> None:
+    for file in files:
+        os.fsync(file)
+
+    if directory is not None:
+        directory_file = os.open(directory, os.O_RDONLY)
+
+        try:
+            os.fsync(directory_file)
+        finally:
+            os.close(directory_file)
+
+
+@dataclasses.dataclass
+class WriteBehindQueue:
+    """Coalesces the fallback writes by key and flushes them in batches.
+
+    A write of a pending key replaces it, so only the last one is sent.
+    ``put`` waits while there are ``max_size`` pending keys.
+    ``wait_written`` waits the in flight write of a key.
+    ``get`` returns the pending or in flight write of a key.
+    With a ``journal`` the fallback puts are journaled before being queued.
+    """
+
+    max_size: int = 10000
+    batch_size: int = 100
+    flush_interval: float = 0.1
+    workers_size: int = 1
+    logger: Logger = getLogger(__name__)
+    journal: Optional[WriteBehindJournal] = None
+    pending: Dict[str, Write] = dataclasses.field(
+        default_factory=dict, repr=False
+    )
+    in_flight: Dict[str, Write] = dataclasses.field(
+        default_factory=dict, repr=False
+    )
+    workers: List['asyncio.Future[None]'] = dataclasses.field(
+        default_factory=list, repr=False
+    )
+    ready: asyncio.Event = dataclasses.field(init=False, repr=False)
+    space: asyncio.Event = dataclasses.field(init=False, repr=False)
+    flushed: asyncio.Event = dataclasses.field(init=False, repr=False)
+    closed: bool = False
+    coalesced: int = 0
+    written: int = 0
+    failed: int = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self.pending)
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            'depth': self.depth,
+            'in_flight': len(self.in_flight),
+            'coalesced': self.coalesced,
+            'written': self.written,
+            'failed': self.failed,
+        }
+
+    async def put(
+        self,
+        key: str,
+        write: Callable[..., Awaitable[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        if self.closed:
+            await write(*args, **kwargs)
+            return
+
+        self.start()
+
+        if key in self.pending:
+            self.coalesced += 1
+
+        else:
+            while len(self.pending) >= self.max_size and not self.closed:
+                self.space.clear()
+                await self.space.wait()
+
+            if self.closed:
+                await write(*args, **kwargs)
+                return
+
+            if key in self.pending:
+                self.coalesced += 1
+
+        self.pending[key] = (write, args, kwargs)
+
+        if len(self.pending) >= self.batch_size:
+            self.ready.set()
+
+    def discard(self, key: str) -> None:
+        if self.pending.pop(key, None) is not None:
+            self.space.set()
+
+    def get(self, key: str) -> Optional[Write]:
+        return self.pending.get(key) or self.in_flight.get(key)
+
+    async def wait_written(self, key: str) -> None:
+        while key in self.in_flight:
+            self.flushed.clear()
+            await self.flushed.wait()
+
+    def start(self) -> None:
+        if not self.workers:
+            self.ready = asyncio.Event()
+            self.space = asyncio.Event()
+            self.flushed = asyncio.Event()
+            self.workers = [
+                asyncio.ensure_future(self.work())
+                for _ in range(self.workers_size)
+            ]
+
+    async def work(self) -> None:
+        flushed = False
+
+        while not self.closed:
+            if not flushed or len(self.pending) < self.batch_size:
+                try:
+                    await asyncio.wait_for(
+                        self.ready.wait(), self.flush_interval
+                    )
+                except asyncio.TimeoutError:
+                    ...
+
+                self.ready.clear()
+
+            flushed = await self.flush_batch()
+
+    async def flush_batch(self) -> bool:
+        keys = list(
+            itertools.islice(
+                (key for key in self.pending if key not in self.in_flight),
+                self.batch_size,
+            )
+        )
+
+        if not keys:
+            return False
+
+        writes = [self.pending.pop(key) for key in keys]
+        self.in_flight.update(zip(keys, writes))
+        self.space.set()
+
+        try:
+            results = await asyncio.gather(
+                *(write(*args, **kwargs) for write, args, kwargs in writes),
+                return_exceptions=True,
+            )
+
+        finally:
+            for key in keys:
+                self.in_flight.pop(key, None)
+            self.flushed.set()
+
+        for key, result in zip(keys, results):
+            if isinstance(result, Exception):
+                self.failed += 1
+                self.logger.error(
+                    f'write behind failed for key={key}', exc_info=result
+                )
+            else:
+                self.written += 1
+
+        return True
+
+    async def close(self) -> None:
+        """Stops the workers after writing all the pending keys."""
+        self.closed = True
+
+        if self.workers:
+            self.ready.set()
+            self.space.set()
+            await asyncio.gather(*self.workers)
+
+            while self.pending:
+                await self.flush_batch()
+
+        if self.journal is not None:
+            await self.journal.close()
@@ -16,7 +16,29 @@ rangeWithScoresOutput = Sequence[Tuple[bytes, float]]
 SortedSetData = Union[rangeOutput, rangeWithScoresOutput]
 
 
+class RedisConnection:
+    _pipeline_buffer: Optional[bytearray]
+    _writer: Any
+
+    @property
+    def closed(self) -> bool: ...
+
+    def execute(self, command: Any, *args: Any, **kwargs: Any) -> Any: ...
+
+
 class ConnectionsPool:
+    def get(self) -> Any: ...
+
+    def get_connection(
+        self, command: Any, args: Tuple[Any, ...] = ...
+    ) -> Tuple[Optional[RedisConnection], Any]: ...
+
+    def _check_result(
+        self, fut: Any, *data: Any
+    ) -> Any: ...
+
+
+class ReplyError(Exception):
     ...
 
 
@@ -24,11 +46,13 @@ class Redis:
     key_separator: ClassVar[str] = ':'
     _pool_or_conn: ConnectionsPool
 
+    def __init__(self, pool_or_conn: ConnectionsPool) -> None: ...
+
     def make_key(self, *key_parts: str) -> str: ...
 
     async def get(self, key: str) -> Optional[bytes]: ...
 
-    async def set(self, key: str, data: str) -> None: ...
+    async def set(self, key: str, data: Union[str, bytes]) -> None: ...
 
     async def delete(self, key: str) -> None: ...
 
@@ -36,6 +60,13 @@ class Redis:
 
     async def exists(self, key: str) -> int: ...
 
+    async def scan(
+        self,
+        cursor: Union[int, bytes] = 0,
+        match: Optional[str] = None,
+        count: Optional[int] = None,
+    ) -> Tuple[int, Sequence[bytes]]: ...
+
     async def zrevrange(
         self, key: str, start: int, stop: int, withscores: bool = False
     ) -> Optional[SortedSetData]: ...
@@ -66,14 +97,26 @@ class Redis:
 
     async def hgetall(self, key: str) -> Dict[bytes, bytes]: ...
 
+    async def mget(
+        self, key: str, *keys: str
+    ) -> Sequence[Optional[bytes]]: ...
+
     def pipeline(self) -> Any: ...
 
+    def execute(self, command: Any, *args: Any, **kwargs: Any) -> Any: ...
+
+    def close(self) -> None: ...
+
+    async def wait_closed(self) -> None: ...
+
     async def zrevrangebyscore(
         self,
         key: str,
         max: float = float('inf'),
         min: float = float('-inf'),
         withscores: bool = False,
+        offset: Optional[int] = None,
+        count: Optional[int] = None,
     ) -> Optional[SortedSetData]:
         ...
 
@@ -83,15 +126,44 @@ class Redis:
         min: float = float('-inf'),
         max: float = float('inf'),
         withscores: bool = False,
+        offset: Optional[int] = None,
+        count: Optional[int] = None,
     ) -> Optional[SortedSetData]:
         ...
 
     async def zcard(self, key: str) -> int:
         ...
 
+    async def zincrby(
+        self, key: str, increment: float, member: Union[str, bytes]
+    ) -> float:
+        ...
+
+    async def zrem(
+        self,
+        key: str,
+        member: Union[str, bytes],
+        *members: Union[str, bytes],
+    ) -> int:
+        ...
+
+    async def eval(
+        self,
+        script: str,
+        keys: Sequence[Any] = ...,
+        args: Sequence[Any] = ...,
+    ) -> Any:
+        ...
+
+
+async def create_redis(address: str, **kwargs: Any) -> Redis: ...
+
 
 async def create_redis_pool(
-    address: str, *, commands_factory: Optional[Type[Redis]] = None
+    address: str,
+    *,
+    commands_factory: Optional[Type[Redis]] = None,
+    **kwargs: Any,
 ) -> Redis: ...
 
 
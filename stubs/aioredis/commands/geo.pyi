@@ -0,0 +1,6 @@
+from typing import Any
+
+
+def make_geomember(
+    value: Any, with_dist: bool, with_coord: bool, with_hash: bool
+) -> Any: ...
@@ -0,0 +1,13 @@
+from aioredis import ReplyError as ReplyError
+
+
+class RedisError(Exception):
+    ...
+
+
+class PipelineError(RedisError):
+    ...
+
+
+class ConnectionClosedError(RedisError):
+    ...
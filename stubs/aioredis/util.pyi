@@ -0,0 +1,4 @@
+from typing import Any
+
+
+def wait_convert(fut: Any, type_: Any, **kwargs: Any) -> Any: ...
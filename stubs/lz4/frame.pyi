@@ -0,0 +1,2 @@
+def compress(data: bytes, compression_level: int = ...) -> bytes: ...
+def decompress(data: bytes) -> bytes: ...
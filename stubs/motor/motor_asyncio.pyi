@@ -1,4 +1,13 @@
-from typing import Any, AsyncGenerator, Dict, Optional
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 
 class AsyncIOMotorCollection:
@@ -33,9 +42,40 @@ class AsyncIOMotorCollection:
     ) -> AsyncGenerator[Dict[str, Any], None]: ...
 
     async def create_index(
-        self, name: str, expireAfterSeconds: Optional[int],
+        self,
+        name: Union[str, List[Tuple[str, int]]],
+        expireAfterSeconds: Optional[int] = None,
+        **kwargs: Any,
     ) -> None: ...
 
+    async def insert_many(
+        self,
+        documents: Sequence[Dict[str, Any]],
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Any: ...
+
+    async def bulk_write(
+        self, requests: Sequence[Any], ordered: bool = True, **kwargs: Any,
+    ) -> Any: ...
+
+    async def find_one_and_update(
+        self,
+        filter: Dict[str, Any],
+        update: Dict[str, Any],
+        upsert: bool = False,
+        return_document: bool = False,
+        **kwargs: Any,
+    ) -> Optional[Dict[str, Any]]: ...
+
+    async def delete_many(
+        self, filter: Dict[str, Any], **kwargs: Any
+    ) -> Any: ...
+
+    async def count_documents(
+        self, filter: Dict[str, Any], **kwargs: Any
+    ) -> int: ...
+
     async def drop_index(self, name: str) -> None: ...
 
     def list_indexes(self) -> AsyncGenerator[Dict[str, Any], None]: ...
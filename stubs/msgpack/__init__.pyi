@@ -0,0 +1,5 @@
+from typing import Any
+
+
+def packb(o: Any, **kwargs: Any) -> bytes: ...
+def unpackb(packed: bytes, **kwargs: Any) -> Any: ...
@@ -0,0 +1,30 @@
+from typing import Any
+
+
+ndarray = Any
+
+
+def frombuffer(buffer: Any, dtype: Any = ...) -> ndarray: ...
+
+def flatnonzero(a: Any) -> ndarray: ...
+
+def sin(x: Any) -> ndarray: ...
+
+def sqrt(x: Any) -> ndarray: ...
+
+def arcsin(x: Any) -> ndarray: ...
+
+def cos(x: Any) -> ndarray: ...
+
+def abs(x: Any) -> ndarray: ...
+
+def array(object: Any, dtype: Any = ...) -> ndarray: ...
+
+def all(a: Any) -> bool: ...
+
+def minimum(x1: Any, x2: Any) -> ndarray: ...
+
+def maximum(x1: Any, x2: Any) -> ndarray: ...
+
+
+int64: Any
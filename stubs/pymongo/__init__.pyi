@@ -0,0 +1,19 @@
+from typing import Any, Dict
+
+
+ASCENDING: int
+DESCENDING: int
+
+
+class UpdateOne:
+    def __init__(
+        self,
+        filter: Dict[str, Any],
+        update: Dict[str, Any],
+        upsert: bool = False,
+    ) -> None: ...
+
+
+class ReturnDocument:
+    BEFORE: bool
+    AFTER: bool
@@ -0,0 +1,10 @@
+class _AsyncHiredisParser:
+    ...
+
+
+class _AsyncRESP2Parser:
+    ...
+
+
+class _AsyncRESP3Parser:
+    ...
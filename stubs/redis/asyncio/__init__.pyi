@@ -0,0 +1,35 @@
+from typing import Any, Optional
+
+from redis.asyncio.client import Pipeline
+
+
+class BlockingConnectionPool:
+    @classmethod
+    def from_url(
+        cls,
+        url: str,
+        *,
+        max_connections: int = 50,
+        timeout: Optional[float] = 20,
+        **kwargs: Any,
+    ) -> 'BlockingConnectionPool': ...
+
+    async def get_connection(self) -> Any: ...
+
+    async def release(self, connection: Any) -> None: ...
+
+    async def disconnect(self) -> None: ...
+
+
+class Redis:
+    connection_pool: BlockingConnectionPool
+
+    def __init__(
+        self, *, connection_pool: Optional[BlockingConnectionPool] = None
+    ): ...
+
+    def pipeline(self, transaction: bool = True) -> Pipeline: ...
+
+    async def aclose(self) -> None: ...
+
+    def __getattr__(self, name: str) -> Any: ...
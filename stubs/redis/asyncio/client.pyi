@@ -0,0 +1,7 @@
+from typing import Any, List
+
+
+class Pipeline:
+    async def execute(self, raise_on_error: bool = True) -> List[Any]: ...
+
+    def __getattr__(self, name: str) -> Any: ...
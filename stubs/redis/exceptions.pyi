@@ -0,0 +1,14 @@
+class RedisError(Exception):
+    ...
+
+
+class ResponseError(RedisError):
+    ...
+
+
+class ConnectionError(RedisError):
+    ...
+
+
+class TimeoutError(RedisError):
+    ...
@@ -0,0 +1 @@
+HIREDIS_AVAILABLE: bool
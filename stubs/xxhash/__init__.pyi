@@ -0,0 +1 @@
+def xxh64_intdigest(input: bytes, seed: int = ...) -> int: ...
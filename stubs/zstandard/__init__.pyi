@@ -0,0 +1,6 @@
+class ZstdCompressor:
+    def __init__(self, level: int = ...) -> None: ...
+    def compress(self, data: bytes) -> bytes: ...
+
+class ZstdDecompressor:
+    def decompress(self, data: bytes) -> bytes: ...